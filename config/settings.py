@@ -1,13 +1,55 @@
 
 # config/settings.py
 import os
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
-import yaml
-from dotenv import load_dotenv
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, field_validator
 
+# Parsed YAML configs keyed by path, invalidated when the file's mtime changes
+_CONFIG_CACHE: Dict[Path, Tuple[int, Mapping[str, Any]]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+
+_env_loaded = False
+
+
+def load_env() -> None:
+    """Load variables from the .env file into os.environ once per process"""
+    global _env_loaded
+    if _env_loaded:
+        return
+    from dotenv import load_dotenv
+    load_dotenv()
+    _env_loaded = True
+
+
+def _yaml_load(data: bytes) -> Any:
+    """Parse YAML, preferring the libyaml-backed loader when PyYAML was built against it"""
+    import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(data, Loader=loader)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively make parsed YAML read-only: mappings become proxies, lists become tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def clear_config_cache() -> None:
+    """Drop all memoized YAML configs"""
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+
 
 class Settings(BaseSettings):
     """Application settings"""
@@ -38,6 +80,7 @@ class Settings(BaseSettings):
     # Paths
     project_root: Path = Path(__file__).parent.parent
     config_dir: Path = project_root / "config"
+    extract_cache_dir: Path = Path.home() / ".etl_cache"
     
     # Pydantic v2 configuration
     model_config = SettingsConfigDict(
@@ -50,10 +93,10 @@ class Settings(BaseSettings):
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v):
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in valid_levels:
-            raise ValueError(f"Log level must be one of {valid_levels}")
-        return v.upper()
+        v_up = v.upper()
+        if v_up not in _VALID_LOG_LEVELS:
+            raise ValueError(f"Log level must be one of {sorted(_VALID_LOG_LEVELS)}")
+        return v_up
     
     @field_validator("project_root", "config_dir")
     @classmethod
@@ -61,18 +104,51 @@ class Settings(BaseSettings):
         """Ensure paths are absolute"""
         return v.resolve()
     
-    def load_config(self, config_name: str) -> Dict[str, Any]:
-        """Load configuration from YAML file"""
+    def load_config(self, config_name: str) -> Mapping[str, Any]:
+        """
+        Load configuration from YAML file, reusing the parsed result until the file changes
+        
+        The result is shared by every caller, so it is returned read-only;
+        copy it into a dict before modifying it.
+        """
         config_file = self.config_dir / f"{config_name}.yaml"
-        if not config_file.exists():
-            raise FileNotFoundError(f"Config file not found: {config_file}")
+        try:
+            mtime_ns = config_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {config_file}") from None
+        
+        with _CONFIG_CACHE_LOCK:
+            cached = _CONFIG_CACHE.get(config_file)
+            if cached is not None and cached[0] == mtime_ns:
+                return cached[1]
         
-        with open(config_file, 'r') as f:
-            return yaml.safe_load(f)
+        with open(config_file, 'rb') as f:
+            config = _freeze(_yaml_load(f.read()))
+        
+        with _CONFIG_CACHE_LOCK:
+            _CONFIG_CACHE[config_file] = (mtime_ns, config)
+        return config
+
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance, building it on first use"""
+    load_env()
+    return Settings()
+
+
+class _LazySettings:
+    """Proxy that defers Settings() validation until an attribute is first read"""
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_settings(), name)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(get_settings(), name, value)
+    
+    def __repr__(self) -> str:
+        return repr(get_settings())
 
-# Load environment variables from .env file
-load_dotenv()
 
-# Create settings instance
-settings = Settings()
\ No newline at end of file
+# Shared settings handle; importing it no longer triggers env parsing
+settings = _LazySettings()
\ No newline at end of file
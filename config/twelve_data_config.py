@@ -3,12 +3,13 @@
 
 # config/twelve_data_config.py
 import os
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import List, Mapping, Optional
 from enum import Enum
-from dotenv import load_dotenv
+from config.settings import load_env
 
-load_dotenv()
+load_env()
 
 class AssetType(Enum):
     FOREX = "forex"
@@ -17,23 +18,25 @@ class AssetType(Enum):
     ETF = "etf"
     INDEX = "index"
 
-@dataclass
+# Endpoints (read-only)
+ENDPOINTS: Mapping[str, str] = MappingProxyType({
+    "time_series": "/time_series",
+    "quote": "/quote",
+    "symbols": "/stocks",
+    "forex_pairs": "/forex_pairs",
+    "cryptocurrencies": "/cryptocurrencies",
+    "etfs": "/etfs",
+    "indices": "/indices"
+})
+
+@dataclass(frozen=True, slots=True)
 class TwelveDataConfig:
-    API_KEY: str = os.getenv("TWELVE_DATA_API_KEY", "")
+    API_KEY: str = field(default_factory=lambda: os.getenv("TWELVE_DATA_API_KEY", ""))
     BASE_URL: str = "https://api.twelvedata.com"
     RATE_LIMIT_REQUESTS: int = 8  # Free tier: 8 requests/min
     RATE_LIMIT_PERIOD: int = 60  # seconds
     
-    # Endpoints
-    ENDPOINTS = {
-        "time_series": "/time_series",
-        "quote": "/quote",
-        "symbols": "/stocks",
-        "forex_pairs": "/forex_pairs",
-        "cryptocurrencies": "/cryptocurrencies",
-        "etfs": "/etfs",
-        "indices": "/indices"
-    }
+    ENDPOINTS = ENDPOINTS
     
     # Default parameters
     DEFAULT_INTERVAL = "1day"
@@ -1,66 +1,210 @@
 
 
 
+import base64
+import io
+import json
 import os
+import threading
+import time
 import requests
-import pandas as pd
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timedelta, timezone
 from airflow import DAG
 from airflow.operators.python import PythonOperator
 from airflow.models import Variable
 import logging
-from sqlalchemy import create_engine
+try:
+    import orjson
+except ImportError:
+    orjson = None
+# pandas, numpy, sqlalchemy and the Postgres provider are imported inside the
+# task callables so the scheduler does not pay for them on every DAG parse
 
 logger = logging.getLogger(__name__)
 
+# Upper bounds on concurrent API calls per task (Alpha Vantage free tier allows 5/min)
+ALPHA_VANTAGE_MAX_WORKERS = 5
+FINNHUB_MAX_WORKERS = 8
+
+
+class TokenBucket:
+    """Thread-safe token bucket that blocks only as long as needed for the next token"""
+    
+    def __init__(self, rate_per_min):
+        self.rate = rate_per_min / 60.0  # tokens per second
+        self.capacity = max(1, int(rate_per_min))
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Take a token, sleeping until one is available"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            # Reserve the token now so concurrent callers queue behind us
+            self.tokens -= 1
+            wait_time = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+# The worker cap only bounds concurrency; every Alpha Vantage call also takes a
+# token so the task stays within the free tier's 5 requests/min
+# (DAGs are deployed without src/, so this mirrors src.utils.rate_limiter.TokenBucket)
+ALPHA_VANTAGE_BUCKET = TokenBucket(rate_per_min=5)
+
+# Shared keep-alive session; transient HTTP failures are retried in-process
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# Alpha Vantage daily bar fields and the dtypes they are parsed to
+ALPHA_VANTAGE_FIELDS = {
+    '1. open': 'open',
+    '2. high': 'high',
+    '3. low': 'low',
+    '4. close': 'close',
+    '5. volume': 'volume'
+}
+ALPHA_VANTAGE_DTYPES = {
+    'open': 'float64',
+    'high': 'float64',
+    'low': 'float64',
+    'close': 'float64',
+    'volume': 'int64'
+}
+
+def _parse_json(response):
+    """Decode a response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+def _df_to_xcom(df):
+    """Serialize a DataFrame as base64-encoded zstd Parquet for XCom"""
+    buf = io.BytesIO()
+    df.to_parquet(buf, engine='pyarrow', compression='zstd', index=False)
+    return base64.b64encode(buf.getvalue()).decode('ascii')
+
+def _df_from_xcom(payload):
+    """Rebuild a DataFrame pushed with _df_to_xcom"""
+    import pandas as pd
+    return pd.read_parquet(io.BytesIO(base64.b64decode(payload)), engine='pyarrow')
+
+def _xcom_row_count(payload):
+    """Count the rows of a _df_to_xcom payload from its Parquet footer, without decoding the data"""
+    import pyarrow.parquet as pq
+    return pq.ParquetFile(io.BytesIO(base64.b64decode(payload))).metadata.num_rows
+
+# DDL for the tables save_to_database writes to
+SCHEMA_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS alpha_vantage_stocks (
+        id SERIAL PRIMARY KEY,
+        symbol VARCHAR(10),
+        date DATE,
+        open DECIMAL(12,4),
+        high DECIMAL(12,4),
+        low DECIMAL(12,4),
+        close DECIMAL(12,4),
+        volume BIGINT,
+        extracted_at TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS finnhub_stocks (
+        id SERIAL PRIMARY KEY,
+        symbol VARCHAR(10),
+        current_price DECIMAL(12,4),
+        high_price DECIMAL(12,4),
+        low_price DECIMAL(12,4),
+        open_price DECIMAL(12,4),
+        previous_close DECIMAL(12,4),
+        timestamp TIMESTAMP,
+        company_name VARCHAR(100),
+        exchange VARCHAR(10),
+        market_cap DECIMAL(20,2),
+        extracted_at TIMESTAMP
+    )
+    """,
+]
+
+# Set once the DDL has run in this worker process
+_SCHEMA_READY = False
+
+def _ensure_schema(engine):
+    """Create the target tables at most once per worker process"""
+    from sqlalchemy import text
+    global _SCHEMA_READY
+    if _SCHEMA_READY:
+        return
+    with engine.begin() as conn:
+        for statement in SCHEMA_DDL:
+            conn.execute(text(statement))
+    _SCHEMA_READY = True
+
+def _fetch_alpha_vantage_symbol(api_key, symbol):
+    """Fetch and shape the daily series for a single symbol"""
+    import pandas as pd
+    url = f"https://www.alphavantage.co/query"
+    params = {
+        'function': 'TIME_SERIES_DAILY',
+        'symbol': symbol,
+        'apikey': api_key,
+        'outputsize': 'compact'  # last 100 days
+    }
+    
+    ALPHA_VANTAGE_BUCKET.acquire()
+    response = SESSION.get(url, params=params, timeout=30)
+    data = _parse_json(response)
+    
+    if not data.get('Time Series (Daily)'):
+        logger.warning(f"No data for {symbol}: {data.get('Note', 'Unknown error')}")
+        return None
+    
+    # Let pandas build the frame straight from the {date: bar} mapping
+    df = (
+        pd.DataFrame.from_dict(data['Time Series (Daily)'], orient='index')
+        .rename(columns=ALPHA_VANTAGE_FIELDS)
+        .astype(ALPHA_VANTAGE_DTYPES)
+    )
+    df.index = pd.to_datetime(df.index, format='%Y-%m-%d', cache=True)
+    df = df.rename_axis('date').reset_index()
+    df['symbol'] = symbol
+    
+    logger.info(f"Fetched {len(df)} days of data for {symbol}")
+    return df
+
 def get_alpha_vantage_data(**context):
-    \"\"\"Fetch data from Alpha Vantage API\"\"\"
+    """Fetch data from Alpha Vantage API"""
+    import pandas as pd
     try:
         # Get API key from Airflow Variables (set this in Airflow UI)
         api_key = Variable.get("ALPHA_VANTAGE_API_KEY")
         
         symbols = ['IBM', 'AAPL', 'MSFT', 'GOOGL', 'AMZN']
-        function = 'TIME_SERIES_DAILY'
-        outputsize = 'compact'  # last 100 days
+        extracted_at = datetime.now(timezone.utc)
         
-        all_data = []
-        
-        for symbol in symbols:
-            url = f"https://www.alphavantage.co/query"
-            params = {
-                'function': function,
-                'symbol': symbol,
-                'apikey': api_key,
-                'outputsize': outputsize
-            }
-            
-            response = requests.get(url, params=params)
-            data = response.json()
-            
-            if 'Time Series (Daily)' in data:
-                time_series = data['Time Series (Daily)']
-                df = pd.DataFrame.from_dict(time_series, orient='index')
-                df.columns = ['open', 'high', 'low', 'close', 'volume']
-                df.index = pd.to_datetime(df.index)
-                df['symbol'] = symbol
-                df['extracted_at'] = datetime.now()
-                
-                # Reset index to have date as column
-                df = df.reset_index().rename(columns={'index': 'date'})
-                all_data.append(df)
-                
-                logger.info(f"Fetched {len(df)} days of data for {symbol}")
-            else:
-                logger.warning(f"No data for {symbol}: {data.get('Note', 'Unknown error')}")
+        # Requests are IO-bound; overlap them, capped to the free-tier burst size
+        with ThreadPoolExecutor(
+            max_workers=min(ALPHA_VANTAGE_MAX_WORKERS, len(symbols))
+        ) as pool:
+            results = pool.map(lambda symbol: _fetch_alpha_vantage_symbol(api_key, symbol), symbols)
+            all_data = [df for df in results if df is not None]
         
         if all_data:
             combined_df = pd.concat(all_data, ignore_index=True)
-            # Convert columns to numeric
-            numeric_cols = ['open', 'high', 'low', 'close', 'volume']
-            combined_df[numeric_cols] = combined_df[numeric_cols].apply(pd.to_numeric)
+            combined_df['extracted_at'] = pd.Timestamp(extracted_at)
             
             # Push to XCom
-            context['ti'].xcom_push(key='alpha_vantage_data', value=combined_df.to_dict('records'))
+            context['ti'].xcom_push(key='alpha_vantage_data', value=_df_to_xcom(combined_df))
             return f"Extracted {len(combined_df)} records from Alpha Vantage"
         else:
             raise Exception("No data extracted from Alpha Vantage")
@@ -69,58 +213,104 @@ def get_alpha_vantage_data(**context):
         logger.error(f"Alpha Vantage extraction failed: {str(e)}")
         raise
 
+# Column dtypes for the Finnhub frame, assembled column-wise in get_finnhub_data
+FINNHUB_DTYPES = {
+    'symbol': 'object',
+    'current_price': 'float64',
+    'high_price': 'float64',
+    'low_price': 'float64',
+    'open_price': 'float64',
+    'previous_close': 'float64',
+    'timestamp': 'int64',  # epoch seconds, converted to UTC datetimes after assembly
+    'company_name': 'object',
+    'exchange': 'object',
+    'market_cap': 'float64',
+    'extracted_at': 'datetime64[ns, UTC]',
+}
+
+FINNHUB_QUOTE_URL = "https://finnhub.io/api/v1/quote"
+FINNHUB_PROFILE_URL = "https://finnhub.io/api/v1/stock/profile2"
+
+def _fetch_finnhub_json(url, api_key, symbol):
+    """GET a Finnhub endpoint for a single symbol"""
+    params = {
+        'symbol': symbol,
+        'token': api_key
+    }
+    
+    response = SESSION.get(url, params=params, timeout=30)
+    return _parse_json(response)
+
+# Company profiles change far slower than quotes; reuse them within a worker process
+PROFILE_CACHE_TTL = timedelta(days=1)
+_PROFILE_CACHE = {}
+_PROFILE_CACHE_LOCK = threading.Lock()
+
+def _get_finnhub_profile(api_key, symbol):
+    """Return the company profile for a symbol, refetching once the cached copy expires"""
+    now = datetime.now(timezone.utc)
+    with _PROFILE_CACHE_LOCK:
+        cached = _PROFILE_CACHE.get(symbol)
+    if cached is not None and now - cached[0] < PROFILE_CACHE_TTL:
+        return cached[1]
+    
+    profile_data = _fetch_finnhub_json(FINNHUB_PROFILE_URL, api_key, symbol)
+    if profile_data:
+        with _PROFILE_CACHE_LOCK:
+            _PROFILE_CACHE[symbol] = (now, profile_data)
+    return profile_data
+
+def _build_finnhub_record(symbol, quote_data, profile_data, extracted_at):
+    """Combine quote and company profile into a single record"""
+    record = {
+        'symbol': symbol,
+        'current_price': quote_data.get('c'),
+        'high_price': quote_data.get('h'),
+        'low_price': quote_data.get('l'),
+        'open_price': quote_data.get('o'),
+        'previous_close': quote_data.get('pc'),
+        'timestamp': quote_data.get('t') or 0,
+        'company_name': profile_data.get('name', ''),
+        'exchange': profile_data.get('exchange', ''),
+        'market_cap': profile_data.get('marketCapitalization', 0),
+        'extracted_at': extracted_at
+    }
+    
+    logger.info(f"Fetched data for {symbol}: ${record.get('current_price')}")
+    return record
+
 def get_finnhub_data(**context):
-    \"\"\"Fetch data from Finnhub API\"\"\"
+    """Fetch data from Finnhub API"""
+    import pandas as pd
     try:
         # Get API key from Airflow Variables
         api_key = Variable.get("FINNHUB_API_KEY")
         
         symbols = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'TSLA']
+        extracted_at = datetime.now(timezone.utc)
         
-        all_data = []
-        
-        for symbol in symbols:
-            # Get quote
-            quote_url = f"https://finnhub.io/api/v1/quote"
-            quote_params = {
-                'symbol': symbol,
-                'token': api_key
-            }
-            
-            quote_response = requests.get(quote_url, params=quote_params)
-            quote_data = quote_response.json()
-            
-            # Get company profile
-            profile_url = f"https://finnhub.io/api/v1/stock/profile2"
-            profile_params = {
-                'symbol': symbol,
-                'token': api_key
-            }
-            
-            profile_response = requests.get(profile_url, params=profile_params)
-            profile_data = profile_response.json()
-            
-            # Create record
-            record = {
-                'symbol': symbol,
-                'current_price': quote_data.get('c'),
-                'high_price': quote_data.get('h'),
-                'low_price': quote_data.get('l'),
-                'open_price': quote_data.get('o'),
-                'previous_close': quote_data.get('pc'),
-                'timestamp': datetime.fromtimestamp(quote_data.get('t', 0)),
-                'company_name': profile_data.get('name', ''),
-                'exchange': profile_data.get('exchange', ''),
-                'market_cap': profile_data.get('marketCapitalization', 0),
-                'extracted_at': datetime.now()
-            }
-            
-            all_data.append(record)
-            logger.info(f"Fetched data for {symbol}: ${record.get('current_price')}")
+        # Quote and profile are independent, so both requests for every symbol share one pool
+        with ThreadPoolExecutor(
+            max_workers=min(FINNHUB_MAX_WORKERS, 2 * len(symbols))
+        ) as pool:
+            futures = [
+                (
+                    symbol,
+                    pool.submit(_fetch_finnhub_json, FINNHUB_QUOTE_URL, api_key, symbol),
+                    pool.submit(_get_finnhub_profile, api_key, symbol),
+                )
+                for symbol in symbols
+            ]
+            all_data = [
+                _build_finnhub_record(symbol, quote.result(), profile.result(), extracted_at)
+                for symbol, quote, profile in futures
+            ]
         
         if all_data:
-            df = pd.DataFrame(all_data)
-            context['ti'].xcom_push(key='finnhub_data', value=df.to_dict('records'))
+            columns = {name: [record[name] for record in all_data] for name in FINNHUB_DTYPES}
+            df = pd.DataFrame(columns).astype(FINNHUB_DTYPES)
+            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s', utc=True)
+            context['ti'].xcom_push(key='finnhub_data', value=_df_to_xcom(df))
             return f"Extracted {len(df)} records from Finnhub"
         else:
             raise Exception("No data extracted from Finnhub")
@@ -130,7 +320,7 @@ def get_finnhub_data(**context):
         raise
 
 def save_to_database(**context):
-    \"\"\"Save data to PostgreSQL database\"\"\"
+    """Save data to PostgreSQL database"""
     try:
         # Pull data from both sources
         ti = context['ti']
@@ -144,28 +334,12 @@ def save_to_database(**context):
         engine = postgres_hook.get_sqlalchemy_engine()
         
         # Save Alpha Vantage data
-        if alpha_data:
-            alpha_df = pd.DataFrame(alpha_data)
-            
-            # Create table if not exists
-            create_alpha_table = \"\"\"
-            CREATE TABLE IF NOT EXISTS alpha_vantage_stocks (
-                id SERIAL PRIMARY KEY,
-                symbol VARCHAR(10),
-                date DATE,
-                open DECIMAL(12,4),
-                high DECIMAL(12,4),
-                low DECIMAL(12,4),
-                close DECIMAL(12,4),
-                volume BIGINT,
-                extracted_at TIMESTAMP
-            )
-            \"\"\"
-            
-            with engine.connect() as conn:
-                conn.execute(create_alpha_table)
-                conn.commit()
-            
+        alpha_df = _df_from_xcom(alpha_data) if alpha_data else None
+        finnhub_df = _df_from_xcom(finnhub_data) if finnhub_data else None
+        
+        _ensure_schema(engine)
+        
+        if alpha_df is not None:
             # Insert data
             alpha_df.to_sql(
                 'alpha_vantage_stocks',
@@ -176,30 +350,7 @@ def save_to_database(**context):
             logger.info(f"Saved {len(alpha_df)} Alpha Vantage records to database")
         
         # Save Finnhub data
-        if finnhub_data:
-            finnhub_df = pd.DataFrame(finnhub_data)
-            
-            create_finnhub_table = \"\"\"
-            CREATE TABLE IF NOT EXISTS finnhub_stocks (
-                id SERIAL PRIMARY KEY,
-                symbol VARCHAR(10),
-                current_price DECIMAL(12,4),
-                high_price DECIMAL(12,4),
-                low_price DECIMAL(12,4),
-                open_price DECIMAL(12,4),
-                previous_close DECIMAL(12,4),
-                timestamp TIMESTAMP,
-                company_name VARCHAR(100),
-                exchange VARCHAR(10),
-                market_cap DECIMAL(20,2),
-                extracted_at TIMESTAMP
-            )
-            \"\"\"
-            
-            with engine.connect() as conn:
-                conn.execute(create_finnhub_table)
-                conn.commit()
-            
+        if finnhub_df is not None:
             finnhub_df.to_sql(
                 'finnhub_stocks',
                 engine,
@@ -208,14 +359,15 @@ def save_to_database(**context):
             )
             logger.info(f"Saved {len(finnhub_df)} Finnhub records to database")
         
-        return f"Saved {len(alpha_data or []) + len(finnhub_data or [])} total records"
+        total_records = (len(alpha_df) if alpha_df is not None else 0) + (len(finnhub_df) if finnhub_df is not None else 0)
+        return f"Saved {total_records} total records"
         
     except Exception as e:
         logger.error(f"Database save failed: {str(e)}")
         raise
 
 def generate_report(**context):
-    \"\"\"Generate a summary report\"\"\"
+    """Generate a summary report"""
     try:
         ti = context['ti']
         
@@ -224,8 +376,8 @@ def generate_report(**context):
         
         report = {
             'timestamp': datetime.now().isoformat(),
-            'alpha_vantage_records': len(alpha_data) if alpha_data else 0,
-            'finnhub_records': len(finnhub_data) if finnhub_data else 0,
+            'alpha_vantage_records': _xcom_row_count(alpha_data) if alpha_data else 0,
+            'finnhub_records': _xcom_row_count(finnhub_data) if finnhub_data else 0,
             'status': 'SUCCESS'
         }
         
@@ -264,6 +416,7 @@ with DAG(
         task_id='fetch_alpha_vantage',
         python_callable=get_alpha_vantage_data,
         provide_context=True,
+        retries=0,  # HTTP errors are already retried by SESSION's adapter
     )
     
     # Task 2: Fetch Finnhub data
@@ -271,6 +424,7 @@ with DAG(
         task_id='fetch_finnhub',
         python_callable=get_finnhub_data,
         provide_context=True,
+        retries=0,  # HTTP errors are already retried by SESSION's adapter
     )
     
     # Task 3: Save to database
@@ -1,18 +1,269 @@
-@"
 
+import base64
+import io
+import json
+import threading
+import time
 import requests
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 from airflow import DAG
 from airflow.operators.python import PythonOperator
 from airflow.models import Variable
 import logging
-from airflow.providers.postgres.hooks.postgres import PostgresHook
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ijson  # picks the yajl2_c backend when it is built
+except ImportError:
+    ijson = None
+# pandas and the Postgres provider are imported inside the
+# task callables so the scheduler does not pay for them on every DAG parse
 
 logger = logging.getLogger(__name__)
 
+# Upper bounds on concurrent API calls per task (Alpha Vantage free tier allows 5/min)
+ALPHA_VANTAGE_MAX_WORKERS = 5
+FINNHUB_MAX_WORKERS = 8
+
+
+class TokenBucket:
+    """Thread-safe token bucket that blocks only as long as needed for the next token"""
+    
+    def __init__(self, rate_per_min):
+        self.rate = rate_per_min / 60.0  # tokens per second
+        self.capacity = max(1, int(rate_per_min))
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Take a token, sleeping until one is available"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            # Reserve the token now so concurrent callers queue behind us
+            self.tokens -= 1
+            wait_time = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+# The worker cap only bounds concurrency; every Alpha Vantage call also takes a
+# token so the task stays within the free tier's 5 requests/min
+# (DAGs are deployed without src/, so this mirrors src.utils.rate_limiter.TokenBucket)
+ALPHA_VANTAGE_BUCKET = TokenBucket(rate_per_min=5)
+
+# 'compact' returns the latest 100 days; 'full' returns 20+ years and is parsed as a stream
+ALPHA_VANTAGE_OUTPUT_SIZE = 'compact'
+
+# Shared keep-alive session; transient HTTP failures are retried in-process
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+# Column order shared by the bulk COPY statements below
+ALPHA_VANTAGE_COLUMNS = [
+    'symbol', 'date', 'open', 'high', 'low', 'close', 'volume',
+    'data_source', 'extracted_at'
+]
+FINNHUB_COLUMNS = [
+    'symbol', 'current_price', 'high_price', 'low_price', 'open_price',
+    'previous_close', 'timestamp', 'data_source', 'extracted_at'
+]
+
+# Alpha Vantage daily bar fields and the dtypes they are parsed to
+ALPHA_VANTAGE_FIELDS = {
+    '1. open': 'open',
+    '2. high': 'high',
+    '3. low': 'low',
+    '4. close': 'close',
+    '5. volume': 'volume'
+}
+ALPHA_VANTAGE_DTYPES = {
+    'open': 'float64',
+    'high': 'float64',
+    'low': 'float64',
+    'close': 'float64',
+    'volume': 'int64'
+}
+
+def _parse_json(response):
+    """Decode a response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+def _df_to_xcom(df):
+    """Serialize a DataFrame as base64-encoded zstd Parquet for XCom"""
+    buf = io.BytesIO()
+    df.to_parquet(buf, engine='pyarrow', compression='zstd', index=False)
+    return base64.b64encode(buf.getvalue()).decode('ascii')
+
+def _df_from_xcom(payload):
+    """Rebuild a DataFrame pushed with _df_to_xcom"""
+    import pandas as pd
+    return pd.read_parquet(io.BytesIO(base64.b64decode(payload)), engine='pyarrow')
+
+# DDL for the tables save_to_postgres writes to
+SCHEMA_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS alpha_vantage_data (
+        id SERIAL PRIMARY KEY,
+        symbol VARCHAR(20),
+        date DATE,
+        open DECIMAL(12,4),
+        high DECIMAL(12,4),
+        low DECIMAL(12,4),
+        close DECIMAL(12,4),
+        volume BIGINT,
+        data_source VARCHAR(50),
+        extracted_at TIMESTAMP,
+        UNIQUE(symbol, date, data_source)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS finnhub_data (
+        id SERIAL PRIMARY KEY,
+        symbol VARCHAR(20),
+        current_price DECIMAL(12,4),
+        high_price DECIMAL(12,4),
+        low_price DECIMAL(12,4),
+        open_price DECIMAL(12,4),
+        previous_close DECIMAL(12,4),
+        timestamp TIMESTAMP,
+        data_source VARCHAR(50),
+        extracted_at TIMESTAMP,
+        UNIQUE(symbol, timestamp, data_source)
+    )
+    """,
+]
+
+# Set once the DDL has run in this worker process
+_SCHEMA_READY = False
+
+def _ensure_schema(conn):
+    """Create the target tables at most once per worker process"""
+    global _SCHEMA_READY
+    if _SCHEMA_READY:
+        return
+    with conn.cursor() as cursor:
+        for statement in SCHEMA_DDL:
+            cursor.execute(statement)
+    conn.commit()
+    _SCHEMA_READY = True
+
+def _copy_upsert(cursor, df, table, columns, conflict_columns):
+    """COPY a DataFrame into a temp table, then insert it into table skipping conflicts"""
+    column_list = ', '.join(columns)
+    staging = f"{table}_staging"
+    buf = io.StringIO()
+    df[columns].to_csv(buf, index=False, header=False)
+    buf.seek(0)
+    
+    cursor.execute(f"CREATE TEMP TABLE {staging} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP")
+    cursor.copy_expert(f"COPY {staging} ({column_list}) FROM STDIN WITH (FORMAT CSV)", buf)
+    cursor.execute(f"""
+        INSERT INTO {table} ({column_list})
+        SELECT {column_list} FROM {staging}
+        ON CONFLICT ({', '.join(conflict_columns)}) DO NOTHING
+    """)
+
+def _stream_alpha_vantage_daily(response, symbol, extracted_at):
+    """Parse a full daily series straight from the socket into typed columns"""
+    import numpy as np
+    import pandas as pd
+    from array import array
+    
+    dates = []
+    opens, highs, lows, closes = array('d'), array('d'), array('d'), array('d')
+    volumes = array('q')
+    
+    response.raw.decode_content = True
+    for date_str, bar in ijson.kvitems(response.raw, 'Time Series (Daily)'):
+        dates.append(date_str)
+        opens.append(float(bar['1. open']))
+        highs.append(float(bar['2. high']))
+        lows.append(float(bar['3. low']))
+        closes.append(float(bar['4. close']))
+        volumes.append(int(bar['5. volume']))
+    
+    if not dates:
+        return None
+    
+    return pd.DataFrame({
+        'symbol': symbol,
+        'date': np.array(dates, dtype='datetime64[D]'),
+        'open': np.frombuffer(opens, dtype=np.float64),
+        'high': np.frombuffer(highs, dtype=np.float64),
+        'low': np.frombuffer(lows, dtype=np.float64),
+        'close': np.frombuffer(closes, dtype=np.float64),
+        'volume': np.frombuffer(volumes, dtype=np.int64),
+        'data_source': 'alpha_vantage',
+        'extracted_at': extracted_at
+    })
+
+def _fetch_alpha_vantage_symbol(api_key, symbol, extracted_at, outputsize='compact'):
+    """Fetch daily bars for a single symbol (the last 5 days for compact output)"""
+    import pandas as pd
+    url = "https://www.alphavantage.co/query"
+    params = {
+        'function': 'TIME_SERIES_DAILY',
+        'symbol': symbol,
+        'apikey': api_key,
+        'outputsize': outputsize
+    }
+    
+    logger.info(f"Fetching {symbol} from Alpha Vantage")
+    ALPHA_VANTAGE_BUCKET.acquire()
+    
+    # Full histories are megabytes of JSON; stream them instead of building the whole dict
+    if outputsize == 'full' and ijson is not None:
+        with SESSION.get(url, params=params, timeout=30, stream=True) as response:
+            df = _stream_alpha_vantage_daily(response, symbol, extracted_at)
+        if df is None:
+            logger.warning(f"No data for {symbol}")
+            return None
+        logger.info(f"Fetched {len(df)} days for {symbol}")
+        return df
+    
+    response = SESSION.get(url, params=params, timeout=30)
+    data = _parse_json(response)
+    
+    if not data.get('Time Series (Daily)'):
+        logger.warning(f"No data for {symbol}: {data.get('Note', data.get('Information', 'No data'))}")
+        return None
+    
+    time_series = data['Time Series (Daily)']
+    if outputsize != 'full':
+        time_series = dict(islice(time_series.items(), 5))  # Get last 5 days only for testing
+    
+    # Let pandas build the frame straight from the {date: bar} mapping
+    df = (
+        pd.DataFrame.from_dict(time_series, orient='index')
+        .rename(columns=ALPHA_VANTAGE_FIELDS)
+        .astype(ALPHA_VANTAGE_DTYPES)
+    )
+    df.index = pd.to_datetime(df.index, format='%Y-%m-%d', cache=True)
+    df = df.rename_axis('date').reset_index()
+    df.insert(0, 'symbol', symbol)
+    df['data_source'] = 'alpha_vantage'
+    df['extracted_at'] = extracted_at
+    
+    logger.info(f"Fetched {len(df)} days for {symbol}")
+    return df
+
 def fetch_alpha_vantage(**context):
-    \"\"\"Fetch stock data from Alpha Vantage\"\"\"
+    """Fetch stock data from Alpha Vantage"""
+    import pandas as pd
     try:
         logger.info("Starting Alpha Vantage data fetch")
         
@@ -22,47 +273,24 @@ def fetch_alpha_vantage(**context):
         api_key = "demo"  # Replace with your actual API key
         
         symbols = ['IBM', 'AAPL']  # Start with fewer symbols for testing
+        extracted_at = datetime.now()
         
-        all_data = []
-        
-        for symbol in symbols:
-            url = "https://www.alphavantage.co/query"
-            params = {
-                'function': 'TIME_SERIES_DAILY',
-                'symbol': symbol,
-                'apikey': api_key,
-                'outputsize': 'compact'
-            }
-            
-            logger.info(f"Fetching {symbol} from Alpha Vantage")
-            response = requests.get(url, params=params, timeout=30)
-            data = response.json()
-            
-            if 'Time Series (Daily)' in data:
-                time_series = data['Time Series (Daily)']
-                
-                for date_str, values in list(time_series.items())[:5]:  # Get last 5 days only for testing
-                    record = {
-                        'symbol': symbol,
-                        'date': datetime.strptime(date_str, '%Y-%m-%d'),
-                        'open': float(values['1. open']),
-                        'high': float(values['2. high']),
-                        'low': float(values['3. low']),
-                        'close': float(values['4. close']),
-                        'volume': int(values['5. volume']),
-                        'data_source': 'alpha_vantage',
-                        'extracted_at': datetime.now()
-                    }
-                    all_data.append(record)
-                
-                logger.info(f"Fetched {len(time_series)} days for {symbol}")
-            else:
-                logger.warning(f"No data for {symbol}: {data.get('Note', data.get('Information', 'No data'))}")
+        # Requests are IO-bound; overlap them, capped to the free-tier burst size
+        with ThreadPoolExecutor(
+            max_workers=min(ALPHA_VANTAGE_MAX_WORKERS, len(symbols))
+        ) as pool:
+            results = pool.map(
+                lambda symbol: _fetch_alpha_vantage_symbol(
+                    api_key, symbol, extracted_at, ALPHA_VANTAGE_OUTPUT_SIZE
+                ),
+                symbols
+            )
+            all_data = [df for df in results if df is not None]
         
         if all_data:
-            df = pd.DataFrame(all_data)
+            df = pd.concat(all_data, ignore_index=True)
             logger.info(f"Total Alpha Vantage records: {len(df)}")
-            context['ti'].xcom_push(key='alpha_vantage_data', value=df.to_dict('records'))
+            context['ti'].xcom_push(key='alpha_vantage_data', value=_df_to_xcom(df))
             return f"Alpha Vantage: {len(df)} records"
         else:
             logger.warning("No Alpha Vantage data fetched")
@@ -72,8 +300,40 @@ def fetch_alpha_vantage(**context):
         logger.error(f"Alpha Vantage error: {str(e)}")
         raise
 
+def _fetch_finnhub_symbol(api_key, symbol, extracted_at):
+    """Fetch the latest quote for a single symbol"""
+    url = "https://finnhub.io/api/v1/quote"
+    params = {
+        'symbol': symbol,
+        'token': api_key
+    }
+    
+    logger.info(f"Fetching {symbol} from Finnhub")
+    response = SESSION.get(url, params=params, timeout=30)
+    
+    if response.status_code != 200:
+        logger.warning(f"Finnhub API error for {symbol}: {response.status_code}")
+        return None
+    
+    data = _parse_json(response)
+    
+    record = {
+        'symbol': symbol,
+        'current_price': data.get('c'),
+        'high_price': data.get('h'),
+        'low_price': data.get('l'),
+        'open_price': data.get('o'),
+        'previous_close': data.get('pc'),
+        'timestamp': datetime.fromtimestamp(data.get('t', 0)) if data.get('t') else None,
+        'data_source': 'finnhub',
+        'extracted_at': extracted_at
+    }
+    logger.info(f"Fetched {symbol}: ${record['current_price']}")
+    return record
+
 def fetch_finnhub(**context):
-    \"\"\"Fetch data from Finnhub\"\"\"
+    """Fetch data from Finnhub"""
+    import pandas as pd
     try:
         logger.info("Starting Finnhub data fetch")
         
@@ -82,42 +342,18 @@ def fetch_finnhub(**context):
         api_key = "YOUR_FINNHUB_API_KEY"  # Replace with your actual API key
         
         symbols = ['AAPL', 'MSFT']
-        all_data = []
+        extracted_at = datetime.now()
         
-        for symbol in symbols:
-            # Get quote
-            url = "https://finnhub.io/api/v1/quote"
-            params = {
-                'symbol': symbol,
-                'token': api_key
-            }
-            
-            logger.info(f"Fetching {symbol} from Finnhub")
-            response = requests.get(url, params=params, timeout=30)
-            
-            if response.status_code == 200:
-                data = response.json()
-                
-                record = {
-                    'symbol': symbol,
-                    'current_price': data.get('c'),
-                    'high_price': data.get('h'),
-                    'low_price': data.get('l'),
-                    'open_price': data.get('o'),
-                    'previous_close': data.get('pc'),
-                    'timestamp': datetime.fromtimestamp(data.get('t', 0)) if data.get('t') else None,
-                    'data_source': 'finnhub',
-                    'extracted_at': datetime.now()
-                }
-                all_data.append(record)
-                logger.info(f"Fetched {symbol}: ${record['current_price']}")
-            else:
-                logger.warning(f"Finnhub API error for {symbol}: {response.status_code}")
+        with ThreadPoolExecutor(
+            max_workers=min(FINNHUB_MAX_WORKERS, len(symbols))
+        ) as pool:
+            results = pool.map(lambda symbol: _fetch_finnhub_symbol(api_key, symbol, extracted_at), symbols)
+            all_data = [record for record in results if record is not None]
         
         if all_data:
             df = pd.DataFrame(all_data)
             logger.info(f"Total Finnhub records: {len(df)}")
-            context['ti'].xcom_push(key='finnhub_data', value=df.to_dict('records'))
+            context['ti'].xcom_push(key='finnhub_data', value=_df_to_xcom(df))
             return f"Finnhub: {len(df)} records"
         else:
             logger.warning("No Finnhub data fetched")
@@ -128,7 +364,8 @@ def fetch_finnhub(**context):
         raise
 
 def save_to_postgres(**context):
-    \"\"\"Save data to PostgreSQL\"\"\"
+    """Save data to PostgreSQL"""
+    from airflow.providers.postgres.hooks.postgres import PostgresHook
     try:
         logger.info("Saving data to PostgreSQL")
         
@@ -140,84 +377,35 @@ def save_to_postgres(**context):
         conn = postgres_hook.get_conn()
         cursor = conn.cursor()
         
-        # Create table for Alpha Vantage data
-        cursor.execute(\"\"\"
-            CREATE TABLE IF NOT EXISTS alpha_vantage_data (
-                id SERIAL PRIMARY KEY,
-                symbol VARCHAR(20),
-                date DATE,
-                open DECIMAL(12,4),
-                high DECIMAL(12,4),
-                low DECIMAL(12,4),
-                close DECIMAL(12,4),
-                volume BIGINT,
-                data_source VARCHAR(50),
-                extracted_at TIMESTAMP,
-                UNIQUE(symbol, date, data_source)
-            )
-        \"\"\")
-        
-        # Create table for Finnhub data
-        cursor.execute(\"\"\"
-            CREATE TABLE IF NOT EXISTS finnhub_data (
-                id SERIAL PRIMARY KEY,
-                symbol VARCHAR(20),
-                current_price DECIMAL(12,4),
-                high_price DECIMAL(12,4),
-                low_price DECIMAL(12,4),
-                open_price DECIMAL(12,4),
-                previous_close DECIMAL(12,4),
-                timestamp TIMESTAMP,
-                data_source VARCHAR(50),
-                extracted_at TIMESTAMP,
-                UNIQUE(symbol, timestamp, data_source)
-            )
-        \"\"\")
-        
-        conn.commit()
+        _ensure_schema(conn)
         
         # Process Alpha Vantage data
         alpha_data = ti.xcom_pull(task_ids='fetch_alpha_vantage', key='alpha_vantage_data')
-        if alpha_data:
-            df_alpha = pd.DataFrame(alpha_data)
+        df_alpha = _df_from_xcom(alpha_data) if alpha_data else None
+        if df_alpha is not None:
             logger.info(f"Saving {len(df_alpha)} Alpha Vantage records")
             
-            for _, row in df_alpha.iterrows():
-                cursor.execute(\"\"\"
-                    INSERT INTO alpha_vantage_data 
-                    (symbol, date, open, high, low, close, volume, data_source, extracted_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (symbol, date, data_source) DO NOTHING
-                \"\"\", (
-                    row['symbol'], row['date'], row['open'], row['high'], 
-                    row['low'], row['close'], row['volume'], 
-                    row['data_source'], row['extracted_at']
-                ))
+            _copy_upsert(
+                cursor, df_alpha, 'alpha_vantage_data', ALPHA_VANTAGE_COLUMNS,
+                ['symbol', 'date', 'data_source']
+            )
         
         # Process Finnhub data
         finnhub_data = ti.xcom_pull(task_ids='fetch_finnhub', key='finnhub_data')
-        if finnhub_data:
-            df_finnhub = pd.DataFrame(finnhub_data)
+        df_finnhub = _df_from_xcom(finnhub_data) if finnhub_data else None
+        if df_finnhub is not None:
             logger.info(f"Saving {len(df_finnhub)} Finnhub records")
             
-            for _, row in df_finnhub.iterrows():
-                cursor.execute(\"\"\"
-                    INSERT INTO finnhub_data 
-                    (symbol, current_price, high_price, low_price, open_price, 
-                     previous_close, timestamp, data_source, extracted_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (symbol, timestamp, data_source) DO NOTHING
-                \"\"\", (
-                    row['symbol'], row['current_price'], row['high_price'], 
-                    row['low_price'], row['open_price'], row['previous_close'],
-                    row['timestamp'], row['data_source'], row['extracted_at']
-                ))
+            _copy_upsert(
+                cursor, df_finnhub, 'finnhub_data', FINNHUB_COLUMNS,
+                ['symbol', 'timestamp', 'data_source']
+            )
         
         conn.commit()
         cursor.close()
         conn.close()
         
-        total_records = (len(alpha_data) if alpha_data else 0) + (len(finnhub_data) if finnhub_data else 0)
+        total_records = (len(df_alpha) if df_alpha is not None else 0) + (len(df_finnhub) if df_finnhub is not None else 0)
         logger.info(f"Saved total {total_records} records to PostgreSQL")
         return f"Saved {total_records} records"
         
@@ -226,7 +414,7 @@ def save_to_postgres(**context):
         raise
 
 def generate_report(**context):
-    \"\"\"Generate summary report\"\"\"
+    """Generate summary report"""
     try:
         ti = context['ti']
         
@@ -277,12 +465,14 @@ with DAG(
         task_id='fetch_alpha_vantage',
         python_callable=fetch_alpha_vantage,
         provide_context=True,
+        retries=0,  # HTTP errors are already retried by SESSION's adapter
     )
     
     fetch_finnhub_task = PythonOperator(
         task_id='fetch_finnhub',
         python_callable=fetch_finnhub,
         provide_context=True,
+        retries=0,  # HTTP errors are already retried by SESSION's adapter
     )
     
     save_task = PythonOperator(
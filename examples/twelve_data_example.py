@@ -2,6 +2,7 @@
 
 # examples/twelve_data_example.py
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from src.extract.twelve_data.factory import TwelveDataExtractorFactory, AssetType
 
@@ -13,48 +14,34 @@ def extract_all_markets():
     # Create extractors
     extractors = TwelveDataExtractorFactory.create_all_extractors()
     
-    all_data = {}
-    
-    # Extract Forex data
-    forex_extractor = extractors[AssetType.FOREX]
-    forex_data = forex_extractor.extract_major_pairs(
-        interval="1day",
-        output_size=100
-    )
-    all_data['forex'] = forex_data
-    
-    # Extract Stock data
-    stock_extractor = extractors[AssetType.STOCK]
-    stock_data = stock_extractor.extract_major_stocks(
-        interval="1day",
-        output_size=100
-    )
-    all_data['stocks'] = stock_data
-    
-    # Extract Crypto data
-    crypto_extractor = extractors[AssetType.CRYPTO]
-    crypto_data = crypto_extractor.extract_major_cryptos(
-        quote_currency="USD",
-        interval="4h",
-        output_size=200
-    )
-    all_data['crypto'] = crypto_data
-    
-    # Extract ETF data
-    etf_extractor = extractors[AssetType.ETF]
-    etf_data = etf_extractor.extract_major_etfs(
-        interval="1week",
-        output_size=52
-    )
-    all_data['etfs'] = etf_data
-    
-    # Extract Index data
-    index_extractor = extractors[AssetType.INDEX]
-    index_data = index_extractor.extract_major_indices(
-        interval="1day",
-        output_size=30
-    )
-    all_data['indices'] = index_data
+    # Each market is an independent set of HTTP calls, so run them side by side
+    jobs = {
+        'forex': lambda: extractors[AssetType.FOREX].extract_major_pairs(
+            interval="1day",
+            output_size=100
+        ),
+        'stocks': lambda: extractors[AssetType.STOCK].extract_major_stocks(
+            interval="1day",
+            output_size=100
+        ),
+        'crypto': lambda: extractors[AssetType.CRYPTO].extract_major_cryptos(
+            quote_currency="USD",
+            interval="4h",
+            output_size=200
+        ),
+        'etfs': lambda: extractors[AssetType.ETF].extract_major_etfs(
+            interval="1week",
+            output_size=52
+        ),
+        'indices': lambda: extractors[AssetType.INDEX].extract_major_indices(
+            interval="1day",
+            output_size=30
+        ),
+    }
+    
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = {market: pool.submit(job) for market, job in jobs.items()}
+        all_data = {market: future.result() for market, future in futures.items()}
     
     return all_data
 
@@ -99,7 +86,6 @@ def batch_processing_example():
         symbols=forex_pairs,
         interval="1h",
         output_size=24,
-        delay=0.5,  # 500ms delay between requests
         continue_on_error=True
     )
     
@@ -117,22 +103,18 @@ def real_time_quotes_example():
     """
     Example: Get real-time quotes
     """
-    quotes = {}
-    
-    # Get stock quote
-    stock_extractor = TwelveDataExtractorFactory.create_extractor(AssetType.STOCK)
-    apple_quote = stock_extractor.extract_stock_quote("AAPL")
-    quotes['AAPL'] = apple_quote
-    
-    # Get forex quote
-    forex_extractor = TwelveDataExtractorFactory.create_extractor(AssetType.FOREX)
-    eurusd_quote = forex_extractor.extract_forex_quote("EUR/USD")
-    quotes['EUR/USD'] = eurusd_quote
-    
-    # Get crypto quote
-    crypto_extractor = TwelveDataExtractorFactory.create_extractor(AssetType.CRYPTO)
-    btc_quote = crypto_extractor.extract_crypto_quote("BTC", "USD")
-    quotes['BTC/USD'] = btc_quote
+    # Twelve Data extractors share one HTTP session, so the quotes reuse its connections
+    extractors = TwelveDataExtractorFactory.create_all_extractors()
+    
+    jobs = {
+        'AAPL': lambda: extractors[AssetType.STOCK].extract_stock_quote("AAPL"),
+        'EUR/USD': lambda: extractors[AssetType.FOREX].extract_forex_quote("EUR/USD"),
+        'BTC/USD': lambda: extractors[AssetType.CRYPTO].extract_crypto_quote("BTC", "USD"),
+    }
+    
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = {symbol: pool.submit(job) for symbol, job in jobs.items()}
+        quotes = {symbol: future.result() for symbol, future in futures.items()}
     
     return quotes
 
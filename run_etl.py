@@ -1,9 +1,16 @@
 # run_etl.py
 import sys
 import os
+import tempfile
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import List, Type, Dict, Any, Callable, Optional
+import pyarrow as pa
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from datetime import date, datetime, timedelta
+from typing import List, Type, Dict, Any, Callable, Iterator, Mapping, Optional
 sys.path.append('.')
 
 import click
@@ -16,20 +23,354 @@ from src.transform.standardizer import DataStandardizer
 from src.transform.validator import DataValidator
 from src.load.supabase_loader import SupabaseLoader
 from src.load.data_models import StockPrice, EconomicIndicator, WeatherData, ForexRate
+from src.utils.rate_limiter import TokenBucket
+from src.utils.extract_cache import ExtractCache
+from src.utils.checkpoints import CheckpointStore
 from config.settings import settings
 
-# Add delay between API calls in run_etl.py
-import time
-time.sleep(12)  # 12 seconds between calls for Alpha Vantage free tier
-
 logger = setup_logging()
 
+# Alpha Vantage free tier: 5 requests/min, applied only on the stock pipeline's call path
+alpha_vantage_bucket = TokenBucket(rate_per_min=5)
+
+# Upper bound on concurrent extract calls per pipeline; API quotas are still
+# enforced per source by the shared rate limiter inside each extractor
+MAX_EXTRACT_WORKERS = 8
+
+
+# Upper bound on concurrent per-item transforms; pandas releases the GIL in its
+# numeric kernels, so clean/standardize/validate scale across cores
+MAX_TRANSFORM_WORKERS = os.cpu_count() or 1
+
+# Pipelines with at least this many items stream their transformed frames to
+# a Parquet staging file instead of concatenating them in memory
+PARQUET_STAGING_MIN_ITEMS = 100
+
+
+# Daily stock bars are reused by later jobs on the same day (e.g. the midnight full sync)
+STOCK_CACHE_TTL = timedelta(hours=20)
+
+# Frames up to this many rows are combined column by column, which skips
+# pd.concat's per-frame block alignment for many-items x few-rows pipelines
+COLUMNWISE_CONCAT_MAX_ROWS = 100
+
+
+# Identifier columns repeat on every row of a pipeline's combined frame
+CATEGORICAL_COLUMNS = ("symbol", "series_id", "from_currency", "to_currency", "location")
+
+
+# Pipelines that extract incrementally: pipeline_id -> (source, item column, timestamp column)
+# used to advance their checkpoints after a successful load
+CHECKPOINT_COLUMNS = MappingProxyType({
+    "fred_etl": ("fred", "series_id", "date"),
+})
+
+
+# Cleaning schemas per pipeline; read-only so every run shares the same objects
+STOCK_SCHEMA = MappingProxyType({
+    "symbol": "str",
+    "date": "datetime",
+    "open": "float",
+    "high": "float",
+    "low": "float",
+    "close": "float",
+    "volume": "int"
+})
+
+WEATHER_SCHEMA = MappingProxyType({
+    "location": "str",
+    "timestamp": "datetime",
+    "temperature": "float",
+    "humidity": "float",
+    "pressure": "float",
+    "wind_speed": "float"
+})
+
+FOREX_SCHEMA = MappingProxyType({
+    "from_currency": "str",
+    "to_currency": "str",
+    "date": "datetime",
+    "open": "float",
+    "high": "float",
+    "low": "float",
+    "close": "float"
+})
+
+FRED_SCHEMA = MappingProxyType({
+    "series_id": "str",
+    "date": "datetime",
+    "value": "float"
+})
+
+
+# Pipeline components are shared across pipelines so the "all" run parses the
+# sources config and opens the Supabase client once
+@lru_cache(maxsize=1)
+def _cleaner() -> DataCleaner:
+    return DataCleaner()
+
+
+@lru_cache(maxsize=1)
+def _standardizer() -> DataStandardizer:
+    return DataStandardizer()
+
+
+@lru_cache(maxsize=1)
+def _validator() -> DataValidator:
+    return DataValidator()
+
+
+@lru_cache(maxsize=1)
+def _loader() -> SupabaseLoader:
+    return SupabaseLoader()
+
+
+@lru_cache(maxsize=1)
+def _extract_cache() -> ExtractCache:
+    return ExtractCache(settings.extract_cache_dir)
+
+
+@lru_cache(maxsize=1)
+def _checkpoints() -> CheckpointStore:
+    return CheckpointStore(settings.extract_cache_dir / "checkpoints.sqlite")
 
-def load_pipeline_config() -> Dict[str, Any]:
-    """Load pipeline configuration from YAML"""
+
+@lru_cache(maxsize=1)
+def load_pipeline_config() -> Mapping[str, Any]:
+    """Load pipeline configuration from YAML once per process (cache_clear() to reload)"""
     return settings.load_config("pipeline_config")
 
 
+def extract_concurrently(
+    items: List[Any],
+    extract_method: Callable,
+    max_workers: int = MAX_EXTRACT_WORKERS
+) -> List[tuple]:
+    """
+    Run extract_method for every item on a thread pool
+    
+    Extract calls are I/O bound, so overlapping them cuts wall time from the
+    sum of per-item latencies to roughly the slowest one.
+    
+    Args:
+        items: Items to extract (symbols, cities, indicators, pairs)
+        extract_method: Callable taking a single item
+        max_workers: Maximum number of concurrent extract calls
+    
+    Returns:
+        List of (item, result) tuples in input order, where result is the
+        extracted DataFrame or the exception raised while extracting it
+    """
+    def _extract_one(item):
+        try:
+            return item, extract_method(item)
+        except Exception as e:
+            return item, e
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as pool:
+        return list(pool.map(_extract_one, items))
+
+
+def transform_concurrently(
+    extracted: List[tuple],
+    cleaner: DataCleaner,
+    standardizer: DataStandardizer,
+    validator: DataValidator,
+    schema: Mapping[str, str],
+    source_type: str,
+    source_name: str,
+    max_workers: int = MAX_TRANSFORM_WORKERS
+) -> Iterator[tuple]:
+    """
+    Clean, standardize and validate each extracted frame on a thread pool
+    
+    Args:
+        extracted: (item, raw DataFrame) tuples
+        cleaner: DataCleaner instance
+        standardizer: DataStandardizer instance
+        validator: DataValidator instance
+        schema: Cleaning schema
+        source_type: Type of data (stock, weather, economic)
+        source_name: Source identifier
+        max_workers: Maximum number of concurrent transforms
+    
+    Yields:
+        (item, result) tuples in input order, where result is the
+        (validated_data, validation_summary) pair or the exception raised
+    """
+    def _transform_one(item_raw):
+        item, raw_data = item_raw
+        try:
+            cleaned_data = cleaner.clean_dataframe(raw_data, schema, source_name)
+            standardized_data = standardizer.standardize_dataframe(cleaned_data, source_type, source_name)
+            return item, validator.validate_dataframe(standardized_data, source_type, source_name)
+        except Exception as e:
+            return item, e
+    
+    if not extracted:
+        return
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(extracted)))) as pool:
+        yield from pool.map(_transform_one, extracted)
+
+
+def _concat_columnwise(frames: List[pd.DataFrame]) -> Optional[pd.DataFrame]:
+    """
+    Concatenate frames with identical columns and dtypes one column at a time
+    
+    Returns:
+        Combined DataFrame with a fresh RangeIndex, or None when the frames'
+        layouts differ and pd.concat has to align them
+    """
+    columns = list(frames[0].columns)
+    if not frames[0].columns.is_unique:
+        return None
+    
+    for df in frames:
+        if list(df.columns) != columns:
+            return None
+    
+    combined = {}
+    for column in columns:
+        parts = [df[column] for df in frames]
+        dtype = parts[0].dtype
+        if any(part.dtype != dtype for part in parts):
+            return None
+        if isinstance(dtype, np.dtype):
+            combined[column] = np.concatenate([part.to_numpy() for part in parts])
+        else:
+            # Extension dtypes (categoricals, tz-aware timestamps, Arrow strings) keep their type through concat
+            combined[column] = pd.concat(parts, ignore_index=True, copy=False).array
+    
+    return pd.DataFrame(combined, copy=False)
+
+
+def combine_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate per-item frames, storing identifier columns as categoricals
+    
+    The list is emptied once concatenated so the per-item frames are freed
+    before the combined frame is loaded, instead of living alongside it.
+    """
+    combined = None
+    if len(frames) > 1 and all(len(df) <= COLUMNWISE_CONCAT_MAX_ROWS for df in frames):
+        combined = _concat_columnwise(frames)
+    if combined is None:
+        combined = pd.concat(frames, ignore_index=True, sort=False, copy=False)
+    frames.clear()
+    for column in CATEGORICAL_COLUMNS:
+        if column in combined.columns:
+            combined[column] = combined[column].astype("category")
+    return combined
+
+
+def new_run_id() -> str:
+    """Build a run identifier from the current time, shared by every pipeline in a run"""
+    return f"run_{datetime.now():%Y%m%d_%H%M%S}"
+
+
+def run_pipelines_concurrently(jobs: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+    """
+    Run independent pipelines on a thread pool
+    
+    Pipelines hit separate APIs and tables, so the total run time becomes
+    that of the slowest pipeline rather than the sum. Per-source rate
+    limits are still enforced by the shared token buckets.
+    
+    Args:
+        jobs: Mapping of pipeline name to a zero-argument callable
+    
+    Returns:
+        Mapping of pipeline name to its result, in job order; a pipeline
+        that raised yields False
+    """
+    def _run_one(name):
+        try:
+            return jobs[name]()
+        except Exception as e:
+            logger.error(f"{name.capitalize()} ETL failed: {e}")
+            return False
+    
+    if not jobs:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        return dict(zip(jobs, pool.map(_run_one, jobs)))
+
+
+def load_pipeline_data(
+    loader: SupabaseLoader,
+    pipeline_name: str,
+    combined_data: pd.DataFrame,
+    data_model_class: Type,
+    pipeline_id: str,
+    run_id: Optional[str] = None
+) -> bool:
+    """
+    Load a pipeline's combined data and log the outcome
+    
+    Args:
+        loader: SupabaseLoader instance
+        pipeline_name: Name of the pipeline (for logging)
+        combined_data: Transformed data for all items
+        data_model_class: Data model class for loading
+        pipeline_id: Pipeline identifier
+        run_id: Run identifier, defaults to one derived from the current time
+    
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    if run_id is None:
+        run_id = new_run_id()
+    
+    try:
+        load_result = loader.load_from_dataframe(
+            df=combined_data,
+            data_model_class=data_model_class,
+            pipeline_id=pipeline_id,
+            run_id=run_id
+        )
+    except Exception as e:
+        logger.error(f"Failed to load {pipeline_name.lower()} data: {e}")
+        return False
+    
+    log_load_result(pipeline_name, load_result)
+    save_checkpoints(pipeline_id, combined_data)
+    return True
+
+
+def save_checkpoints(pipeline_id: str, combined_data: pd.DataFrame) -> None:
+    """
+    Advance each item's checkpoint to the newest timestamp that was loaded
+    
+    Pipelines not listed in CHECKPOINT_COLUMNS are left alone. Failures are
+    logged and otherwise ignored; the next run then re-extracts the same window.
+    
+    Args:
+        pipeline_id: Pipeline identifier
+        combined_data: Data that was just loaded
+    """
+    if pipeline_id not in CHECKPOINT_COLUMNS or combined_data.empty:
+        return
+    
+    source, item_column, ts_column = CHECKPOINT_COLUMNS[pipeline_id]
+    try:
+        latest = combined_data.groupby(item_column, observed=True)[ts_column].max().dropna()
+        store = _checkpoints()
+        for item, last_ts in latest.items():
+            store.update(source, str(item), pd.Timestamp(last_ts).to_pydatetime())
+    except Exception as e:
+        logger.warning(f"Failed to save checkpoints for {pipeline_id}: {e}")
+
+
+def log_load_result(pipeline_name: str, load_result: Dict[str, Any]) -> None:
+    """Log record counts for a completed load"""
+    logger.info(f"{pipeline_name} ETL completed successfully!")
+    logger.info(f"  Records processed: {load_result.get('total', 0)}")
+    logger.info(f"  Records inserted: {load_result.get('inserted', 0)}")
+    logger.info(f"  Records updated: {load_result.get('updated', 0)}")
+
+
 def run_pipeline(
     pipeline_name: str,
     extractor: Any,
@@ -40,10 +381,13 @@ def run_pipeline(
     validator: DataValidator,
     loader: SupabaseLoader,
     data_model_class: Type,
-    schema: Dict[str, str],
+    schema: Mapping[str, str],
     source_type: str,
-    source_name: str
-) -> bool:
+    source_name: str,
+    load: bool = True,
+    run_id: Optional[str] = None,
+    cache_ttl: Optional[timedelta] = None
+):
     """
     Generic pipeline runner for ETL operations
     
@@ -60,9 +404,15 @@ def run_pipeline(
         schema: Data validation schema
         source_type: Type of data (stock, weather, economic)
         source_name: Source identifier (alpha_vantage, openweather, etc)
+        load: Load the combined data now; when False it is returned for a later batched load.
+            Immediate loads of PARQUET_STAGING_MIN_ITEMS or more items are staged to Parquet
+        run_id: Run identifier for the load, defaults to one derived from the current time
+        cache_ttl: When set, transformed items younger than this are reused from the
+            extract cache instead of being extracted again
     
     Returns:
-        bool: True if successful, False otherwise
+        bool: True if successful, False otherwise. With load=False, a
+        (combined_data, data_model_class, pipeline_id) tuple when data was produced
     """
     if not items:
         logger.warning(f"No items provided for {pipeline_name} ETL")
@@ -70,72 +420,144 @@ def run_pipeline(
     
     logger.info(f"Starting {pipeline_name} ETL for items: {items}")
     
+    pipeline_id = f"{pipeline_name.lower().replace(' ', '_')}_etl"
     all_data = []
     
-    for item in items:
-        try:
-            logger.info(f"Processing {item}...")
+    # Large immediate loads are staged on disk so only one item's frame is held at a time
+    stage_path = None
+    writer = None
+    stage_schema = None
+    staged_rows = 0
+    if load and len(items) >= PARQUET_STAGING_MIN_ITEMS:
+        # A unique file per run, so overlapping runs of the same pipeline never share one
+        fd, stage_path = tempfile.mkstemp(prefix=f"stg_{pipeline_id}_", suffix=".parquet")
+        os.close(fd)
+    
+    staging = stage_path is not None
+    
+    def collect(validated_data):
+        nonlocal writer, stage_schema, staged_rows, staging
+        if staging:
+            table = pa.Table.from_pandas(validated_data, preserve_index=False)
+            if writer is None:
+                stage_schema = table.schema
+                writer = pq.ParquetWriter(stage_path, stage_schema)
+            try:
+                if table.schema.names != stage_schema.names:
+                    raise pa.ArrowInvalid(f"columns {table.schema.names} differ from {stage_schema.names}")
+                table = table.cast(stage_schema)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+                # The file's schema is fixed by the first frame (e.g. an all-null column is typed
+                # null), so a frame it cannot hold moves the rows staged so far back into memory
+                logger.warning(f"  Staging schema mismatch, combining {pipeline_name.lower()} data in memory: {e}")
+                writer.close()
+                writer = None
+                staging = False
+                if staged_rows:
+                    all_data.append(pq.read_table(stage_path).to_pandas())
+            else:
+                writer.write_table(table)
+                staged_rows += len(validated_data)
+                return
+        all_data.append(validated_data)
+    
+    # The writer is always closed and the staging file always removed, even when a step raises
+    try:
+        # Items already extracted and transformed today skip both steps
+        cache = _extract_cache() if cache_ttl is not None else None
+        cache_date = date.today().isoformat()
+        to_extract = []
+        for item in items:
+            cached_data = cache.get((source_name, item, cache_date), ttl=cache_ttl) if cache is not None else None
+            if cached_data is None:
+                to_extract.append(item)
+            else:
+                logger.info(f"  Using cached {len(cached_data)} records for {item}")
+                collect(cached_data)
+        
+        # 1. EXTRACT
+        extracted = []
+        for item, raw_data in extract_concurrently(to_extract, extract_method):
+            if isinstance(raw_data, Exception):
+                logger.error(f"  Failed to process {item}: {raw_data}")
+                continue
             
-            # 1. EXTRACT
-            raw_data = extract_method(item)
+            logger.info(f"Processing {item}...")
             logger.info(f"  Extracted {len(raw_data)} records for {item}")
             
             if raw_data.empty:
                 logger.warning(f"  No data returned for {item}")
                 continue
             
-            # 2. TRANSFORM
-            # Clean
-            cleaned_data = cleaner.clean_dataframe(raw_data, schema, source_name)
-            
-            # Standardize
-            standardized_data = standardizer.standardize_dataframe(cleaned_data, source_type, source_name)
-            
-            # Validate
-            validated_data, validation_summary = validator.validate_dataframe(
-                standardized_data, source_type, source_name
-            )
+            extracted.append((item, raw_data))
+        
+        # 2. TRANSFORM (clean, standardize, validate)
+        transformed = transform_concurrently(
+            extracted, cleaner, standardizer, validator, schema, source_type, source_name
+        )
+        for item, result in transformed:
+            if isinstance(result, Exception):
+                logger.error(f"  Failed to process {item}: {result}")
+                continue
             
-            if not validation_summary.is_valid():
-                logger.warning(f"  Validation issues for {item}: {validation_summary.failed_checks} failed checks")
+            try:
+                validated_data, validation_summary = result
+                
+                if not validation_summary.is_valid():
+                    logger.warning(f"  Validation issues for {item}: {validation_summary.failed_checks} failed checks")
+                
+                logger.info(f"  Transformed {len(validated_data)} records for {item}")
+                
+                if cache is not None:
+                    cache.put((source_name, item, cache_date), validated_data)
+                
+            except Exception as e:
+                logger.error(f"  Failed to process {item}: {e}")
+                continue
             
-            logger.info(f"  Transformed {len(validated_data)} records for {item}")
+            # Outside the try: a frame that cannot be collected fails the run instead of being dropped
+            collect(validated_data)
+        
+        if writer is not None:
+            writer.close()
+            writer = None
+            logger.info(f"Staged {staged_rows} {pipeline_name.lower()} records to {stage_path}")
             
-            # Add to collection
-            all_data.append(validated_data)
+            # 3. LOAD
+            try:
+                load_result = loader.load_from_parquet(
+                    path=stage_path,
+                    data_model_class=data_model_class,
+                    pipeline_id=pipeline_id,
+                    run_id=run_id or new_run_id()
+                )
+            except Exception as e:
+                logger.error(f"Failed to load {pipeline_name.lower()} data: {e}")
+                return False
             
-        except Exception as e:
-            logger.error(f"  Failed to process {item}: {e}")
+            log_load_result(pipeline_name, load_result)
+            return True
+    finally:
+        if writer is not None:
+            writer.close()
+        if stage_path is not None:
+            os.remove(stage_path)
     
     if all_data:
         # Combine all data
-        combined_data = pd.concat(all_data, ignore_index=True)
+        combined_data = combine_frames(all_data)
+        
+        if not load:
+            return combined_data, data_model_class, pipeline_id
         
         # 3. LOAD
-        try:
-            load_result = loader.load_from_dataframe(
-                df=combined_data,
-                data_model_class=data_model_class,
-                pipeline_id=f"{pipeline_name.lower().replace(' ', '_')}_etl",
-                run_id=f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            )
-            
-            logger.info(f"{pipeline_name} ETL completed successfully!")
-            logger.info(f"  Records processed: {load_result.get('total', 0)}")
-            logger.info(f"  Records inserted: {load_result.get('inserted', 0)}")
-            logger.info(f"  Records updated: {load_result.get('updated', 0)}")
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to load {pipeline_name.lower()} data: {e}")
-            return False
+        return load_pipeline_data(loader, pipeline_name, combined_data, data_model_class, pipeline_id, run_id)
     else:
         logger.warning(f"No {pipeline_name.lower()} data to process")
         return False
 
 
-def run_stock_etl(symbols: Optional[List[str]] = None):
+def run_stock_etl(symbols: Optional[List[str]] = None, load: bool = True, run_id: Optional[str] = None):
     """Run complete stock ETL pipeline using AlphaVantage"""
     if symbols is None:
         config = load_pipeline_config()
@@ -143,56 +565,44 @@ def run_stock_etl(symbols: Optional[List[str]] = None):
     
     # Initialize components
     extractor = AlphaVantageExtractor()
-    cleaner = DataCleaner()
-    standardizer = DataStandardizer()
-    validator = DataValidator()
-    loader = SupabaseLoader()
-    
-    schema = {
-        "symbol": "str",
-        "date": "datetime",
-        "open": "float",
-        "high": "float",
-        "low": "float",
-        "close": "float",
-        "volume": "int"
-    }
+    cleaner = _cleaner()
+    standardizer = _standardizer()
+    validator = _validator()
+    loader = _loader()
+    
+    def extract_symbol(symbol):
+        alpha_vantage_bucket.acquire()
+        return extractor.extract_stock_daily(symbol, output_size="compact")
     
     return run_pipeline(
         pipeline_name="Stock",
         extractor=extractor,
         items=symbols,
-        extract_method=lambda symbol: extractor.extract_stock_daily(symbol, output_size="compact"),
+        extract_method=extract_symbol,
         cleaner=cleaner,
         standardizer=standardizer,
         validator=validator,
         loader=loader,
         data_model_class=StockPrice,
-        schema=schema,
+        schema=STOCK_SCHEMA,
         source_type="stock",
-        source_name="alpha_vantage"
+        source_name="alpha_vantage",
+        load=load,
+        run_id=run_id,
+        cache_ttl=STOCK_CACHE_TTL
     )
 
-def run_weather_etl(cities: Optional[List[str]] = None):
+def run_weather_etl(cities: Optional[List[str]] = None, load: bool = True, run_id: Optional[str] = None):
     """Run weather ETL pipeline"""
     if cities is None:
         config = load_pipeline_config()
         cities = config.get("sources", {}).get("weather", {}).get("cities", ["New York", "London", "Tokyo"])
     
     extractor = WeatherExtractor()
-    cleaner = DataCleaner()
-    standardizer = DataStandardizer()
-    validator = DataValidator()
-    loader = SupabaseLoader()
-    
-    schema = {
-        "location": "str",
-        "timestamp": "datetime",
-        "temperature": "float",
-        "humidity": "float",
-        "pressure": "float",
-        "wind_speed": "float"
-    }
+    cleaner = _cleaner()
+    standardizer = _standardizer()
+    validator = _validator()
+    loader = _loader()
     
     return run_pipeline(
         pipeline_name="Weather",
@@ -204,13 +614,15 @@ def run_weather_etl(cities: Optional[List[str]] = None):
         validator=validator,
         loader=loader,
         data_model_class=WeatherData,
-        schema=schema,
+        schema=WEATHER_SCHEMA,
         source_type="weather",
-        source_name="openweather"
+        source_name="openweather",
+        load=load,
+        run_id=run_id
     )
 
 
-def run_forex_etl(pairs: Optional[List[List[str]]] = None) -> bool:
+def run_forex_etl(pairs: Optional[List[List[str]]] = None, load: bool = True, run_id: Optional[str] = None):
     """Run forex ETL pipeline"""
     if pairs is None:
         config = load_pipeline_config()
@@ -218,33 +630,29 @@ def run_forex_etl(pairs: Optional[List[List[str]]] = None) -> bool:
         pairs = [pair for pair in pairs_config]
     
     extractor = ForexExtractor(api_key=settings.alpha_vantage_api_key)
-    cleaner = DataCleaner()
-    standardizer = DataStandardizer()
-    validator = DataValidator()
-    loader = SupabaseLoader()
-    
-    schema = {
-        "from_currency": "str",
-        "to_currency": "str",
-        "date": "datetime",
-        "open": "float",
-        "high": "float",
-        "low": "float",
-        "close": "float"
-    }
+    cleaner = _cleaner()
+    standardizer = _standardizer()
+    validator = _validator()
+    loader = _loader()
     
     logger.info(f"Starting Forex ETL for pairs: {pairs}")
     
     all_forex_data = []
     
-    for pair in pairs:
+    extracted = extract_concurrently(
+        pairs,
+        lambda pair: extractor.extract_forex_data(pair[0], pair[1], timeframe="daily", output_size="compact")
+    )
+    
+    for pair, raw_data in extracted:
         pair_str = f"{pair[0]}/{pair[1]}"
+        if isinstance(raw_data, Exception):
+            logger.error(f"  Failed to process {pair_str}: {raw_data}")
+            continue
+        
         try:
             from_sym, to_sym = pair[0], pair[1]
             logger.info(f"Processing {pair_str}...")
-            
-            # Extract forex data
-            raw_data = extractor.extract_forex_data(from_sym, to_sym, timeframe="daily", output_size="compact")
             logger.info(f"  Extracted {len(raw_data)} records for {pair_str}")
             
             if raw_data.empty:
@@ -260,7 +668,7 @@ def run_forex_etl(pairs: Optional[List[List[str]]] = None) -> bool:
                 raw_data = raw_data.reset_index()
             
             # Transform
-            cleaned_data = cleaner.clean_dataframe(raw_data, schema, "alphavantage_forex")
+            cleaned_data = cleaner.clean_dataframe(raw_data, FOREX_SCHEMA, "alphavantage_forex")
             standardized_data = standardizer.standardize_dataframe(cleaned_data, "forex", "alphavantage")
             validated_data, validation_summary = validator.validate_dataframe(
                 standardized_data, "forex", "alphavantage"
@@ -276,32 +684,20 @@ def run_forex_etl(pairs: Optional[List[List[str]]] = None) -> bool:
             logger.error(f"  Failed to process {pair_str}: {e}")
     
     if all_forex_data:
-        combined_data = pd.concat(all_forex_data, ignore_index=True)
+        combined_data = combine_frames(all_forex_data)
+        pipeline_id = "forex_etl"
         
-        try:
-            load_result = loader.load_from_dataframe(
-                df=combined_data,
-                data_model_class=ForexRate,
-                pipeline_id="forex_etl",
-                run_id=f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            )
-            
-            logger.info(f"Forex ETL completed successfully!")
-            logger.info(f"  Records processed: {load_result.get('total', 0)}")
-            logger.info(f"  Records inserted: {load_result.get('inserted', 0)}")
-            logger.info(f"  Records updated: {load_result.get('updated', 0)}")
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to load forex data: {e}")
-            return False
+        if not load:
+            return combined_data, ForexRate, pipeline_id
+        
+        # 3. LOAD
+        return load_pipeline_data(loader, "Forex", combined_data, ForexRate, pipeline_id, run_id)
     else:
         logger.warning("No forex data to process")
         return False
 
 
-def run_fred_etl(indicators: Optional[List[str]] = None) -> bool:
+def run_fred_etl(indicators: Optional[List[str]] = None, load: bool = True, run_id: Optional[str] = None):
     """Run FRED economic indicators ETL pipeline"""
     if indicators is None:
         config = load_pipeline_config()
@@ -309,27 +705,35 @@ def run_fred_etl(indicators: Optional[List[str]] = None) -> bool:
     
     try:
         extractor = FREDExtractor(api_key=settings.fred_api_key)
-        cleaner = DataCleaner()
-        standardizer = DataStandardizer()
-        validator = DataValidator()
-        loader = SupabaseLoader()
-        
-        schema = {
-            "series_id": "str",
-            "date": "datetime",
-            "value": "float"
-        }
+        cleaner = _cleaner()
+        standardizer = _standardizer()
+        validator = _validator()
+        loader = _loader()
         
         logger.info(f"Starting FRED ETL for indicators: {indicators}")
         
+        # Only request observations after each series' checkpoint
+        checkpoints = _checkpoints()
+        start_dates = {}
+        for indicator in indicators:
+            last_extracted = checkpoints.get("fred", indicator)
+            if last_extracted is not None:
+                start_dates[indicator] = last_extracted + timedelta(days=1)
+        
+        def extract_new(indicator):
+            return extractor.extract_series(indicator, start_date=start_dates.get(indicator))
+        
         all_fred_data = []
+        failed = []
         
-        for indicator in indicators:
+        for indicator, raw_data in extract_concurrently(indicators, extract_new):
+            if isinstance(raw_data, Exception):
+                logger.error(f"  Failed to process {indicator}: {raw_data}")
+                failed.append(indicator)
+                continue
+            
             try:
                 logger.info(f"Processing {indicator}...")
-                
-                # Extract
-                raw_data = extractor.extract_series(indicator)
                 logger.info(f"  Extracted {len(raw_data)} records for {indicator}")
                 
                 if raw_data.empty:
@@ -340,7 +744,7 @@ def run_fred_etl(indicators: Optional[List[str]] = None) -> bool:
                 raw_data["series_id"] = indicator
                 
                 # Transform
-                cleaned_data = cleaner.clean_dataframe(raw_data, schema, "fred")
+                cleaned_data = cleaner.clean_dataframe(raw_data, FRED_SCHEMA, "fred")
                 standardized_data = standardizer.standardize_dataframe(cleaned_data, "economic", "fred")
                 validated_data, validation_summary = validator.validate_dataframe(
                     standardized_data, "economic", "fred"
@@ -354,28 +758,20 @@ def run_fred_etl(indicators: Optional[List[str]] = None) -> bool:
                 
             except Exception as e:
                 logger.error(f"  Failed to process {indicator}: {e}")
+                failed.append(indicator)
         
         if all_fred_data:
-            combined_data = pd.concat(all_fred_data, ignore_index=True)
+            combined_data = combine_frames(all_fred_data)
+            pipeline_id = "fred_etl"
             
-            try:
-                load_result = loader.load_from_dataframe(
-                    df=combined_data,
-                    data_model_class=EconomicIndicator,
-                    pipeline_id="fred_etl",
-                    run_id=f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                )
-                
-                logger.info(f"FRED ETL completed successfully!")
-                logger.info(f"  Records processed: {load_result.get('total', 0)}")
-                logger.info(f"  Records inserted: {load_result.get('inserted', 0)}")
-                logger.info(f"  Records updated: {load_result.get('updated', 0)}")
-                
-                return True
-                
-            except Exception as e:
-                logger.error(f"Failed to load FRED data: {e}")
-                return False
+            if not load:
+                return combined_data, EconomicIndicator, pipeline_id
+            
+            # 3. LOAD
+            return load_pipeline_data(loader, "FRED", combined_data, EconomicIndicator, pipeline_id, run_id)
+        elif start_dates and not failed:
+            logger.info("FRED data is up to date")
+            return True
         else:
             logger.warning("No FRED data to process")
             return False
@@ -385,7 +781,7 @@ def run_fred_etl(indicators: Optional[List[str]] = None) -> bool:
         return False
 
 
-def run_finnhub_etl(symbols: Optional[List[str]] = None) -> bool:
+def run_finnhub_etl(symbols: Optional[List[str]] = None, load: bool = True, run_id: Optional[str] = None):
     """Run Finnhub stock data ETL pipeline"""
     if symbols is None:
         config = load_pipeline_config()
@@ -393,43 +789,34 @@ def run_finnhub_etl(symbols: Optional[List[str]] = None) -> bool:
     
     try:
         extractor = FinnhubExtractor()
-        cleaner = DataCleaner()
-        standardizer = DataStandardizer()
-        validator = DataValidator()
-        loader = SupabaseLoader()
-        
-        schema = {
-            "symbol": "str",
-            "date": "datetime",
-            "open": "float",
-            "high": "float",
-            "low": "float",
-            "close": "float",
-            "volume": "int"
-        }
+        cleaner = _cleaner()
+        standardizer = _standardizer()
+        validator = _validator()
+        loader = _loader()
         
         logger.info(f"Starting Finnhub ETL for symbols: {symbols}")
         
         all_finnhub_data = []
         
-        for symbol in symbols:
+        def extract_symbol(symbol):
+            # Extract - use quote as fallback, then try historical
+            try:
+                raw_data = extractor.extract_stock_historical(symbol)
+                logger.info(f"  Extracted {len(raw_data)} historical records for {symbol}")
+            except:
+                # Fallback to quote if historical fails
+                raw_data = extractor.extract_stock_quote(symbol)
+                logger.info(f"  Extracted quote data for {symbol}")
+            return raw_data
+        
+        for symbol, raw_data in extract_concurrently(symbols, extract_symbol):
+            if isinstance(raw_data, Exception):
+                logger.error(f"  Failed to process {symbol}: {raw_data}")
+                continue
+            
             try:
                 logger.info(f"Processing {symbol}...")
                 
-                # Extract - use quote as fallback, then try historical
-                try:
-                    raw_data = extractor.extract_stock_historical(symbol)
-                    logger.info(f"  Extracted {len(raw_data)} historical records for {symbol}")
-                except:
-                    # Fallback to quote if historical fails
-                    quote_data = extractor.extract_stock_quote(symbol)
-                    if not quote_data.empty:
-                        raw_data = quote_data
-                        logger.info(f"  Extracted quote data for {symbol}")
-                    else:
-                        logger.warning(f"  No data available for {symbol}")
-                        continue
-                
                 if raw_data.empty:
                     logger.warning(f"  No data returned for {symbol}")
                     continue
@@ -438,7 +825,7 @@ def run_finnhub_etl(symbols: Optional[List[str]] = None) -> bool:
                 raw_data["symbol"] = symbol
                 
                 # Transform
-                cleaned_data = cleaner.clean_dataframe(raw_data, schema, "finnhub")
+                cleaned_data = cleaner.clean_dataframe(raw_data, STOCK_SCHEMA, "finnhub")
                 standardized_data = standardizer.standardize_dataframe(cleaned_data, "stock", "finnhub")
                 validated_data, validation_summary = validator.validate_dataframe(
                     standardized_data, "stock", "finnhub"
@@ -454,26 +841,14 @@ def run_finnhub_etl(symbols: Optional[List[str]] = None) -> bool:
                 logger.error(f"  Failed to process {symbol}: {e}")
         
         if all_finnhub_data:
-            combined_data = pd.concat(all_finnhub_data, ignore_index=True)
+            combined_data = combine_frames(all_finnhub_data)
+            pipeline_id = "finnhub_etl"
             
-            try:
-                load_result = loader.load_from_dataframe(
-                    df=combined_data,
-                    data_model_class=StockPrice,
-                    pipeline_id="finnhub_etl",
-                    run_id=f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                )
-                
-                logger.info(f"Finnhub ETL completed successfully!")
-                logger.info(f"  Records processed: {load_result.get('total', 0)}")
-                logger.info(f"  Records inserted: {load_result.get('inserted', 0)}")
-                logger.info(f"  Records updated: {load_result.get('updated', 0)}")
-                
-                return True
-                
-            except Exception as e:
-                logger.error(f"Failed to load Finnhub data: {e}")
-                return False
+            if not load:
+                return combined_data, StockPrice, pipeline_id
+            
+            # 3. LOAD
+            return load_pipeline_data(loader, "Finnhub", combined_data, StockPrice, pipeline_id, run_id)
         else:
             logger.warning("No Finnhub data to process")
             return False
@@ -522,6 +897,9 @@ def main(pipelines: tuple, symbols: tuple, cities: tuple, indicators: tuple):
     print("Financial ETL Pipeline Runner")
     print("=" * 60)
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    
+    # One identifier for every pipeline in this invocation so their loads can be correlated
+    run_id = new_run_id()
     print()
     
     # Determine which pipelines to run
@@ -534,32 +912,45 @@ def main(pipelines: tuple, symbols: tuple, cities: tuple, indicators: tuple):
     cities_list = list(cities) if cities else None
     indicators_list = list(indicators) if indicators else None
     
-    results = {}
+    # Run requested pipelines side by side, deferring their loads so they go out in one batch
+    jobs = {}
     
-    # Run requested pipelines
     if "stock" in pipelines_to_run:
-        print("1. Running Stock ETL...")
-        results["stock"] = run_stock_etl(symbols_list)
-        print()
+        jobs["stock"] = lambda: run_stock_etl(symbols_list, load=False)
     
     if "weather" in pipelines_to_run:
-        print("2. Running Weather ETL...")
-        results["weather"] = run_weather_etl(cities_list)
-        print()
+        jobs["weather"] = lambda: run_weather_etl(cities_list, load=False)
     
     if "fred" in pipelines_to_run:
-        print("3. Running FRED ETL...")
-        results["fred"] = run_fred_etl(indicators_list)
-        print()
+        jobs["fred"] = lambda: run_fred_etl(indicators_list, load=False)
     
     if "finnhub" in pipelines_to_run:
-        print("4. Running Finnhub ETL...")
-        results["finnhub"] = run_finnhub_etl(symbols_list)
-        print()
+        jobs["finnhub"] = lambda: run_finnhub_etl(symbols_list, load=False)
     
     if "forex" in pipelines_to_run:
-        print("5. Running Forex ETL...")
-        results["forex"] = run_forex_etl()
+        jobs["forex"] = lambda: run_forex_etl(load=False)
+    
+    print(f"Running {', '.join(name.capitalize() for name in jobs)} ETL...")
+    runs = run_pipelines_concurrently(jobs)
+    print()
+    
+    results = {name: run is True for name, run in runs.items() if not isinstance(run, tuple)}
+    pending = {name: run for name, run in runs.items() if isinstance(run, tuple)}
+    
+    if pending:
+        print("Loading results...")
+        load_results = _loader().load_many([
+            (combined_data, data_model_class, pipeline_id, run_id)
+            for combined_data, data_model_class, pipeline_id in pending.values()
+        ])
+        for name, load_result in zip(pending, load_results):
+            if isinstance(load_result, Exception):
+                logger.error(f"Failed to load {name} data: {load_result}")
+                results[name] = False
+            else:
+                log_load_result(name.capitalize(), load_result)
+                save_checkpoints(pending[name][2], pending[name][0])
+                results[name] = True
         print()
     
     # Summary
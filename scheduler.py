@@ -8,27 +8,51 @@ Installation:
 """
 
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.triggers.cron import CronTrigger
 import logging
-import subprocess
-import sys
-import os
+import queue
+import signal
+import threading
 from datetime import datetime
+from functools import partial
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/scheduler.log'),
-        logging.StreamHandler()
-    ]
+# Ensure logs directory exists before run_etl's logger opens its file handler
+Path('logs').mkdir(exist_ok=True)
+
+from run_etl import (
+    load_pipeline_config,
+    new_run_id,
+    run_pipelines_concurrently,
+    run_stock_etl,
+    run_weather_etl,
+    run_forex_etl,
+    run_fred_etl,
+    run_finnhub_etl,
 )
+
+# Setup logging: records go onto a queue and a listener thread does the file
+# and console writes, so pipeline threads never block on log I/O
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.FileHandler('logs/scheduler.log'), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+
+_log_queue = queue.SimpleQueue()
+log_listener = QueueListener(_log_queue, *_log_handlers)
+logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
 logger = logging.getLogger(__name__)
 
-# Ensure logs directory exists
-Path('logs').mkdir(exist_ok=True)
+# Pipelines run in-process and concurrently, like `run_etl.py --pipelines all`
+PIPELINES = {
+    "stock": run_stock_etl,
+    "weather": run_weather_etl,
+    "fred": run_fred_etl,
+    "finnhub": run_finnhub_etl,
+    "forex": run_forex_etl,
+}
 
 
 def run_etl_pipeline(pipeline_type: str = "all"):
@@ -41,25 +65,19 @@ def run_etl_pipeline(pipeline_type: str = "all"):
     try:
         logger.info(f"Starting ETL pipeline: {pipeline_type}")
         
-        # Run the ETL script
-        result = subprocess.run(
-            [sys.executable, "run_etl.py", "--pipelines", pipeline_type],
-            cwd=os.path.dirname(os.path.abspath(__file__)),
-            capture_output=True,
-            text=True,
-            timeout=3600  # 1 hour timeout
-        )
+        names = list(PIPELINES) if pipeline_type == "all" else [pipeline_type]
+        run_id = new_run_id()
+        results = run_pipelines_concurrently({
+            name: partial(PIPELINES[name], run_id=run_id) for name in names
+        })
         
-        if result.returncode == 0:
+        if any(results.values()):
             logger.info(f"[OK] {pipeline_type.upper()} ETL completed successfully")
-            if result.stdout:
-                logger.info(f"Output:\n{result.stdout}")
+            for name, success in results.items():
+                logger.info(f"  {name}: {'OK' if success else 'FAILED'}")
         else:
             logger.error(f"[FAILED] {pipeline_type.upper()} ETL failed")
-            logger.error(f"Error output:\n{result.stderr}")
             
-    except subprocess.TimeoutExpired:
-        logger.error(f"ETL pipeline timeout after 1 hour")
     except Exception as e:
         logger.error(f"Error running ETL pipeline: {str(e)}")
 
@@ -67,7 +85,12 @@ def run_etl_pipeline(pipeline_type: str = "all"):
 def schedule_pipelines():
     """Configure and start the scheduler"""
     
-    scheduler = BackgroundScheduler()
+    log_listener.start()
+    
+    scheduler = BackgroundScheduler(
+        executors={'default': ThreadPoolExecutor(4)},
+        job_defaults={'max_instances': 1, 'coalesce': True, 'misfire_grace_time': 300}
+    )
     
     # Schedule daily pipelines
     # Stock ETL - Every day at 10:00 AM
@@ -149,14 +172,23 @@ def schedule_pipelines():
     logger.info("Scheduler is running. Press Ctrl+C to stop.")
     logger.info("=" * 60)
     
-    try:
-        # This will run forever
-        while True:
-            pass
-    except KeyboardInterrupt:
-        logger.info("Scheduler stopped by user")
-        scheduler.shutdown()
-        logger.info("Scheduler shutdown complete")
+    # Sleep until Ctrl+C or SIGTERM instead of spinning a core; the one-second
+    # timeout lets Windows deliver Ctrl+C, which cannot interrupt an untimed wait
+    stop_event = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    
+    # SIGHUP reloads pipeline_config.yaml without a restart (not available on Windows)
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, lambda *_: load_pipeline_config.cache_clear())
+    
+    while not stop_event.wait(1):
+        pass
+    
+    logger.info("Scheduler stopped by user")
+    scheduler.shutdown(wait=True)
+    logger.info("Scheduler shutdown complete")
+    log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -1,18 +1,14 @@
 # scripts/quick_test.py
 """
 Quick test script for Twelve Data extractors
+
+Run with `fin-etl-quicktest` after `pip install -e .`, or `python -m scripts.quick_test`
+from the project root.
 """
-import sys
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 
-# ── Fix Python path FIRST (before any imports from src) ──────────
-project_root = Path(__file__).resolve().parent.parent   # → financial-etl-pipeline/
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
-# NOW import from src (not extract)
 from src.extract.twelve_data.factory import TwelveDataExtractorFactory, AssetType
 
 # Load environment variables
@@ -33,7 +29,7 @@ def quick_test():
         print("3. The key is not set to the placeholder value")
         
         # Show current .env path
-        env_path = project_root / '.env'
+        env_path = Path(__file__).resolve().parent.parent / '.env'
         print(f"\nLooking for .env at: {env_path}")
         if env_path.exists():
             print(f" .env file exists")
@@ -104,7 +100,7 @@ def quick_test():
         
     except ImportError as e:
         print(f" Import error: {e}")
-        print("Make sure you're in the correct directory and src is in Python path")
+        print("Make sure the project is installed: pip install -e .")
         import traceback
         traceback.print_exc()
     except Exception as e:
@@ -3,21 +3,22 @@
 #!/usr/bin/env python3
 """
 End-to-end test script for Twelve Data extractors
+
+Run with `fin-etl-e2e` after `pip install -e .`, or
+`python -m scripts.test_twelve_data_end_to_end` from the project root.
 """
 import sys
 import os
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from datetime import datetime, timedelta
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
-from extract.twelve_data.factory import TwelveDataExtractorFactory, AssetType
-from utils.logger import setup_logger
+from src.extract.twelve_data.factory import TwelveDataExtractorFactory, AssetType
+from src.utils.logger import get_logger
 
 # Setup logging
-logger = setup_logger(__name__)
+logger = get_logger(__name__)
 
 
 class TwelveDataTester:
@@ -32,6 +33,7 @@ class TwelveDataTester:
         """
         self.test_real_api = test_real_api
         self.results = {}
+        self._results_lock = Lock()
         
         if test_real_api and not os.getenv("TWELVE_DATA_API_KEY"):
             print("⚠️  WARNING: TWELVE_DATA_API_KEY not set in environment")
@@ -44,17 +46,29 @@ class TwelveDataTester:
         print("TWELVE DATA EXTRACTORS - END TO END TEST")
         print("=" * 60)
         
+        # Local-only tests are quick; run them first
         self.test_factory()
-        self.test_time_series()
-        self.test_forex()
-        self.test_stocks()
-        self.test_crypto()
-        self.test_etfs()
-        self.test_indices()
         self.test_batch_operations()
         
+        # API tests wait on network round-trips, so overlap them
+        api_tests = [
+            self.test_time_series,
+            self.test_forex,
+            self.test_stocks,
+            self.test_crypto,
+            self.test_etfs,
+            self.test_indices,
+        ]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda test: test(), api_tests))
+        
         self.print_summary()
     
+    def record(self, test: str, result: str):
+        """Record a test result; safe to call from concurrently running tests"""
+        with self._results_lock:
+            self.results[test] = result
+    
     def test_factory(self):
         """Test extractor factory"""
         print("\n🧪 Testing Extractor Factory...")
@@ -71,11 +85,11 @@ class TwelveDataTester:
             assert AssetType.INDEX in extractors
             
             print("✅ Factory creates all extractors correctly")
-            self.results['factory'] = 'PASS'
+            self.record('factory', 'PASS')
             
         except Exception as e:
             print(f"❌ Factory test failed: {e}")
-            self.results['factory'] = 'FAIL'
+            self.record('factory', 'FAIL')
     
     def test_time_series(self):
         """Test time series extraction"""
@@ -83,7 +97,7 @@ class TwelveDataTester:
         
         if not self.test_real_api:
             print("⏭️  Skipping (requires real API)")
-            self.results['time_series'] = 'SKIP'
+            self.record('time_series', 'SKIP')
             return
         
         try:
@@ -106,11 +120,11 @@ class TwelveDataTester:
                 assert col in df.columns
             
             print(f"✅ Time series: Extracted {len(df)} days of AAPL data")
-            self.results['time_series'] = 'PASS'
+            self.record('time_series', 'PASS')
             
         except Exception as e:
             print(f"❌ Time series test failed: {e}")
-            self.results['time_series'] = 'FAIL'
+            self.record('time_series', 'FAIL')
     
     def test_forex(self):
         """Test forex extraction"""
@@ -118,7 +132,7 @@ class TwelveDataTester:
         
         if not self.test_real_api:
             print("⏭️  Skipping (requires real API)")
-            self.results['forex'] = 'SKIP'
+            self.record('forex', 'SKIP')
             return
         
         try:
@@ -140,11 +154,11 @@ class TwelveDataTester:
             assert df['asset_type'].iloc[0] == 'forex'
             print(f"✅ Forex: Extracted {len(df)} days of EUR/USD data")
             
-            self.results['forex'] = 'PASS'
+            self.record('forex', 'PASS')
             
         except Exception as e:
             print(f"❌ Forex test failed: {e}")
-            self.results['forex'] = 'FAIL'
+            self.record('forex', 'FAIL')
     
     def test_stocks(self):
         """Test stocks extraction"""
@@ -152,7 +166,7 @@ class TwelveDataTester:
         
         if not self.test_real_api:
             print("⏭️  Skipping (requires real API)")
-            self.results['stocks'] = 'SKIP'
+            self.record('stocks', 'SKIP')
             return
         
         try:
@@ -173,11 +187,11 @@ class TwelveDataTester:
             assert len(results) > 0
             print(f"✅ Stocks: Extracted {len(results)} major stocks")
             
-            self.results['stocks'] = 'PASS'
+            self.record('stocks', 'PASS')
             
         except Exception as e:
             print(f"❌ Stocks test failed: {e}")
-            self.results['stocks'] = 'FAIL'
+            self.record('stocks', 'FAIL')
     
     def test_crypto(self):
         """Test crypto extraction"""
@@ -185,7 +199,7 @@ class TwelveDataTester:
         
         if not self.test_real_api:
             print("⏭️  Skipping (requires real API)")
-            self.results['crypto'] = 'SKIP'
+            self.record('crypto', 'SKIP')
             return
         
         try:
@@ -208,11 +222,11 @@ class TwelveDataTester:
             assert df['asset_type'].iloc[0] == 'crypto'
             print(f"✅ Crypto: Extracted {len(df)} days of BTC/USD data")
             
-            self.results['crypto'] = 'PASS'
+            self.record('crypto', 'PASS')
             
         except Exception as e:
             print(f"❌ Crypto test failed: {e}")
-            self.results['crypto'] = 'FAIL'
+            self.record('crypto', 'FAIL')
     
     def test_etfs(self):
         """Test ETFs extraction"""
@@ -220,7 +234,7 @@ class TwelveDataTester:
         
         if not self.test_real_api:
             print("⏭️  Skipping (requires real API)")
-            self.results['etfs'] = 'SKIP'
+            self.record('etfs', 'SKIP')
             return
         
         try:
@@ -242,11 +256,11 @@ class TwelveDataTester:
             assert df['asset_type'].iloc[0] == 'etf'
             print(f"✅ ETFs: Extracted {len(df)} days of SPY data")
             
-            self.results['etfs'] = 'PASS'
+            self.record('etfs', 'PASS')
             
         except Exception as e:
             print(f"❌ ETFs test failed: {e}")
-            self.results['etfs'] = 'FAIL'
+            self.record('etfs', 'FAIL')
     
     def test_indices(self):
         """Test indices extraction"""
@@ -254,7 +268,7 @@ class TwelveDataTester:
         
         if not self.test_real_api:
             print("⏭️  Skipping (requires real API)")
-            self.results['indices'] = 'SKIP'
+            self.record('indices', 'SKIP')
             return
         
         try:
@@ -276,11 +290,11 @@ class TwelveDataTester:
             assert df['asset_type'].iloc[0] == 'index'
             print(f"✅ Indices: Extracted {len(df)} days of DJI data")
             
-            self.results['indices'] = 'PASS'
+            self.record('indices', 'PASS')
             
         except Exception as e:
             print(f"❌ Indices test failed: {e}")
-            self.results['indices'] = 'FAIL'
+            self.record('indices', 'FAIL')
     
     def test_batch_operations(self):
         """Test batch operations"""
@@ -308,11 +322,11 @@ class TwelveDataTester:
             assert 'symbol' in combined.columns
             
             print(f"✅ Batch: Successfully combined {len(mock_results)} DataFrames")
-            self.results['batch'] = 'PASS'
+            self.record('batch', 'PASS')
             
         except Exception as e:
             print(f"❌ Batch operations test failed: {e}")
-            self.results['batch'] = 'FAIL'
+            self.record('batch', 'FAIL')
     
     def print_summary(self):
         """Print test summary"""
@@ -344,11 +358,8 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='Test Twelve Data extractors')
-    parser.add_argument('--real-api', action='store_true', 
+    parser.add_argument('--real-api', action=argparse.BooleanOptionalAction, default=True,
                        help='Test with real API calls (requires API key)')
-    parser.add_argument('--no-real-api', dest='real_api', action='store_false',
-                       help='Skip real API tests')
-    parser.set_defaults(real_api=True)
     
     args = parser.parse_args()
     
@@ -7,4 +7,10 @@ setup(
     name="financial-etl-pipeline",
     version="0.1.0",
     packages=find_packages(),
+    entry_points={
+        "console_scripts": [
+            "fin-etl-quicktest=scripts.quick_test:quick_test",
+            "fin-etl-e2e=scripts.test_twelve_data_end_to_end:main",
+        ],
+    },
 )
\ No newline at end of file
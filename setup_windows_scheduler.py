@@ -13,11 +13,83 @@ This will:
 4. Log all output to logs/scheduler.log
 """
 
-import subprocess
 import os
 import sys
 from pathlib import Path
 
+try:
+    import pythoncom
+    import win32com.client
+except ImportError:  # pywin32 is only available on Windows
+    win32com = None
+
+TASK_NAME = "ETL Pipeline Scheduler"
+
+# Task Scheduler 2.0 constants (taskschd.h)
+TASK_TRIGGER_DAILY = 2
+TASK_TRIGGER_BOOT = 8
+TASK_ACTION_EXEC = 0
+TASK_CREATE_OR_UPDATE = 6
+TASK_LOGON_SERVICE_ACCOUNT = 5
+TASK_RUNLEVEL_HIGHEST = 1
+TASK_INSTANCES_IGNORE_NEW = 2
+
+
+def build_task_definition(scheduler, python_exe: str, scheduler_script: str, project_path: str):
+    """
+    Build the task definition for the ETL scheduler
+
+    Args:
+        scheduler: Connected Schedule.Service object
+        python_exe: Python interpreter to run
+        scheduler_script: Path to scheduler.py
+        project_path: Working directory for the task
+
+    Returns:
+        TaskDefinition COM object
+    """
+    task = scheduler.NewTask(0)
+
+    task.RegistrationInfo.Author = "Financial ETL"
+    task.RegistrationInfo.Description = "Automatically runs the financial ETL pipeline on schedule"
+
+    task.Principal.UserId = "SYSTEM"
+    task.Principal.LogonType = TASK_LOGON_SERVICE_ACCOUNT
+    task.Principal.RunLevel = TASK_RUNLEVEL_HIGHEST
+
+    settings = task.Settings
+    settings.MultipleInstances = TASK_INSTANCES_IGNORE_NEW
+    settings.DisallowStartIfOnBatteries = False
+    settings.StopIfGoingOnBatteries = False
+    settings.AllowHardTerminate = True
+    settings.StartWhenAvailable = True
+    settings.RunOnlyIfNetworkAvailable = False
+    settings.AllowDemandStart = True
+    settings.Enabled = True
+    settings.Hidden = False
+    settings.RunOnlyIfIdle = False
+    settings.WakeToRun = False
+    settings.ExecutionTimeLimit = "PT0S"
+    settings.RestartCount = 3
+    settings.RestartInterval = "PT1M"
+
+    boot_trigger = task.Triggers.Create(TASK_TRIGGER_BOOT)
+    boot_trigger.Delay = "PT5M"
+    boot_trigger.Enabled = True
+
+    daily_trigger = task.Triggers.Create(TASK_TRIGGER_DAILY)
+    daily_trigger.DaysInterval = 1
+    daily_trigger.StartBoundary = "2026-01-07T00:00:00"
+    daily_trigger.Enabled = True
+
+    action = task.Actions.Create(TASK_ACTION_EXEC)
+    action.Path = python_exe
+    action.Arguments = f'"{scheduler_script}"'
+    action.WorkingDirectory = project_path
+
+    return task
+
+
 def setup_task_scheduler():
     """Create Windows Task Scheduler task for ETL pipeline"""
     
@@ -26,131 +98,65 @@ def setup_task_scheduler():
     python_exe = sys.executable
     scheduler_script = os.path.join(project_path, "scheduler.py")
     
-    # Create the task XML definition
-    task_xml = f"""<?xml version="1.0" encoding="UTF-16"?>
-<Task version="1.2" xmlns="http://schemas.microsoft.com/windows/2004/02/mit/task">
-  <RegistrationInfo>
-    <Date>2026-01-07T00:00:00</Date>
-    <Author>Financial ETL</Author>
-    <Description>Automatically runs the financial ETL pipeline on schedule</Description>
-    <URI>\\ETL Pipeline Scheduler</URI>
-  </RegistrationInfo>
-  <Triggers>
-    <BootTrigger>
-      <Enabled>true</Enabled>
-      <Delay>PT5M</Delay>
-    </BootTrigger>
-    <TimeTrigger>
-      <Enabled>true</Enabled>
-      <ScheduleByDay>
-        <DaysInterval>1</DaysInterval>
-        <StartBoundary>2026-01-07T00:00:00</StartBoundary>
-      </ScheduleByDay>
-    </TimeTrigger>
-  </Triggers>
-  <Principals>
-    <Principal id="Author">
-      <UserId>S-1-5-18</UserId>
-      <RunLevel>HighestAvailable</RunLevel>
-    </Principal>
-  </Principals>
-  <Settings>
-    <MultipleInstancesPolicy>IfTaskIsRunning</MultipleInstancesPolicy>
-    <DisallowStartIfOnBatteries>false</DisallowStartIfOnBatteries>
-    <StopIfGoingOnBatteries>false</StopIfGoingOnBatteries>
-    <AllowHardTerminate>true</AllowHardTerminate>
-    <StartWhenAvailable>true</StartWhenAvailable>
-    <RunOnlyIfNetworkAvailable>false</RunOnlyIfNetworkAvailable>
-    <IdleSettings>
-      <Duration>PT10M</Duration>
-      <WaitTimeout>PT1H</WaitTimeout>
-      <StopOnIdleEnd>true</StopOnIdleEnd>
-      <RestartOnIdle>false</RestartOnIdle>
-    </IdleSettings>
-    <AllowStartOnDemand>true</AllowStartOnDemand>
-    <Enabled>true</Enabled>
-    <Hidden>false</Hidden>
-    <RunOnlyIfIdle>false</RunOnlyIfIdle>
-    <DisallowStartOnRemoteAppSession>false</DisallowStartOnRemoteAppSession>
-    <UseUnifiedSchedulingEngine>true</UseUnifiedSchedulingEngine>
-    <WakeToRun>false</WakeToRun>
-    <ExecutionTimeLimit>PT0S</ExecutionTimeLimit>
-    <DeleteExpiredTaskAfter>PT0S</DeleteExpiredTaskAfter>
-    <RestartCount>3</RestartCount>
-    <RestartInterval>PT1M</RestartInterval>
-  </Settings>
-  <Actions Context="Author">
-    <Exec>
-      <Command>"{python_exe}"</Command>
-      <Arguments>"{scheduler_script}"</Arguments>
-      <WorkingDirectory>{project_path}</WorkingDirectory>
-    </Exec>
-  </Actions>
-</Task>"""
-
-    # Save task XML to temp file
-    temp_xml = os.path.join(project_path, "etl_task.xml")
-    with open(temp_xml, 'w') as f:
-        f.write(task_xml)
-    
     print("=" * 70)
     print("Setting up Windows Task Scheduler for ETL Pipeline")
     print("=" * 70)
     print(f"\nPython: {python_exe}")
     print(f"Project: {project_path}")
     print(f"Script: {scheduler_script}")
-    print(f"\nCreating task from: {temp_xml}")
+    
+    if win32com is None:
+        print("\n[FAILED] pywin32 is required: pip install pywin32")
+        return
     
     try:
-        # Create the scheduled task using schtasks
-        cmd = [
-            "schtasks",
-            "/create",
-            "/tn", "ETL Pipeline Scheduler",
-            "/xml", temp_xml,
-            "/f"  # Force overwrite if exists
-        ]
+        # Register the task in-process through the Task Scheduler COM API
+        pythoncom.CoInitialize()
+        scheduler = win32com.client.Dispatch("Schedule.Service")
+        scheduler.Connect()
+        root = scheduler.GetFolder("\\")
+        
+        task = build_task_definition(scheduler, python_exe, scheduler_script, project_path)
+        root.RegisterTaskDefinition(
+            TASK_NAME,
+            task,
+            TASK_CREATE_OR_UPDATE,  # Overwrite if exists
+            "SYSTEM",
+            None,
+            TASK_LOGON_SERVICE_ACCOUNT
+        )
+        
+        print("\n[SUCCESS] Task created successfully!")
+        print("\nTask Details:")
+        print(f"  Name: {TASK_NAME}")
+        print("  Triggers:")
+        print("    - At system startup (5 minute delay)")
+        print("    - Daily at midnight")
+        print("  Run with: Highest privileges")
+        print("  Status: Enabled")
+        print(f"\nLogs will be saved to: {os.path.join(project_path, 'logs/scheduler.log')}")
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        print("\n" + "=" * 70)
+        print("NEXT STEPS:")
+        print("=" * 70)
+        print("1. Verify the task:")
+        print("   schtasks /query /tn 'ETL Pipeline Scheduler' /v")
+        print("\n2. View scheduled tasks:")
+        print("   Open Task Scheduler (taskmgr) -> Task Scheduler Library")
+        print("\n3. Run immediately (for testing):")
+        print("   schtasks /run /tn 'ETL Pipeline Scheduler'")
+        print("\n4. To remove the task:")
+        print("   schtasks /delete /tn 'ETL Pipeline Scheduler' /f")
+        print("=" * 70)
         
-        if result.returncode == 0:
-            print("\n[SUCCESS] Task created successfully!")
-            print("\nTask Details:")
-            print("  Name: ETL Pipeline Scheduler")
-            print("  Triggers:")
-            print("    - At system startup (5 minute delay)")
-            print("    - Daily at midnight")
-            print("  Run with: Highest privileges")
-            print("  Status: Enabled")
-            print(f"\nLogs will be saved to: {os.path.join(project_path, 'logs/scheduler.log')}")
-            
-            # Clean up temp file
-            if os.path.exists(temp_xml):
-                os.remove(temp_xml)
-            
-            print("\n" + "=" * 70)
-            print("NEXT STEPS:")
-            print("=" * 70)
-            print("1. Verify the task:")
-            print("   schtasks /query /tn 'ETL Pipeline Scheduler' /v")
-            print("\n2. View scheduled tasks:")
-            print("   Open Task Scheduler (taskmgr) -> Task Scheduler Library")
-            print("\n3. Run immediately (for testing):")
-            print("   schtasks /run /tn 'ETL Pipeline Scheduler'")
-            print("\n4. To remove the task:")
-            print("   schtasks /delete /tn 'ETL Pipeline Scheduler' /f")
-            print("=" * 70)
-            
-        else:
-            print(f"\n[FAILED] {result.stderr}")
-            # Clean up
-            if os.path.exists(temp_xml):
-                os.remove(temp_xml)
-            
+    except pythoncom.com_error as e:
+        hresult, message, excepinfo, _ = e.args
+        detail = excepinfo[2] if excepinfo else message
+        print(f"\n[FAILED] {detail} (HRESULT {hresult & 0xFFFFFFFF:#010x})")
     except Exception as e:
         print(f"\n[ERROR] {str(e)}")
-        if os.path.exists(temp_xml):
-            os.remove(temp_xml)
+    finally:
+        pythoncom.CoUninitialize()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,6 @@
+# src/__main__.py
+"""Allow ``python -m src`` as a shortcut for the CLI"""
+from .cli import cli
+
+if __name__ == "__main__":
+    cli()
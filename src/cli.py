@@ -2,10 +2,25 @@
 import click
 import sys
 import os
-from datetime import datetime
-from .utils.logger import setup_logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 
-logger = setup_logging()
+# Heavy imports (extractors, pandas, settings) stay inside the commands so
+# `--help` and `health` start fast
+
+# Alpha Vantage free tier allows 5 requests/min; fetches beyond that wait on the bucket
+ALPHA_VANTAGE_RATE_PER_MIN = 5
+MAX_EXTRACT_WORKERS = 8
+
+# Daily bars only change once a day, so reruns within this window reuse the cached fetch
+DAILY_CACHE_TTL = timedelta(hours=12)
+
+@lru_cache(maxsize=1)
+def _get_extractor():
+    """Shared Alpha Vantage extractor, so repeated commands in one process reuse its setup"""
+    from .extract.alpha_vantage import AlphaVantageExtractor
+    return AlphaVantageExtractor()
 
 @click.group()
 def cli():
@@ -27,34 +42,85 @@ def health():
 @cli.command()
 @click.option('--symbols', '-s', default='AAPL,MSFT,GOOGL', help='Stock symbols (comma-separated)')
 @click.option('--output', '-o', type=click.Path(), help='Output directory')
-def run(symbols, output):
+@click.option('--no-cache', is_flag=True, help='Always fetch from the API instead of reusing cached data')
+@click.option('--format', 'output_format', type=click.Choice(['csv', 'parquet']), default='csv',
+              help='Output format: one CSV per symbol, or a Parquet dataset partitioned by symbol')
+def run(symbols, output, no_cache, output_format):
     """Run ETL pipeline"""
-    from .extract.alpha_vantage import AlphaVantageExtractor
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    from pyarrow import csv as pacsv
     from .transform.data_cleaner import DataCleaner
     from .transform.standardizer import DataStandardizer
+    from .utils.rate_limiter import TokenBucket
+    from .utils.extract_cache import ExtractCache
+    from .utils.logger import setup_logging
+    from config.settings import settings
+    
+    setup_logging()
     
-    symbol_list = [s.strip() for s in symbols.split(',')]
+    # Normalize, de-duplicate and intern once; each symbol is reused as a cache key, filename and column value
+    symbol_list = list(dict.fromkeys(sys.intern(s.strip().upper()) for s in symbols.split(',') if s.strip()))
     
     click.echo(f"Running ETL for symbols: {', '.join(symbol_list)}")
     
-    extractor = AlphaVantageExtractor()
+    extractor = _get_extractor()
+    bucket = TokenBucket(rate_per_min=ALPHA_VANTAGE_RATE_PER_MIN)
+    cache = None if no_cache else ExtractCache(settings.extract_cache_dir, ttl=DAILY_CACHE_TTL)
+    today = date.today().isoformat()
+    
+    def extract(symbol):
+        key = ("alpha_vantage_daily", symbol, today)
+        if cache is not None:
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        
+        bucket.acquire()
+        data = extractor.extract_stock_daily(symbol, output_size="compact")
+        if cache is not None:
+            cache.put(key, data)
+        return data
     
-    for symbol in symbol_list:
-        try:
-            click.echo(f"\nProcessing {symbol}...")
-            
-            # Extract
-            data = extractor.extract_stock_daily(symbol, output_size="compact")
-            click.echo(f"  Extracted {len(data)} records")
-            
-            if output:
-                # Save to CSV
-                filename = os.path.join(output, f"{symbol}_{datetime.now().strftime('%Y%m%d')}.csv")
-                data.to_csv(filename, index=False)
-                click.echo(f"  Saved to {filename}")
-            
-        except Exception as e:
-            click.echo(f"   Failed: {e}")
+    # Parquet output is collected and written once as a dataset after all symbols are fetched
+    parquet_frames = []
+    
+    # Fetch all symbols concurrently; results are reported in input order
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_EXTRACT_WORKERS, len(symbol_list)))) as pool:
+        futures = [pool.submit(extract, symbol) for symbol in symbol_list]
+        
+        for symbol, future in zip(symbol_list, futures):
+            try:
+                click.echo(f"\nProcessing {symbol}...")
+                
+                # Extract
+                data = future.result()
+                click.echo(f"  Extracted {len(data)} records")
+                
+                if output and output_format == 'parquet':
+                    parquet_frames.append(data.assign(symbol=symbol))
+                elif output:
+                    # Write through Arrow's C++ writer rather than pandas' Python CSV writer
+                    filename = os.path.join(output, f"{symbol}_{datetime.now().strftime('%Y%m%d')}.csv")
+                    pacsv.write_csv(pa.Table.from_pandas(data, preserve_index=False), filename)
+                    click.echo(f"  Saved to {filename}")
+                
+            except Exception as e:
+                click.echo(f"   Failed: {e}")
+    
+    if parquet_frames:
+        table = pa.Table.from_pandas(pd.concat(parquet_frames, ignore_index=True), preserve_index=False)
+        ds.write_dataset(
+            table,
+            output,
+            format='parquet',
+            partitioning=ds.partitioning(pa.schema([('symbol', pa.string())]), flavor='hive'),
+            basename_template=f"{date.today():%Y%m%d}-{{i}}.parquet",
+            file_options=ds.ParquetFileFormat().make_write_options(compression='zstd'),
+            existing_data_behavior='overwrite_or_ignore'
+        )
+        click.echo(f"\nSaved {table.num_rows} records for {len(parquet_frames)} symbols to {output}")
     
     click.echo("\n ETL completed!")
 
@@ -62,11 +128,13 @@ def run(symbols, output):
 @click.option('--symbol', '-s', default='AAPL', help='Stock symbol')
 def test(symbol):
     """Test extraction for a single symbol"""
-    from .extract.alpha_vantage import AlphaVantageExtractor
+    from .utils.logger import setup_logging
+    
+    setup_logging()
     
     click.echo(f"Testing extraction for {symbol}...")
     
-    extractor = AlphaVantageExtractor()
+    extractor = _get_extractor()
     
     try:
         data = extractor.extract_stock_daily(symbol, output_size="compact")
@@ -1,7 +1,8 @@
 # src/extract/twelve_data/base.py
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, Iterator, List, Any, Optional, Union
 from datetime import datetime, timedelta
 import pandas as pd
+import pyarrow as pa
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 
@@ -9,8 +10,28 @@ from src.utils.logger import logger
 from src.utils.rate_limiter import rate_limiter
 from config.settings import settings
 
+import atexit
+import time
 from abc import ABC, abstractmethod
+from threading import Lock
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+try:
+    import ijson  # picks the yajl2_c backend when it is built
+except ImportError:
+    ijson = None
+try:
+    import h2  # noqa: F401 - httpx only negotiates HTTP/2 when h2 is installed
+    import httpx
+except ImportError:  # optional; sessions fall back to HTTP/1.1 keep-alive
+    httpx = None
 
 
 
@@ -19,9 +40,92 @@ class ExtractionError(Exception):
     pass
 
 
+# (connect, read) timeout applied to every request unless the caller overrides it
+HTTP_TIMEOUT = (5, 30)
+
+# Every content coding urllib3 can decode here: gzip and deflate, plus br
+# and zstd when brotli/zstandard are installed
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+# Transient HTTP errors retried with exponential backoff
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+HTTP_RETRIES = 5
+HTTP_BACKOFF = 0.5
+
+# Sources whose many small GETs to one host are multiplexed over a single
+# HTTP/2 connection when httpx[http2] is installed
+HTTP2_SOURCES = frozenset({"finnhub"})
+
+_sessions: Dict[str, Any] = {}
+_sessions_lock = Lock()
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to back off from a Retry-After header; HTTP-date values are ignored"""
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:
+        return None
+
+
+def _http2_client() -> "httpx.Client":
+    """Create an HTTP/2 client; servers without HTTP/2 are spoken to over HTTP/1.1"""
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        transport=httpx.HTTPTransport(http2=True, retries=3),
+        headers={"User-Agent": "financial-etl-pipeline"}
+    )
+
+
+def _session_for(source_name: str):
+    """
+    Get the keep-alive session shared by all extractors of a source
+    
+    Args:
+        source_name: Name of the data source
+        
+    Returns:
+        Session with pooled connections and retries on transient HTTP errors,
+        or an HTTP/2 httpx.Client for HTTP2_SOURCES when httpx[http2] is installed
+    """
+    with _sessions_lock:
+        session = _sessions.get(source_name)
+        if session is None and httpx is not None and source_name in HTTP2_SOURCES:
+            session = _sessions[source_name] = _http2_client()
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                "User-Agent": "financial-etl-pipeline",
+                "Accept-Encoding": ACCEPT_ENCODING,
+                "Connection": "keep-alive"
+            })
+            adapter = HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=32,
+                max_retries=Retry(total=HTTP_RETRIES, backoff_factor=HTTP_BACKOFF, status_forcelist=sorted(RETRY_STATUSES))
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[source_name] = session
+        return session
+
+
+@atexit.register
+def close_sessions():
+    """Close every shared session so pooled sockets are released"""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
 class BaseExtractor(ABC):
     """Abstract base class for all data extractors"""
     
+    # HTTP session override; by default requests go through the per-source shared session
+    session: Optional[requests.Session] = None
+    
     def __init__(self, source_name: str, api_key: Optional[str] = None):
         """
         Initialize base extractor
@@ -31,7 +135,13 @@ class BaseExtractor(ABC):
             api_key: Optional API key
         """
         self.source_name = source_name
-        self.api_key = api_key
+        # Stored privately: subclasses expose api_key as a read-only property
+        self._api_key = api_key
+    
+    @property
+    def api_key(self) -> Optional[str]:
+        """API key passed to the constructor"""
+        return self._api_key
     
     @abstractmethod
     def extract(self, symbol: str, **kwargs) -> pd.DataFrame:
@@ -54,11 +164,201 @@ class BaseExtractor(ABC):
         Returns:
             Response object
         """
-        # Implementation of HTTP request
-        response = requests.get(endpoint, params=params, **kwargs)
+        http = self.session if self.session is not None else _session_for(self.source_name)
+        kwargs.setdefault("timeout", HTTP_TIMEOUT)
+        if httpx is not None and isinstance(http, httpx.Client):
+            return self._make_http2_request(http, endpoint, params, **kwargs)
+        response = http.get(endpoint, params=params, **kwargs)
+        response.raise_for_status()
+        return response
+    
+    def _make_http2_request(self, client: "httpx.Client", endpoint: str, params: Dict[str, Any], **kwargs):
+        """
+        Make HTTP request over an httpx client, retrying transient HTTP errors
+        
+        Args:
+            client: HTTP/2 client
+            endpoint: API endpoint
+            params: Request parameters
+            
+        Returns:
+            Response object
+        """
+        # httpx reads bodies eagerly, so streaming parsers decode them whole
+        kwargs.pop("stream", None)
+        timeout = kwargs.pop("timeout")
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            timeout = httpx.Timeout(read, connect=connect)
+        
+        for attempt in range(HTTP_RETRIES + 1):
+            response = client.get(endpoint, params=params, timeout=timeout, **kwargs)
+            if response.status_code not in RETRY_STATUSES or attempt == HTTP_RETRIES:
+                break
+            # On 429 every caller of the source waits for the server's Retry-After
+            # (or the next refill), not just this one
+            if response.status_code == 429 and rate_limiter.throttle(
+                self.source_name, _retry_after(response.headers.get("Retry-After"))
+            ):
+                rate_limiter.wait_if_needed(self.source_name)
+            else:
+                time.sleep(HTTP_BACKOFF * 2 ** attempt)
         response.raise_for_status()
         return response
     
+    def _incremental_params(self, endpoint: str, last_extracted: datetime) -> Dict[str, Any]:
+        """
+        Request parameters that make the API return only records after last_extracted
+        
+        Extractors whose APIs support server-side time windows override this;
+        the default pushes nothing down, leaving filtering to the client.
+        
+        Args:
+            endpoint: API endpoint
+            last_extracted: Timestamp of the last extracted record
+            
+        Returns:
+            Parameters to add to the request
+        """
+        return {}
+    
+    def combine_batch_results(
+        self,
+        results: Dict[str, pd.DataFrame],
+        add_item_column: bool = True,
+        item_column_name: str = "item",
+        ignore_index: bool = False
+    ) -> pd.DataFrame:
+        """
+        Combine per-item batch results into a single DataFrame
+        
+        Args:
+            results: Dictionary mapping item to DataFrame
+            add_item_column: Add a column holding each row's item
+            item_column_name: Name of the item column
+            ignore_index: Number the combined rows 0..n-1 instead of keeping each item's index
+            
+        Returns:
+            Combined DataFrame, empty if no item returned data
+        """
+        frames = {item: df for item, df in results.items() if df is not None and not df.empty}
+        if not frames:
+            return pd.DataFrame()
+        
+        if not add_item_column or all(item_column_name in df.columns for df in frames.values()):
+            return pd.concat(frames.values(), sort=False, copy=False, ignore_index=ignore_index)
+        
+        # Let concat build the item labels as an index level, then move it into a column
+        combined = pd.concat(frames, names=[item_column_name], sort=False, copy=False)
+        combined = combined.reset_index(level=0)
+        if ignore_index:
+            combined.index = pd.RangeIndex(len(combined))
+        return combined
+    
+    def _parse_epoch_columns(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """
+        Convert Unix-second columns to UTC timestamps, one vectorized call per column
+        
+        Missing and zero values (APIs report absent events such as a
+        moonrise as 0) become NaT.
+        
+        Args:
+            df: Parsed DataFrame
+            columns: Epoch columns to convert; absent ones are skipped
+            
+        Returns:
+            The same DataFrame, converted in place
+        """
+        for column in columns:
+            if column in df.columns:
+                seconds = pd.to_numeric(df[column], errors="coerce")
+                df[column] = pd.to_datetime(seconds.where(seconds != 0), unit="s", utc=True)
+        return df
+    
+    def _categorize(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """
+        Store label columns that repeat on every row as categoricals
+        
+        Args:
+            df: Parsed DataFrame
+            columns: Label columns to convert; absent ones are skipped
+            
+        Returns:
+            The same DataFrame, converted in place
+        """
+        for column in columns:
+            if column in df.columns:
+                df[column] = df[column].astype("category")
+        return df
+    
+    def _arrow_strings(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """
+        Store free-text columns as Arrow strings instead of one Python object per cell
+        
+        Columns stay object dtype on pandas versions without ArrowDtype. Nulls
+        become pd.NA, so only use this for columns that are always filled.
+        
+        Args:
+            df: Parsed DataFrame
+            columns: Text columns to convert; absent ones are skipped
+            
+        Returns:
+            The same DataFrame, converted in place
+        """
+        if not hasattr(pd, "ArrowDtype"):
+            return df
+        for column in columns:
+            if column in df.columns:
+                df[column] = df[column].astype(pd.ArrowDtype(pa.string()))
+        return df
+    
+    def _parse_json(self, response) -> Any:
+        """
+        Decode a JSON response body, using orjson when it is installed
+        
+        Responses without a raw bytes body (e.g. wrapped or stubbed ones)
+        fall back to their own json() decoder.
+        
+        Args:
+            response: Response object
+            
+        Returns:
+            Decoded JSON payload
+        """
+        content = getattr(response, "content", None)
+        if orjson is not None and isinstance(content, (bytes, bytearray)):
+            return orjson.loads(content)
+        return response.json()
+    
+    def _iter_json_items(self, response, path: str, stream: bool = False) -> Iterator[Any]:
+        """
+        Iterate over the items of the JSON array at a dot-separated path
+        
+        Streamed responses are parsed incrementally with ijson when it is
+        installed, so only one item is resident at a time; otherwise the
+        whole body is decoded first. A missing path yields nothing.
+        
+        Args:
+            response: Response object
+            path: Dot-separated keys leading to the array, e.g. "observations",
+                or "" when the body itself is the array
+            stream: Whether the response was requested with stream=True and
+                its body has not been read yet
+            
+        Returns:
+            Iterator over the array items
+        """
+        if stream and ijson is not None and isinstance(response, requests.Response):
+            response.raw.decode_content = True
+            prefix = f"{path}.item" if path else "item"
+            yield from ijson.items(response.raw, prefix, use_float=True)
+            return
+        
+        data = self._parse_json(response)
+        for key in path.split(".") if path else ():
+            data = data.get(key) if isinstance(data, dict) else None
+        yield from data if isinstance(data, list) else ()
+    
     def _load_source_config(self, source_name: str) -> Dict[str, Any]:
         """
         Load configuration for a specific data source
@@ -85,10 +385,6 @@ class TwelveDataExtractor(BaseExtractor):
         # Load Twelve Data specific configuration
         self.config = self._load_source_config("twelve_data")
         
-        # Set up common API parameters
-        self.api_key = self._get_api_key()
-        self.base_url = self.config.get("base_url", "https://api.twelvedata.com")
-        
         # Common API parameters
         self.default_params = {
             "apikey": self.api_key,
@@ -125,7 +421,7 @@ class TwelveDataExtractor(BaseExtractor):
     
     def _get_api_key(self) -> str:
         """Get API key from settings"""
-        return settings.get("twelve_data.api_key", "")
+        return settings.twelve_data_api_key or ""
     
     def _make_twelve_data_request(
         self,
@@ -149,7 +445,7 @@ class TwelveDataExtractor(BaseExtractor):
             **kwargs
         )
         
-        data = response.json()
+        data = self._parse_json(response)
         
         # Check for Twelve Data specific errors
         if "code" in data and data["code"] != 200:
@@ -1,13 +1,122 @@
 # src/extract/finnhub.py
+import numpy as np
 import pandas as pd
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import time
+from functools import lru_cache
 import pytz
 from .base_extractor import BaseExtractor
 from config.settings import settings
 from ..utils.logger import logger
+from ..utils.extract_cache import ExtractCache, ttl_cached
 from ..utils.rate_limiter import RateLimitConfig, rate_limiter
 
+try:
+    import ciso8601
+except ImportError:  # optional speedup; pandas' parser is the fallback
+    ciso8601 = None
+
+
+# Economic calendar fields and the columns they are renamed to
+CALENDAR_FIELDS = {
+    "id": "event_id",
+    "country": "country",
+    "category": "category",
+    "event": "event",
+    "reference": "reference",
+    "source": "source",
+    "sourceURL": "source_url",
+    "actual": "actual",
+    "previous": "previous",
+    "forecast": "forecast",
+    "unit": "unit",
+    "importance": "importance",
+    "date": "event_date",
+}
+
+# Company profiles change on the order of months; quotes are only shared
+# between calls made within a few seconds (e.g. a dashboard refresh), so
+# they are kept in memory rather than written to disk
+PROFILE_CACHE_TTL = timedelta(days=1)
+QUOTE_CACHE_TTL = timedelta(seconds=5)
+
+# Candle windows that ended more than a day ago no longer change, so they are
+# kept on disk and reused by later runs instead of being downloaded again
+HISTORY_SETTLED_AFTER = timedelta(days=1)
+HISTORY_CACHE_TTL = timedelta(days=30)
+
+# Economic calendar event times, e.g. "2024-01-05 13:30:00"; an explicit
+# format skips per-value format inference
+CALENDAR_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@lru_cache(maxsize=1)
+def _history_cache() -> ExtractCache:
+    return ExtractCache(settings.extract_cache_dir)
+
+
+def _parse_date(value: str) -> Optional[pd.Timestamp]:
+    """Parse a single ISO 8601 date string, returning None when it is not a date"""
+    if ciso8601 is not None:
+        try:
+            return pd.Timestamp(ciso8601.parse_datetime(value))
+        except ValueError:
+            pass
+    parsed = pd.to_datetime(value, errors="coerce")
+    return None if pd.isna(parsed) else parsed
+
+
+# Stock quote fields, the columns they are renamed to and their defaults when missing
+QUOTE_FIELDS = {
+    "c": ("current_price", 0),
+    "d": ("change", 0),
+    "dp": ("percent_change", 0),
+    "h": ("high_price", 0),
+    "l": ("low_price", 0),
+    "o": ("open_price", 0),
+    "pc": ("previous_close", 0),
+    "v": ("volume", 0),
+}
+
+# Company profile fields, the columns they are renamed to and their defaults when missing
+PROFILE_FIELDS = {
+    "name": ("company_name", ""),
+    "exchange": ("exchange", ""),
+    "currency": ("currency", "USD"),
+    "country": ("country", ""),
+    "finnhubIndustry": ("industry", ""),
+    "marketCapitalization": ("market_cap", 0),
+    "shareOutstanding": ("share_outstanding", 0),
+    "weburl": ("web_url", ""),
+    "logo": ("logo_url", ""),
+}
+
+
+def _renamed_fields(data: Dict[str, Any], fields: Dict[str, Tuple[str, Any]]) -> Dict[str, Any]:
+    """Pick the fields of a single-record response, renamed and defaulted per the field table"""
+    return {column: data.get(field, default) for field, (column, default) in fields.items()}
+
+
+# Market news fields, the columns they are renamed to and their defaults when missing
+NEWS_FIELDS = {
+    "id": ("news_id", None),
+    "datetime": ("datetime", None),
+    "headline": ("headline", ""),
+    "summary": ("summary", ""),
+    "source": ("source", ""),
+    "url": ("url", ""),
+    "related": ("related", ""),
+    "image": ("image", ""),
+    "lang": ("lang", "en"),
+    "hasPaywall": ("has_paywall", False),
+}
+
+
+# Free-text news columns, stored as Arrow strings; defaults keep them free of nulls
+NEWS_TEXT_COLUMNS = ["headline", "summary", "source", "url", "related", "image", "lang"]
+
 
 class FinnhubExtractor(BaseExtractor):
     """Finnhub API extractor for financial data"""
@@ -34,6 +143,7 @@ class FinnhubExtractor(BaseExtractor):
     def base_url(self) -> str:
         return self._base_url
     
+    @ttl_cached(QUOTE_CACHE_TTL, cache=ExtractCache(None))
     def extract_stock_quote(
         self,
         symbol: str
@@ -56,7 +166,7 @@ class FinnhubExtractor(BaseExtractor):
         logger.info(f"Extracting stock quote for {symbol}", symbol=symbol)
         
         response = self._make_request(endpoint, params)
-        data = response.json()
+        data = self._parse_json(response)
         
         if not data or 'c' not in data:
             logger.warning(f"No quote data returned for {symbol}", symbol=symbol)
@@ -65,18 +175,12 @@ class FinnhubExtractor(BaseExtractor):
         quote_data = {
             "symbol": symbol,
             "timestamp": datetime.utcnow(),
-            "current_price": data.get('c', 0),
-            "change": data.get('d', 0),
-            "percent_change": data.get('dp', 0),
-            "high_price": data.get('h', 0),
-            "low_price": data.get('l', 0),
-            "open_price": data.get('o', 0),
-            "previous_close": data.get('pc', 0),
-            "volume": data.get('v', 0)
+            **_renamed_fields(data, QUOTE_FIELDS)
         }
         
         return pd.DataFrame([quote_data])
     
+    @ttl_cached(PROFILE_CACHE_TTL)
     def extract_company_profile(
         self,
         symbol: str
@@ -99,7 +203,7 @@ class FinnhubExtractor(BaseExtractor):
         logger.info(f"Extracting company profile for {symbol}", symbol=symbol)
         
         response = self._make_request(endpoint, params)
-        data = response.json()
+        data = self._parse_json(response)
         
         if not data or 'name' not in data:
             logger.warning(f"No profile data returned for {symbol}", symbol=symbol)
@@ -107,16 +211,8 @@ class FinnhubExtractor(BaseExtractor):
         
         profile_data = {
             "symbol": symbol,
-            "company_name": data.get('name', ''),
-            "exchange": data.get('exchange', ''),
-            "currency": data.get('currency', 'USD'),
-            "country": data.get('country', ''),
-            "industry": data.get('finnhubIndustry', ''),
-            "market_cap": data.get('marketCapitalization', 0),
-            "share_outstanding": data.get('shareOutstanding', 0),
-            "web_url": data.get('weburl', ''),
-            "logo_url": data.get('logo', ''),
-            "ipo_date": pd.to_datetime(data.get('ipo', '')) if data.get('ipo') else None,
+            **_renamed_fields(data, PROFILE_FIELDS),
+            "ipo_date": _parse_date(data['ipo']) if data.get('ipo') else None,
             "extracted_at": datetime.utcnow()
         }
         
@@ -156,34 +252,29 @@ class FinnhubExtractor(BaseExtractor):
             end_date=end_date.isoformat()
         )
         
-        response = self._make_request(endpoint, params)
-        data = response.json()
+        # Wide date ranges return megabytes of events, so they are read off the
+        # stream one at a time into column lists
+        response = self._make_request(endpoint, params, stream=True)
+        columns = {field: [] for field in CALENDAR_FIELDS}
+        try:
+            for event in self._iter_json_items(response, 'economicCalendar', stream=True):
+                for field, values in columns.items():
+                    values.append(event.get(field))
+        finally:
+            response.close()
         
-        if not data or 'economicCalendar' not in data:
+        if not columns['date']:
             logger.warning("No economic calendar data returned")
             return pd.DataFrame()
         
-        events = []
-        for event in data['economicCalendar']:
-            event_data = {
-                "event_id": event.get('id'),
-                "country": event.get('country'),
-                "category": event.get('category'),
-                "event": event.get('event'),
-                "reference": event.get('reference'),
-                "source": event.get('source'),
-                "source_url": event.get('sourceURL'),
-                "actual": event.get('actual'),
-                "previous": event.get('previous'),
-                "forecast": event.get('forecast'),
-                "unit": event.get('unit'),
-                "importance": event.get('importance'),
-                "event_date": pd.to_datetime(event.get('date'), utc=True) if event.get('date') else None,
-                "extracted_at": datetime.utcnow()
-            }
-            events.append(event_data)
-        
-        return pd.DataFrame(events)
+        # Convert dates for the whole column in one pass
+        events = pd.DataFrame(columns).rename(columns=CALENDAR_FIELDS)
+        events["event_date"] = pd.to_datetime(
+            events["event_date"], format=CALENDAR_DATE_FORMAT, utc=True, errors="coerce"
+        )
+        events["extracted_at"] = datetime.utcnow()
+        
+        return events
     
     def extract_stock_candles(
         self,
@@ -231,29 +322,131 @@ class FinnhubExtractor(BaseExtractor):
             end_date=end_date.isoformat()
         )
         
+        cache_key = None
+        if to_timestamp <= time.time() - HISTORY_SETTLED_AFTER.total_seconds():
+            cache_key = (self.source_name, symbol, f"{resolution}_{from_timestamp}_{to_timestamp}")
+            cached = _history_cache().get(cache_key, ttl=HISTORY_CACHE_TTL)
+            if cached is not None:
+                return cached.copy()
+        
         response = self._make_request(endpoint, params)
-        data = response.json()
+        data = self._parse_json(response)
         
         if data.get('s') != 'ok' or 't' not in data:
             logger.warning(f"No candle data returned for {symbol}", symbol=symbol)
             return pd.DataFrame()
         
-        candles = []
-        for i in range(len(data['t'])):
-            candle_data = {
-                "symbol": symbol,
-                "timestamp": pd.to_datetime(data['t'][i], unit='s', utc=True),
-                "open": data['o'][i],
-                "high": data['h'][i],
-                "low": data['l'][i],
-                "close": data['c'][i],
-                "volume": data.get('v', [])[i] if 'v' in data else 0,
-                "resolution": resolution,
-                "extracted_at": datetime.utcnow()
-            }
-            candles.append(candle_data)
-        
-        return pd.DataFrame(candles)
+        # Candle fields arrive as parallel arrays, so convert each one in a single pass
+        # with a fixed dtype (missing prices become NaN rather than object columns);
+        # the repeated labels are stored once as categoricals
+        rows = pd.RangeIndex(len(data['t']))
+        volume = data.get('v')
+        candles = pd.DataFrame({
+            "symbol": pd.Categorical.from_codes(np.zeros(len(rows), dtype=np.int8), [symbol]),
+            "timestamp": pd.to_datetime(np.asarray(data['t'], dtype=np.int64), unit='s', utc=True),
+            "open": np.asarray(data['o'], dtype=np.float64),
+            "high": np.asarray(data['h'], dtype=np.float64),
+            "low": np.asarray(data['l'], dtype=np.float64),
+            "close": np.asarray(data['c'], dtype=np.float64),
+            "volume": np.asarray(volume, dtype=np.int64) if volume else np.zeros(len(rows), dtype=np.int64),
+            "resolution": pd.Categorical.from_codes(np.zeros(len(rows), dtype=np.int8), [resolution]),
+            "extracted_at": datetime.utcnow()
+        }, index=rows, copy=False)
+        
+        if cache_key is None:
+            return candles
+        _history_cache().put(cache_key, candles)
+        return candles.copy()
+    
+    def extract_stock_candles_batch(
+        self,
+        symbols: List[str],
+        resolution: str = "D",
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        max_workers: int = 8
+    ) -> pd.DataFrame:
+        """
+        Extract stock candle data for multiple symbols concurrently
+        
+        Args:
+            symbols: Stock symbols
+            resolution: Data resolution (1, 5, 15, 30, 60, D, W, M)
+            start_date: Start timestamp
+            end_date: End timestamp
+            max_workers: Maximum number of concurrent requests
+        
+        Returns:
+            DataFrame with candle data for every symbol that returned any
+        """
+        return self._extract_batch(
+            lambda symbol: self.extract_stock_candles(symbol, resolution, start_date, end_date),
+            symbols, max_workers, "candles"
+        )
+    
+    def extract_stock_quote_batch(self, symbols: List[str], max_workers: int = 8) -> pd.DataFrame:
+        """
+        Extract real-time quotes for multiple symbols concurrently
+        
+        Args:
+            symbols: Stock symbols
+            max_workers: Maximum number of concurrent requests
+        
+        Returns:
+            DataFrame with one quote row per symbol that returned one
+        """
+        return self._extract_batch(self.extract_stock_quote, symbols, max_workers, "quote")
+    
+    def extract_company_profile_batch(self, symbols: List[str], max_workers: int = 8) -> pd.DataFrame:
+        """
+        Extract company profiles for multiple symbols concurrently
+        
+        Args:
+            symbols: Stock symbols
+            max_workers: Maximum number of concurrent requests
+        
+        Returns:
+            DataFrame with one profile row per symbol that returned one
+        """
+        return self._extract_batch(self.extract_company_profile, symbols, max_workers, "profile")
+    
+    def _extract_batch(
+        self,
+        extract: Callable[[str], pd.DataFrame],
+        symbols: List[str],
+        max_workers: int,
+        kind: str
+    ) -> pd.DataFrame:
+        """
+        Run a per-symbol extraction for every symbol on a thread pool
+        
+        Args:
+            extract: Per-symbol extraction method
+            symbols: Stock symbols
+            max_workers: Maximum number of concurrent requests
+            kind: Data kind, used in error logs
+        
+        Returns:
+            Combined DataFrame; failed symbols are logged and skipped
+        """
+        def extract_one(symbol: str) -> pd.DataFrame:
+            # Concurrent requests still share the source's per-minute quota
+            rate_limiter.wait_if_needed(self.source_name)
+            try:
+                return extract(symbol)
+            except Exception as e:
+                logger.error(f"Failed to extract {kind} for {symbol}", exc_info=e, symbol=symbol)
+                return pd.DataFrame()
+        
+        if not symbols:
+            return pd.DataFrame()
+        
+        # Each symbol is an independent request, so wall time is roughly the slowest one
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols)))) as pool:
+            results = dict(zip(symbols, pool.map(extract_one, symbols)))
+        
+        # Per-symbol frames are all numbered from 0, so renumber the combined rows
+        return self.combine_batch_results(results, item_column_name="symbol", ignore_index=True)
     
     def extract_market_news(
         self,
@@ -282,32 +475,31 @@ class FinnhubExtractor(BaseExtractor):
         
         logger.info(f"Extracting market news", category=category, min_id=min_id)
         
-        response = self._make_request(endpoint, params)
-        data = response.json()
-        
-        if not data:
+        # News pages are read off the stream one item at a time into column lists
+        response = self._make_request(endpoint, params, stream=True)
+        columns = {field: [] for field in NEWS_FIELDS}
+        try:
+            for item in self._iter_json_items(response, '', stream=True):
+                for field, (_, default) in NEWS_FIELDS.items():
+                    value = item.get(field)
+                    columns[field].append(default if value is None else value)
+        finally:
+            response.close()
+        
+        if not columns['id']:
             logger.warning(f"No news data returned for category {category}")
             return pd.DataFrame()
         
-        news_items = []
-        for item in data:
-            news_data = {
-                "news_id": item.get('id'),
-                "category": category,
-                "datetime": pd.to_datetime(item.get('datetime'), unit='s', utc=True) if item.get('datetime') else None,
-                "headline": item.get('headline', ''),
-                "summary": item.get('summary', ''),
-                "source": item.get('source', ''),
-                "url": item.get('url', ''),
-                "related": item.get('related', ''),
-                "image": item.get('image', ''),
-                "lang": item.get('lang', 'en'),
-                "has_paywall": item.get('hasPaywall', False),
-                "extracted_at": datetime.utcnow()
-            }
-            news_items.append(news_data)
-        
-        return pd.DataFrame(news_items)
+        # Convert times for the whole column in one pass
+        news = pd.DataFrame(columns).rename(
+            columns={field: column for field, (column, _) in NEWS_FIELDS.items()}
+        )
+        news.insert(1, "category", category)
+        news = self._parse_epoch_columns(news, ["datetime"])
+        news = self._arrow_strings(news, NEWS_TEXT_COLUMNS)
+        news["extracted_at"] = datetime.utcnow()
+        
+        return news
     
     def _parse_response(self, data: Dict[str, Any]) -> pd.DataFrame:
         """
@@ -334,13 +526,18 @@ class FinnhubExtractor(BaseExtractor):
                 params = {}
             params["token"] = self.api_key
             
+            # Let the API skip already-extracted records; explicit caller params win
+            if last_extracted:
+                for key, value in self._incremental_params(endpoint, last_extracted).items():
+                    params.setdefault(key, value)
+            
             response = self._make_request(endpoint, params)
-            data = response.json()
+            data = self._parse_json(response)
             
             # Parse based on endpoint
             df = self._parse_endpoint_response(endpoint, data)
             
-            # Apply incremental filtering
+            # Apply incremental filtering (server-side windows are inclusive of last_extracted)
             if last_extracted and incremental_field in df.columns:
                 df = df[df[incremental_field] > last_extracted]
                 logger.info(
@@ -361,6 +558,12 @@ class FinnhubExtractor(BaseExtractor):
             )
             raise
     
+    def _incremental_params(self, endpoint: str, last_extracted: datetime) -> Dict[str, Any]:
+        """Candle endpoints accept a `from` Unix timestamp"""
+        if endpoint.endswith("/candle"):
+            return {"from": int(last_extracted.timestamp())}
+        return {}
+    
     def _parse_endpoint_response(self, endpoint: str, data: Dict[str, Any]) -> pd.DataFrame:
         """Parse response based on endpoint"""
         # This is handled by specific methods above
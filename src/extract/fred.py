@@ -1,6 +1,7 @@
 # src/extract/fred.py
 import pandas as pd
 from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import xml.etree.ElementTree as ET
 import requests
@@ -10,6 +11,10 @@ from ..utils.logger import logger
 from ..utils.rate_limiter import RateLimitConfig, rate_limiter
 
 
+# Date-only columns of series listings (search, category)
+SERIES_DATE_COLUMNS = ('realtime_start', 'realtime_end', 'observation_start', 'observation_end')
+
+
 class FREDExtractor(BaseExtractor):
     """FRED (Federal Reserve Economic Data) API extractor"""
     
@@ -79,78 +84,87 @@ class FREDExtractor(BaseExtractor):
             end_date=end_date.isoformat() if end_date else None
         )
         
-        response = self._make_request(endpoint, params)
-        data = response.json()
-        
-        if 'observations' not in data:
+        # Full histories run to tens of thousands of observations, so they are
+        # read off the stream one at a time into column lists
+        response = self._make_request(endpoint, params, stream=True)
+        observations = {'date': [], 'value': [], 'realtime_start': [], 'realtime_end': []}
+        try:
+            for obs in self._iter_json_items(response, 'observations', stream=True):
+                # Missing values are reported as '.'
+                if obs.get('value') != '.':
+                    for column, values in observations.items():
+                        values.append(obs.get(column))
+        finally:
+            response.close()
+        
+        if not observations['date']:
             logger.warning(f"No observations returned for series {series_id}", series_id=series_id)
             return pd.DataFrame()
         
-        observations = []
-        for obs in data['observations']:
-            # Skip if value is a dot (.)
-            if obs['value'] == '.':
-                continue
-                
-            try:
-                obs_data = {
-                    "series_id": series_id,
-                    "date": pd.to_datetime(obs['date']),
-                    "value": float(obs['value']),
-                    "realtime_start": pd.to_datetime(obs['realtime_start']),
-                    "realtime_end": pd.to_datetime(obs['realtime_end']),
-                    "extracted_at": datetime.utcnow()
-                }
-                observations.append(obs_data)
-            except (ValueError, KeyError) as e:
-                logger.warning(
-                    f"Failed to parse observation for {series_id}",
-                    series_id=series_id,
-                    date=obs.get('date'),
-                    value=obs.get('value'),
-                    error=str(e)
-                )
-                continue
-        
-        return pd.DataFrame(observations)
+        # Parse whole columns at once
+        observations = pd.DataFrame(observations)
+        df = pd.DataFrame({
+            "series_id": pd.Series(series_id, index=observations.index, dtype="category"),
+            "date": pd.to_datetime(observations['date'], format='%Y-%m-%d', errors='coerce'),
+            "value": pd.to_numeric(observations['value'], errors='coerce'),
+            "realtime_start": pd.to_datetime(observations['realtime_start'], format='%Y-%m-%d', errors='coerce'),
+            "realtime_end": pd.to_datetime(observations['realtime_end'], format='%Y-%m-%d', errors='coerce'),
+            "extracted_at": datetime.utcnow()
+        })
+        
+        unparsed = df[['date', 'value', 'realtime_start', 'realtime_end']].isna().any(axis=1)
+        if unparsed.any():
+            logger.warning(
+                f"Failed to parse {int(unparsed.sum())} observations for {series_id}",
+                series_id=series_id,
+                dates=observations.loc[unparsed, 'date'].tolist()
+            )
+            df = df[~unparsed].reset_index(drop=True)
+        
+        return df
     
     def extract_multiple_series(
         self,
         series_ids: List[str],
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        max_workers: int = 8
     ) -> Dict[str, pd.DataFrame]:
         """
-        Extract multiple economic series
+        Extract multiple economic series concurrently
         
         Args:
             series_ids: List of FRED series IDs
             start_date: Start date for data
             end_date: End date for data
+            max_workers: Maximum number of concurrent requests
         
         Returns:
-            Dictionary mapping series_id to DataFrame
+            Dictionary mapping series_id to DataFrame, in input order
         """
-        results = {}
-        
-        for series_id in series_ids:
+        def extract_one(series_id: str) -> pd.DataFrame:
             try:
                 df = self.extract_series(series_id, start_date, end_date)
-                results[series_id] = df
                 logger.info(
                     f"Extracted {len(df)} records for series {series_id}",
                     series_id=series_id,
                     record_count=len(df)
                 )
+                return df
             except Exception as e:
                 logger.error(
                     f"Failed to extract series {series_id}",
                     exc_info=e,
                     series_id=series_id
                 )
-                results[series_id] = pd.DataFrame()
+                return pd.DataFrame()
+        
+        if not series_ids:
+            return {}
         
-        return results
+        # Each series is an independent request; overlap them on the shared session's connection pool
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(series_ids)))) as pool:
+            return dict(zip(series_ids, pool.map(extract_one, series_ids)))
     
     def search_series(
         self,
@@ -185,36 +199,37 @@ class FREDExtractor(BaseExtractor):
         logger.info(f"Searching FRED for: {search_text}", search_text=search_text, limit=limit)
         
         response = self._make_request(endpoint, params)
-        data = response.json()
+        data = self._parse_json(response)
         
         if 'seriess' not in data:
             logger.warning(f"No search results for: {search_text}")
             return pd.DataFrame()
         
         search_results = []
+        extracted_at = datetime.utcnow()
         for series in data['seriess']:
             result_data = {
                 "series_id": series.get('id'),
-                "realtime_start": pd.to_datetime(series.get('realtime_start')),
-                "realtime_end": pd.to_datetime(series.get('realtime_end')),
+                "realtime_start": series.get('realtime_start'),
+                "realtime_end": series.get('realtime_end'),
                 "title": series.get('title'),
-                "observation_start": pd.to_datetime(series.get('observation_start')),
-                "observation_end": pd.to_datetime(series.get('observation_end')),
+                "observation_start": series.get('observation_start'),
+                "observation_end": series.get('observation_end'),
                 "frequency": series.get('frequency'),
                 "frequency_short": series.get('frequency_short'),
                 "units": series.get('units'),
                 "units_short": series.get('units_short'),
                 "seasonal_adjustment": series.get('seasonal_adjustment'),
                 "seasonal_adjustment_short": series.get('seasonal_adjustment_short'),
-                "last_updated": pd.to_datetime(series.get('last_updated')),
+                "last_updated": series.get('last_updated'),
                 "popularity": series.get('popularity'),
                 "group_popularity": series.get('group_popularity'),
                 "notes": series.get('notes'),
-                "extracted_at": datetime.utcnow()
+                "extracted_at": extracted_at
             }
             search_results.append(result_data)
         
-        return pd.DataFrame(search_results)
+        return self._parse_series_dates(pd.DataFrame(search_results))
     
     def extract_series_info(
         self,
@@ -240,7 +255,7 @@ class FREDExtractor(BaseExtractor):
         logger.info(f"Extracting series info for {series_id}", series_id=series_id)
         
         response = self._make_request(endpoint, params)
-        data = response.json()
+        data = self._parse_json(response)
         
         if 'seriess' not in data or len(data['seriess']) == 0:
             logger.warning(f"No series info found for {series_id}", series_id=series_id)
@@ -295,13 +310,14 @@ class FREDExtractor(BaseExtractor):
         logger.info(f"Extracting series for category {category_id}", category_id=category_id)
         
         response = self._make_request(endpoint, params)
-        data = response.json()
+        data = self._parse_json(response)
         
         if 'seriess' not in data:
             logger.warning(f"No series found for category {category_id}")
             return pd.DataFrame()
         
         category_series = []
+        extracted_at = datetime.utcnow()
         for series in data['seriess']:
             series_data = {
                 "series_id": series.get('id'),
@@ -310,16 +326,26 @@ class FREDExtractor(BaseExtractor):
                 "frequency": series.get('frequency'),
                 "units": series.get('units'),
                 "seasonal_adjustment": series.get('seasonal_adjustment'),
-                "realtime_start": pd.to_datetime(series.get('realtime_start')),
-                "realtime_end": pd.to_datetime(series.get('realtime_end')),
-                "observation_start": pd.to_datetime(series.get('observation_start')),
-                "observation_end": pd.to_datetime(series.get('observation_end')),
+                "realtime_start": series.get('realtime_start'),
+                "realtime_end": series.get('realtime_end'),
+                "observation_start": series.get('observation_start'),
+                "observation_end": series.get('observation_end'),
                 "popularity": series.get('popularity'),
-                "extracted_at": datetime.utcnow()
+                "extracted_at": extracted_at
             }
             category_series.append(series_data)
         
-        return pd.DataFrame(category_series)
+        return self._parse_series_dates(pd.DataFrame(category_series))
+    
+    def _parse_series_dates(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert series listing date columns in one vectorized call each"""
+        for column in SERIES_DATE_COLUMNS:
+            if column in df.columns:
+                df[column] = pd.to_datetime(df[column], format='%Y-%m-%d', errors='coerce')
+        if 'last_updated' in df.columns:
+            # Offsets vary with daylight saving (e.g. -05/-06), so normalize to UTC
+            df['last_updated'] = pd.to_datetime(df['last_updated'], utc=True, errors='coerce')
+        return df
     
     def _parse_response(self, data: Dict[str, Any]) -> pd.DataFrame:
         """
@@ -333,7 +359,7 @@ class FREDExtractor(BaseExtractor):
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-        method: str = "GET"
+        **kwargs
     ) -> requests.Response:
         """
         Override to handle FRED-specific API requirements
@@ -345,4 +371,4 @@ class FREDExtractor(BaseExtractor):
         if 'file_type' not in params:
             params['file_type'] = 'json'
         
-        return super()._make_request(endpoint, params, method)
\ No newline at end of file
+        return super()._make_request(endpoint, params, **kwargs)
\ No newline at end of file
@@ -2,15 +2,34 @@ import os
 import requests
 import time
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
 load_dotenv()
 
 API_KEY = os.getenv("POLYGON_API_KEY")
 BASE_URL = "https://api.polygon.io"
 
+# Polygon aggregate bar fields and the Arrow types they are read as
+AGGREGATE_SCHEMA = pa.schema([
+    ("t", pa.int64()),     # Bar start, epoch milliseconds
+    ("o", pa.float64()),
+    ("h", pa.float64()),
+    ("l", pa.float64()),
+    ("c", pa.float64()),
+    ("v", pa.float64()),   # Forex might not have volume
+    ("vw", pa.float64()),  # Volume weighted average price
+    ("n", pa.int64()),     # Number of transactions
+])
+
 
 class PolygonFreeExtractor:
     """
@@ -32,6 +51,11 @@ class PolygonFreeExtractor:
         self.calls_made = 0
         self.last_call_time = None
         
+        # Keep-alive session so calls after the first skip the TCP/TLS handshake;
+        # retries stay in _get, which also handles the 429 back-off
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": "financial-etl-pipeline"})
+        
     def _rate_limit_check(self):
         """Ensure we don't exceed 5 calls/minute"""
         if self.last_call_time:
@@ -72,7 +96,7 @@ def _get_mock(self, endpoint: str, params: Dict[str, Any]) -> Dict:
             try:
                 self._rate_limit_check()
                 
-                response = requests.get(
+                response = self.session.get(
                     self.base_url + endpoint,
                     params=params,
                     timeout=30
@@ -95,6 +119,9 @@ def _get_mock(self, endpoint: str, params: Dict[str, Any]) -> Dict:
                     else:
                         raise Exception(error_msg)
                 
+                # Decode straight from bytes, skipping requests' text decode
+                if orjson is not None and isinstance(response.content, (bytes, bytearray)):
+                    return orjson.loads(response.content)
                 return response.json()
                 
             except requests.exceptions.Timeout:
@@ -116,6 +143,29 @@ def _get_mock(self, endpoint: str, params: Dict[str, Any]) -> Dict:
     # STOCK DATA
     # -----------------------
     
+    def _aggregates_table(self, results: List[Dict[str, Any]], symbol: str, time_column: str) -> pa.Table:
+        """Build an OHLCV Arrow table from Polygon aggregate bars without a pandas round trip"""
+        bars = pa.Table.from_pylist(results, schema=AGGREGATE_SCHEMA)
+        labels = pa.repeat(pa.scalar(0, pa.int32()), bars.num_rows)
+        return pa.table({
+            time_column: bars["t"].cast(pa.timestamp("ms", tz="UTC")).cast(pa.timestamp("ns", tz="UTC")),
+            # Repeated labels are dictionary-encoded (categoricals in pandas)
+            "symbol": pa.DictionaryArray.from_arrays(labels, pa.array([symbol])),
+            "open": bars["o"],
+            "high": bars["h"],
+            "low": bars["l"],
+            "close": bars["c"],
+            "volume": pc.fill_null(bars["v"], 0.0),
+            "vwap": bars["vw"],
+            "transactions": bars["n"],
+            "source": pa.DictionaryArray.from_arrays(labels, pa.array([self.source_name])),
+            "extracted_at": pa.repeat(pa.scalar(datetime.now(timezone.utc), pa.timestamp("us", tz="UTC")), bars.num_rows)
+        })
+    
+    def _parse_aggregates(self, results: List[Dict[str, Any]], symbol: str, time_column: str) -> pd.DataFrame:
+        """Build an OHLCV frame from Polygon aggregate bars via Arrow"""
+        return self._aggregates_table(results, symbol, time_column).to_pandas()
+    
     def get_stock(self, symbol: str, days: int = 180) -> pd.DataFrame:
         """
         Extract daily stock data
@@ -146,24 +196,7 @@ def _get_mock(self, endpoint: str, params: Dict[str, Any]) -> Dict:
                 print(f"Warning: No data returned for {symbol}")
                 return pd.DataFrame()
             
-            # Parse results
-            rows = []
-            for bar in data["results"]:
-                rows.append({
-                    "date": datetime.fromtimestamp(bar["t"] / 1000, tz=timezone.utc),
-                    "symbol": symbol,
-                    "open": bar["o"],
-                    "high": bar["h"],
-                    "low": bar["l"],
-                    "close": bar["c"],
-                    "volume": bar["v"],
-                    "vwap": bar.get("vw"),  # Volume weighted average price
-                    "transactions": bar.get("n"),  # Number of transactions
-                    "source": self.source_name,
-                    "extracted_at": datetime.now(timezone.utc)
-                })
-            
-            df = pd.DataFrame(rows)
+            df = self._parse_aggregates(data["results"], symbol, "date")
             
             # Sort by date
             df = df.sort_values("date", ascending=False).reset_index(drop=True)
@@ -244,24 +277,7 @@ def _get_mock(self, endpoint: str, params: Dict[str, Any]) -> Dict:
                 print(f"Warning: No data returned for {pair}")
                 return pd.DataFrame()
             
-            # Parse results
-            rows = []
-            for bar in data["results"]:
-                rows.append({
-                    "timestamp": datetime.fromtimestamp(bar["t"] / 1000, tz=timezone.utc),
-                    "symbol": pair,
-                    "open": bar["o"],
-                    "high": bar["h"],
-                    "low": bar["l"],
-                    "close": bar["c"],
-                    "volume": bar.get("v", 0),  # Forex might not have volume
-                    "vwap": bar.get("vw"),
-                    "transactions": bar.get("n"),
-                    "source": self.source_name,
-                    "extracted_at": datetime.now(timezone.utc)
-                })
-            
-            df = pd.DataFrame(rows)
+            df = self._parse_aggregates(data["results"], pair, "timestamp")
             df = df.sort_values("timestamp", ascending=False).reset_index(drop=True)
             
             print(f"✓ Extracted {len(df)} records for {pair}")
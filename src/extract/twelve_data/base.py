@@ -1,19 +1,63 @@
 # src/extract/twelve_data/base.py
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import timedelta
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
 
 from src.utils.logger import logger
 from src.utils.rate_limiter import rate_limiter
 from config.settings import settings
-from ..base_extractor import BaseExtractor, ExtractionError   
+from ..base_extractor import ACCEPT_ENCODING, BaseExtractor, ExtractionError
+
+
+# Concurrent batches across asset types can have this many requests in flight
+SESSION_POOL_SIZE = 32
+
+# Symbol catalogs (stocks, forex pairs, ...) rarely change within a day
+METADATA_CACHE_TTL = timedelta(days=1)
+
+# Intervals accepted by the time_series endpoint
+TIME_SERIES_INTERVALS = (
+    "1min", "5min", "15min", "30min", "45min",
+    "1h", "2h", "4h", "1day", "1week", "1month"
+)
+
+
+def _twelve_data_error(data: Any) -> Optional[Tuple[int, str]]:
+    """
+    Detect a Twelve Data error payload
+    
+    Args:
+        data: Decoded JSON response
+        
+    Returns:
+        (code, message) for an error payload, None for a successful one
+    """
+    # Successful list responses are never error payloads; skip the membership scan
+    if type(data) is not dict:
+        return None
+    code = data.get("code")
+    if code is None or code == 200:
+        return None
+    return code, data.get("message", "Unknown error")
+
+
+def _build_session() -> requests.Session:
+    """Create a keep-alive session with room for concurrent batch requests"""
+    session = requests.Session()
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    session.mount("https://", HTTPAdapter(pool_maxsize=SESSION_POOL_SIZE))
+    return session
 
 
 class TwelveDataExtractor(BaseExtractor):
+    # Shared by every Twelve Data extractor so batches reuse pooled keep-alive connections
+    session = _build_session()
+    
     def __init__(self):
         super().__init__(source_name="twelve_data")
         self.config = self._load_source_config("twelve_data")
-        self.api_key = settings.get("twelve_data.api_key", "")
-        self.base_url = self.config.get("base_url", "https://api.twelvedata.com")
         
         self.default_params = {
             "apikey": self.api_key,
@@ -51,7 +95,7 @@ class TwelveDataExtractor(BaseExtractor):
     
     def _get_api_key(self) -> str:
         """Get API key from settings"""
-        return settings.get("twelve_data.api_key", "")
+        return settings.twelve_data_api_key or ""
     
     def _make_twelve_data_request(
         self,
@@ -75,14 +119,15 @@ class TwelveDataExtractor(BaseExtractor):
             **kwargs
         )
         
-        data = response.json()
+        data = self._parse_json(response)
         
         # Check for Twelve Data specific errors
-        if "code" in data and data["code"] != 200:
-            error_message = data.get("message", "Unknown error")
+        error = _twelve_data_error(data)
+        if error is not None:
+            code, error_message = error
             
             # Handle rate limiting
-            if data["code"] == 429:
+            if code == 429:
                 logger.warning(
                     "Rate limit exceeded for Twelve Data",
                     source=self.source_name,
@@ -207,10 +252,7 @@ class TwelveDataExtractor(BaseExtractor):
         Returns:
             List of interval strings
         """
-        return [
-            "1min", "5min", "15min", "30min", "45min",
-            "1h", "2h", "4h", "1day", "1week", "1month"
-        ]
+        return list(TIME_SERIES_INTERVALS)
     
     def validate_symbol(self, symbol: str) -> bool:
         """
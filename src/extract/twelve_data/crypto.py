@@ -5,8 +5,10 @@ from typing import Dict, List, Any, Optional, Union
 from datetime import datetime, timedelta
 import pandas as pd
 
+from .base import METADATA_CACHE_TTL
 from .time_series import TwelveDataTimeSeriesExtractor
 from src.utils.logger import logger
+from src.utils.extract_cache import ttl_cached
 
 
 class TwelveDataCryptoExtractor(TwelveDataTimeSeriesExtractor):
@@ -28,6 +30,7 @@ class TwelveDataCryptoExtractor(TwelveDataTimeSeriesExtractor):
         ])
         self.default_quote_currency = self.crypto_config.get("default_quote_currency", "USD")
     
+    @ttl_cached(METADATA_CACHE_TTL)
     def get_cryptocurrencies(self) -> pd.DataFrame:
         """
         Get all available cryptocurrencies
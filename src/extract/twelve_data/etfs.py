@@ -4,7 +4,9 @@ from datetime import datetime, timedelta
 import pandas as pd
 
 from .time_series import TwelveDataTimeSeriesExtractor
+from .base import METADATA_CACHE_TTL
 from ...utils.logger import logger
+from ...utils.extract_cache import ttl_cached
 
 
 class TwelveDataETFExtractor(TwelveDataTimeSeriesExtractor):
@@ -25,6 +27,7 @@ class TwelveDataETFExtractor(TwelveDataTimeSeriesExtractor):
             "ARKK", "XLF", "XLK", "XLE", "XLV"
         ])
     
+    @ttl_cached(METADATA_CACHE_TTL)
     def get_etfs_list(self) -> pd.DataFrame:
         """
         Get list of available ETFs
@@ -148,6 +151,7 @@ class TwelveDataIndexExtractor(TwelveDataTimeSeriesExtractor):
             "AXJO"   # ASX 200
         ])
     
+    @ttl_cached(METADATA_CACHE_TTL)
     def get_indices_list(self) -> pd.DataFrame:
         """
         Get list of available indices
@@ -8,7 +8,9 @@ import numpy as np
 import time  # Add this import for the market summary function
 
 from .time_series import TwelveDataTimeSeriesExtractor
+from .base import METADATA_CACHE_TTL
 from ...utils.logger import logger
+from ...utils.extract_cache import ttl_cached
 
 
 class TwelveDataETFExtractor(TwelveDataTimeSeriesExtractor):
@@ -35,6 +37,7 @@ class TwelveDataETFExtractor(TwelveDataTimeSeriesExtractor):
             "innovative": ["ARKK", "ARKG", "ARKF"]
         }
     
+    @ttl_cached(METADATA_CACHE_TTL)
     def get_etfs_list(self) -> pd.DataFrame:
         """
         Get list of available ETFs
@@ -325,6 +328,7 @@ class TwelveDataIndexExtractor(TwelveDataTimeSeriesExtractor):
             "VIX": {"name": "CBOE Volatility Index", "region": "US", "type": "volatility"}
         }
     
+    @ttl_cached(METADATA_CACHE_TTL)
     def get_indices_list(self) -> pd.DataFrame:
         """
         Get list of available indices
@@ -559,6 +563,7 @@ class TwelveDataIndexExtractor(TwelveDataTimeSeriesExtractor):
         )
         
         summary_data = []
+        extracted_at = datetime.now()
         
         for symbol in self.default_indices:
             try:
@@ -572,8 +577,8 @@ class TwelveDataIndexExtractor(TwelveDataTimeSeriesExtractor):
                         'last_price': quote_df['close'].iloc[0],
                         'change': quote_df['change'].iloc[0] if 'change' in quote_df.columns else None,
                         'percent_change': quote_df['percent_change'].iloc[0] if 'percent_change' in quote_df.columns else None,
-                        'timestamp': quote_df['timestamp'].iloc[0] if 'timestamp' in quote_df.columns else datetime.now(),
-                        'extracted_at': datetime.now()
+                        'timestamp': quote_df['timestamp'].iloc[0] if 'timestamp' in quote_df.columns else extracted_at,
+                        'extracted_at': extracted_at
                     }
                     summary_data.append(summary_row)
                 
@@ -1,8 +1,10 @@
 
 
 # src/extract/twelve_data/factory.py
+import os
 from typing import Dict, Any, Optional
 from enum import Enum
+from functools import lru_cache
 
 from .forex import TwelveDataForexExtractor
 from .stocks import TwelveDataStockExtractor
@@ -23,6 +25,26 @@ class AssetType(Enum):
     ALL = "all"
 
 
+_EXTRACTOR_CLASSES = {
+    AssetType.FOREX: TwelveDataForexExtractor,
+    AssetType.STOCK: TwelveDataStockExtractor,
+    AssetType.CRYPTO: TwelveDataCryptoExtractor,
+    AssetType.ETF: TwelveDataETFExtractor,
+    AssetType.INDEX: TwelveDataIndexExtractor,
+    AssetType.ALL: TwelveDataTimeSeriesExtractor
+}
+
+
+@lru_cache(maxsize=16)
+def _cached_extractor(asset_type: AssetType, api_key: str):
+    """Build one extractor per asset type and API key; they hold no per-call state"""
+    logger.info(
+        f"Creating {asset_type.value} extractor",
+        asset_type=asset_type.value
+    )
+    return _EXTRACTOR_CLASSES[asset_type]()
+
+
 class TwelveDataExtractorFactory:
     """
     Factory for creating Twelve Data extractors
@@ -37,27 +59,12 @@ class TwelveDataExtractorFactory:
             asset_type: Type of asset to extract
             
         Returns:
-            Appropriate extractor instance
+            Appropriate extractor instance, shared by later calls with the same API key
         """
-        extractor_map = {
-            AssetType.FOREX: TwelveDataForexExtractor,
-            AssetType.STOCK: TwelveDataStockExtractor,
-            AssetType.CRYPTO: TwelveDataCryptoExtractor,
-            AssetType.ETF: TwelveDataETFExtractor,
-            AssetType.INDEX: TwelveDataIndexExtractor,
-            AssetType.ALL: TwelveDataTimeSeriesExtractor
-        }
-        
-        if asset_type not in extractor_map:
+        if asset_type not in _EXTRACTOR_CLASSES:
             raise ValueError(f"Unsupported asset type: {asset_type}")
         
-        extractor_class = extractor_map[asset_type]
-        logger.info(
-            f"Creating {asset_type.value} extractor",
-            asset_type=asset_type.value
-        )
-        
-        return extractor_class()
+        return _cached_extractor(asset_type, os.getenv("TWELVE_DATA_API_KEY", ""))
     
     @staticmethod
     def create_all_extractors() -> Dict[AssetType, Any]:
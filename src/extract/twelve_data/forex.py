@@ -8,7 +8,9 @@ import pandas as pd
 from .etfs_indices import TwelveDataETFExtractor, TwelveDataIndexExtractor
 
 from .time_series import TwelveDataTimeSeriesExtractor
+from .base import METADATA_CACHE_TTL
 from ...utils.logger import logger
+from ...utils.extract_cache import ttl_cached
 
 
 class TwelveDataForexExtractor(TwelveDataTimeSeriesExtractor):
@@ -29,6 +31,7 @@ class TwelveDataForexExtractor(TwelveDataTimeSeriesExtractor):
             "AUD/USD", "USD/CAD", "NZD/USD"
         ])
     
+    @ttl_cached(METADATA_CACHE_TTL)
     def get_forex_pairs(self) -> pd.DataFrame:
         """
         Get all available Forex pairs
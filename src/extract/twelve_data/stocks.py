@@ -6,7 +6,9 @@ from datetime import datetime, timedelta
 import pandas as pd
 
 from .time_series import TwelveDataTimeSeriesExtractor
+from .base import METADATA_CACHE_TTL
 from ...utils.logger import logger
+from ...utils.extract_cache import ttl_cached
 
 
 class TwelveDataStockExtractor(TwelveDataTimeSeriesExtractor):
@@ -27,6 +29,7 @@ class TwelveDataStockExtractor(TwelveDataTimeSeriesExtractor):
             "META", "NVDA", "JPM", "JNJ", "V"
         ])
     
+    @ttl_cached(METADATA_CACHE_TTL)
     def get_stocks_list(
         self,
         exchange: Optional[str] = None,
@@ -2,11 +2,13 @@
 
 # src/extract/twelve_data/time_series.py
 from typing import Dict, List, Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import pandas as pd
 
-from .base import TwelveDataExtractor, ExtractionError
+from .base import TIME_SERIES_INTERVALS, TwelveDataExtractor, ExtractionError
 from ...utils.logger import logger
+from ...utils.rate_limiter import TokenBucket
 
 
 class TwelveDataTimeSeriesExtractor(TwelveDataExtractor):
@@ -14,6 +16,9 @@ class TwelveDataTimeSeriesExtractor(TwelveDataExtractor):
     Extractor for time series data across all asset types
     """
     
+    # Shared by all instances so concurrent batches stay within the free tier (8 requests/min)
+    batch_rate_limit = TokenBucket(rate_per_min=8)
+    
     def __init__(self):
         """
         Initialize time series extractor
@@ -63,7 +68,7 @@ class TwelveDataTimeSeriesExtractor(TwelveDataExtractor):
         if not self.validate_symbol(symbol):
             raise ExtractionError(f"Invalid symbol: {symbol}")
         
-        if interval not in self.get_available_intervals():
+        if interval not in TIME_SERIES_INTERVALS:
             raise ExtractionError(f"Invalid interval: {interval}")
         
         # Prepare parameters
@@ -100,11 +105,11 @@ class TwelveDataTimeSeriesExtractor(TwelveDataExtractor):
             # Parse response
             df = self._parse_time_series_response(data)
             
-            # Add metadata columns
+            # Add metadata columns; the repeated labels are stored once as categoricals
             if asset_type:
-                df['asset_type'] = asset_type
-            df['symbol'] = symbol
-            df['interval'] = interval
+                df['asset_type'] = pd.Series(asset_type, index=df.index, dtype="category")
+            df['symbol'] = pd.Series(symbol, index=df.index, dtype="category")
+            df['interval'] = pd.Series(interval, index=df.index, dtype="category")
             df['extracted_at'] = datetime.now()
             
             logger.info(
@@ -132,21 +137,25 @@ class TwelveDataTimeSeriesExtractor(TwelveDataExtractor):
         symbols: List[str],
         interval: str = "1day",
         output_size: int = 1000,
-        delay: float = 1.0,
+        delay: Optional[float] = None,
+        max_workers: int = 4,
+        continue_on_error: bool = True,
         **kwargs
     ) -> Dict[str, pd.DataFrame]:
         """
-        Extract time series for multiple symbols
+        Extract time series for multiple symbols concurrently
         
         Args:
             symbols: List of symbols to extract
             interval: Time interval
             output_size: Number of data points per symbol
-            delay: Delay between requests in seconds
+            delay: Unused; requests are paced by the shared token bucket instead
+            max_workers: Maximum number of concurrent requests
+            continue_on_error: Return an empty DataFrame for failed symbols instead of raising
             **kwargs: Additional parameters for extract_time_series
             
         Returns:
-            Dictionary mapping symbol to DataFrame
+            Dictionary mapping symbol to DataFrame, in input order
         """
         logger.info(
             f"Starting batch time series extraction",
@@ -156,19 +165,24 @@ class TwelveDataTimeSeriesExtractor(TwelveDataExtractor):
         )
         
         def extract_single(symbol: str) -> pd.DataFrame:
-            return self.extract_time_series(
-                symbol=symbol,
-                interval=interval,
-                output_size=output_size,
-                **kwargs
-            )
+            self.batch_rate_limit.acquire()
+            try:
+                return self.extract_time_series(
+                    symbol=symbol,
+                    interval=interval,
+                    output_size=output_size,
+                    **kwargs
+                )
+            except Exception:
+                if not continue_on_error:
+                    raise
+                return pd.DataFrame()
         
-        results = self.extract_batch(
-            items=symbols,
-            extract_fn=extract_single,
-            delay=delay,
-            continue_on_error=True
-        )
+        if not symbols:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols)))) as pool:
+            results = dict(zip(symbols, pool.map(extract_single, symbols)))
         
         successful = sum(1 for df in results.values() if not df.empty)
         logger.info(
@@ -12,6 +12,16 @@ from ..utils.rate_limiter import RateLimitConfig, rate_limiter
 class WeatherExtractor(BaseExtractor):
     """Weather data extractor for OpenWeatherMap and other weather APIs"""
     
+    # Labels repeated on every row of multi-row responses
+    LABEL_COLUMNS = ["location", "forecast_type", "data_type", "units", "source"]
+    
+    # Settings attribute holding each source's API key
+    API_KEY_SETTINGS = {
+        "openweather": "openweather_api_key",
+        "weatherbit": "weatherbit_api_key",
+        "visualcrossing": "visualcrossing_api_key",
+    }
+    
     def __init__(self, source: str = "openweather"):
         """
         Initialize weather extractor
@@ -35,14 +45,9 @@ class WeatherExtractor(BaseExtractor):
         rate_limiter.register_source(self.source_name, rate_config)
         
         # Source-specific API key
-        if self.source == "openweather":
-            self.api_key_name = "openweather_api_key"
-        elif self.source == "weatherbit":
-            self.api_key_name = "weatherbit_api_key"
-        elif self.source == "visualcrossing":
-            self.api_key_name = "visualcrossing_api_key"
-        else:
+        if self.source not in self.API_KEY_SETTINGS:
             raise ValueError(f"Unsupported weather source: {source}")
+        self.api_key_name = self.API_KEY_SETTINGS[self.source]
     
     @property
     def api_key(self) -> str:
@@ -102,7 +107,7 @@ class WeatherExtractor(BaseExtractor):
         )
         
         response = self._make_request(endpoint, params)
-        data = response.json()
+        data = self._parse_json(response)
         
         if data.get("cod") != 200:
             logger.warning(
@@ -202,7 +207,7 @@ class WeatherExtractor(BaseExtractor):
         )
         
         response = self._make_request(endpoint, params)
-        data = response.json()
+        data = self._parse_json(response)
         
         if data.get("cod") != "200":
             logger.warning(
@@ -215,6 +220,7 @@ class WeatherExtractor(BaseExtractor):
         
         forecasts = []
         city_data = data.get("city", {})
+        extracted_at = datetime.utcnow()
         
         for forecast in data.get("list", []):
             forecast_data = {
@@ -223,7 +229,7 @@ class WeatherExtractor(BaseExtractor):
                 "longitude": city_data.get("coord", {}).get("lon"),
                 "country": city_data.get("country"),
                 "timezone": city_data.get("timezone"),
-                "timestamp": pd.to_datetime(forecast.get("dt"), unit='s', utc=True),
+                "timestamp": forecast.get("dt"),
                 "temperature": forecast.get("main", {}).get("temp"),
                 "feels_like": forecast.get("main", {}).get("feels_like"),
                 "temp_min": forecast.get("main", {}).get("temp_min"),
@@ -246,11 +252,12 @@ class WeatherExtractor(BaseExtractor):
                 "forecast_type": "3hour",
                 "units": units,
                 "source": self.source,
-                "extracted_at": datetime.utcnow()
+                "extracted_at": extracted_at
             }
             forecasts.append(forecast_data)
         
-        return pd.DataFrame(forecasts)
+        df = self._parse_epoch_columns(pd.DataFrame(forecasts), ["timestamp"])
+        return self._categorize(df, self.LABEL_COLUMNS)
     
     def extract_daily_forecast(
         self,
@@ -301,7 +308,7 @@ class WeatherExtractor(BaseExtractor):
         )
         
         response = self._make_request(endpoint, params)
-        data = response.json()
+        data = self._parse_json(response)
         
         if "daily" not in data:
             logger.warning(
@@ -313,17 +320,18 @@ class WeatherExtractor(BaseExtractor):
             return pd.DataFrame()
         
         daily_forecasts = []
+        extracted_at = datetime.utcnow()
         for day_forecast in data.get("daily", [])[:days]:  # Limit to requested days
             daily_data = {
                 "location": location,
                 "latitude": lat,
                 "longitude": lon,
-                "date": pd.to_datetime(day_forecast.get("dt"), unit='s', utc=True).date(),
-                "timestamp": pd.to_datetime(day_forecast.get("dt"), unit='s', utc=True),
-                "sunrise": pd.to_datetime(day_forecast.get("sunrise"), unit='s', utc=True) if day_forecast.get("sunrise") else None,
-                "sunset": pd.to_datetime(day_forecast.get("sunset"), unit='s', utc=True) if day_forecast.get("sunset") else None,
-                "moonrise": pd.to_datetime(day_forecast.get("moonrise"), unit='s', utc=True) if day_forecast.get("moonrise") else None,
-                "moonset": pd.to_datetime(day_forecast.get("moonset"), unit='s', utc=True) if day_forecast.get("moonset") else None,
+                "date": None,  # Filled from timestamp below
+                "timestamp": day_forecast.get("dt"),
+                "sunrise": day_forecast.get("sunrise"),
+                "sunset": day_forecast.get("sunset"),
+                "moonrise": day_forecast.get("moonrise"),
+                "moonset": day_forecast.get("moonset"),
                 "moon_phase": day_forecast.get("moon_phase"),
                 "temp_day": day_forecast.get("temp", {}).get("day"),
                 "temp_min": day_forecast.get("temp", {}).get("min"),
@@ -352,11 +360,17 @@ class WeatherExtractor(BaseExtractor):
                 "forecast_type": "daily",
                 "units": units,
                 "source": self.source,
-                "extracted_at": datetime.utcnow()
+                "extracted_at": extracted_at
             }
             daily_forecasts.append(daily_data)
         
-        return pd.DataFrame(daily_forecasts)
+        df = self._parse_epoch_columns(
+            pd.DataFrame(daily_forecasts),
+            ["timestamp", "sunrise", "sunset", "moonrise", "moonset"]
+        )
+        if not df.empty:
+            df["date"] = df["timestamp"].dt.date
+        return self._categorize(df, self.LABEL_COLUMNS)
     
     def extract_historical_weather(
         self,
@@ -457,7 +471,7 @@ class WeatherExtractor(BaseExtractor):
         }
         
         response = self._make_request(endpoint, params)
-        data = response.json()
+        data = self._parse_json(response)
         
         if "current" not in data:
             logger.warning(
@@ -469,11 +483,12 @@ class WeatherExtractor(BaseExtractor):
         
         historical_records = []
         current_data = data.get("current", {})
+        extracted_at = datetime.utcnow()
         
         historical_record = {
             "latitude": lat,
             "longitude": lon,
-            "timestamp": pd.to_datetime(current_data.get("dt"), unit='s', utc=True),
+            "timestamp": current_data.get("dt"),
             "temperature": current_data.get("temp"),
             "feels_like": current_data.get("feels_like"),
             "pressure": current_data.get("pressure"),
@@ -488,12 +503,12 @@ class WeatherExtractor(BaseExtractor):
             "weather_main": current_data.get("weather", [{}])[0].get("main") if current_data.get("weather") else None,
             "weather_description": current_data.get("weather", [{}])[0].get("description") if current_data.get("weather") else None,
             "weather_icon": current_data.get("weather", [{}])[0].get("icon") if current_data.get("weather") else None,
-            "sunrise": pd.to_datetime(data.get("sunrise"), unit='s', utc=True) if data.get("sunrise") else None,
-            "sunset": pd.to_datetime(data.get("sunset"), unit='s', utc=True) if data.get("sunset") else None,
+            "sunrise": data.get("sunrise"),
+            "sunset": data.get("sunset"),
             "data_type": "historical",
             "units": units,
             "source": self.source,
-            "extracted_at": datetime.utcnow()
+            "extracted_at": extracted_at
         }
         historical_records.append(historical_record)
         
@@ -502,7 +517,7 @@ class WeatherExtractor(BaseExtractor):
             hourly_record = {
                 "latitude": lat,
                 "longitude": lon,
-                "timestamp": pd.to_datetime(hour_data.get("dt"), unit='s', utc=True),
+                "timestamp": hour_data.get("dt"),
                 "temperature": hour_data.get("temp"),
                 "feels_like": hour_data.get("feels_like"),
                 "pressure": hour_data.get("pressure"),
@@ -523,11 +538,12 @@ class WeatherExtractor(BaseExtractor):
                 "data_type": "historical_hourly",
                 "units": units,
                 "source": self.source,
-                "extracted_at": datetime.utcnow()
+                "extracted_at": extracted_at
             }
             historical_records.append(hourly_record)
         
-        return pd.DataFrame(historical_records)
+        df = self._parse_epoch_columns(pd.DataFrame(historical_records), ["timestamp", "sunrise", "sunset"])
+        return self._categorize(df, self.LABEL_COLUMNS)
     
     def extract_air_pollution(
         self,
@@ -576,7 +592,7 @@ class WeatherExtractor(BaseExtractor):
         )
         
         response = self._make_request(endpoint, params)
-        data = response.json()
+        data = self._parse_json(response)
         
         if "list" not in data:
             logger.warning(
@@ -588,12 +604,13 @@ class WeatherExtractor(BaseExtractor):
             return pd.DataFrame()
         
         pollution_data = []
+        extracted_at = datetime.utcnow()
         for pollution_record in data.get("list", []):
             components = pollution_record.get("components", {})
             record = {
                 "latitude": lat,
                 "longitude": lon,
-                "timestamp": pd.to_datetime(pollution_record.get("dt"), unit='s', utc=True),
+                "timestamp": pollution_record.get("dt"),
                 "aqi": pollution_record.get("main", {}).get("aqi"),  # Air Quality Index
                 "co": components.get("co"),  # Carbon monoxide
                 "no": components.get("no"),  # Nitric oxide
@@ -604,11 +621,12 @@ class WeatherExtractor(BaseExtractor):
                 "pm10": components.get("pm10"),  # Coarse particles
                 "nh3": components.get("nh3"),  # Ammonia
                 "source": self.source,
-                "extracted_at": datetime.utcnow()
+                "extracted_at": extracted_at
             }
             pollution_data.append(record)
         
-        return pd.DataFrame(pollution_data)
+        df = self._parse_epoch_columns(pd.DataFrame(pollution_data), ["timestamp"])
+        return self._categorize(df, self.LABEL_COLUMNS)
     
     def _get_coordinates(self, location: str) -> Optional[Tuple[float, float]]:
         """
@@ -629,7 +647,7 @@ class WeatherExtractor(BaseExtractor):
         
         try:
             response = self._make_request(endpoint, params)
-            data = response.json()
+            data = self._parse_json(response)
             
             if data and len(data) > 0:
                 lat = data[0].get("lat")
@@ -1,9 +1,11 @@
 # src/load/supabase_loader.py
 import pandas as pd
-from typing import Dict, List, Optional, Any, Union
+import pyarrow.parquet as pq
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 from supabase import create_client, Client
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, stop_after_attempt, wait_random_exponential
 from ..utils.logger import logger
 from config.settings import settings
 from .data_models import BaseModel, PipelineMetadata
@@ -56,16 +58,17 @@ class SupabaseLoader:
         else:
             return serialize_value(data)
     
+    # Jittered backoff so concurrent pipelines that fail together do not retry in lockstep
     @retry(
         stop=stop_after_attempt(settings.max_retries),
-        wait=wait_exponential(multiplier=1, min=4, max=60)
+        wait=wait_random_exponential(multiplier=1, max=60)
     )
     def upsert_data(
         self,
         table_name: str,
         data: List[Dict[str, Any]],
         conflict_columns: List[str],
-        batch_size: int = None
+        batch_size: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Upsert data into Supabase table
@@ -145,6 +148,84 @@ class SupabaseLoader:
         
         return results
     
+    def _dataframe_to_records(
+        self,
+        df: pd.DataFrame,
+        data_model_class: BaseModel,
+        pipeline_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Convert DataFrame rows to data model dictionaries
+        
+        Args:
+            df: DataFrame to convert
+            data_model_class: Data model class
+            pipeline_id: Pipeline identifier, stored as the record source
+        
+        Returns:
+            List of record dictionaries; rows that fail conversion are skipped
+        """
+        records = []
+        loaded_at = datetime.utcnow()
+        for _, row in df.iterrows():
+            try:
+                # Map DataFrame row to data model
+                record_data = {}
+                for field in data_model_class.__dataclass_fields__.keys():
+                    if field in df.columns:
+                        record_data[field] = row[field]
+                
+                # Add metadata
+                record_data['created_at'] = loaded_at
+                record_data['updated_at'] = loaded_at
+                record_data['source'] = pipeline_id
+                
+                # Create data model instance
+                record = data_model_class(**record_data)
+                records.append(record.to_dict())
+                
+            except Exception as e:
+                logger.warning(
+                    f"Failed to convert row to data model",
+                    exc_info=True,
+                    extra={
+                        "row_index": _,
+                        "data_model": data_model_class.__name__
+                    }
+                )
+        
+        return records
+    
+    def _start_load_metadata(self, pipeline_id: str, run_id: str, record_count: int) -> PipelineMetadata:
+        """Create the pipeline metadata record for a load that is starting"""
+        return PipelineMetadata(
+            pipeline_id=pipeline_id,
+            run_id=run_id,
+            status="loading",
+            start_time=datetime.utcnow(),
+            records_processed=record_count
+        )
+    
+    def _finish_load_metadata(self, metadata: PipelineMetadata, load_results: Dict[str, Any]):
+        """Record the outcome of a finished load and save the metadata"""
+        metadata.status = "completed"
+        metadata.ended_at = datetime.utcnow()
+        metadata.records_processed = load_results["inserted"]
+        metadata.records_failed = load_results["failed"]
+        
+        if load_results["failed"] > 0:
+            metadata.error_message = f"Failed to load {load_results['failed']} records"
+            metadata.status = "partial_failure"
+        
+        self._save_pipeline_metadata(metadata)
+    
+    def _fail_load_metadata(self, metadata: PipelineMetadata, error: Exception):
+        """Record a load that raised and save the metadata"""
+        metadata.status = "failed"
+        metadata.ended_at = datetime.utcnow()
+        metadata.error_message = str(error)
+        self._save_pipeline_metadata(metadata)
+    
     def load_from_dataframe(
         self,
         df: pd.DataFrame,
@@ -172,43 +253,11 @@ class SupabaseLoader:
         )
         
         # Start pipeline metadata record
-        metadata = PipelineMetadata(
-            pipeline_id=pipeline_id,
-            run_id=run_id,
-            status="loading",
-            start_time=datetime.utcnow(),
-            records_processed=len(df)
-        )
+        metadata = self._start_load_metadata(pipeline_id, run_id, len(df))
         
         try:
             # Convert DataFrame to data model instances
-            records = []
-            for _, row in df.iterrows():
-                try:
-                    # Map DataFrame row to data model
-                    record_data = {}
-                    for field in data_model_class.__dataclass_fields__.keys():
-                        if field in df.columns:
-                            record_data[field] = row[field]
-                    
-                    # Add metadata
-                    record_data['created_at'] = datetime.utcnow()
-                    record_data['updated_at'] = datetime.utcnow()
-                    record_data['source'] = pipeline_id
-                    
-                    # Create data model instance
-                    record = data_model_class(**record_data)
-                    records.append(record.to_dict())
-                    
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to convert row to data model",
-                        exc_info=True,
-                        extra={
-                            "row_index": _,
-                            "data_model": data_model_class.__name__
-                        }
-                    )
+            records = self._dataframe_to_records(df, data_model_class, pipeline_id)
             
             # Get table name and conflict columns from Meta class
             table_name = data_model_class.Meta.table_name
@@ -222,17 +271,7 @@ class SupabaseLoader:
             )
             
             # Update pipeline metadata
-            metadata.status = "completed"
-            metadata.ended_at = datetime.utcnow()
-            metadata.records_processed = load_results["inserted"]
-            metadata.records_failed = load_results["failed"]
-            
-            if load_results["failed"] > 0:
-                metadata.error_message = f"Failed to load {load_results['failed']} records"
-                metadata.status = "partial_failure"
-            
-            # Save metadata
-            self._save_pipeline_metadata(metadata)
+            self._finish_load_metadata(metadata, load_results)
             
             return load_results
             
@@ -245,13 +284,117 @@ class SupabaseLoader:
             )
             
             # Update metadata with error
-            metadata.status = "failed"
-            metadata.ended_at = datetime.utcnow()
-            metadata.error_message = str(e)
-            self._save_pipeline_metadata(metadata)
+            self._fail_load_metadata(metadata, e)
             
             raise
     
+    def load_from_parquet(
+        self,
+        path: str,
+        data_model_class: BaseModel,
+        pipeline_id: str,
+        run_id: str,
+        batch_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Load a staged Parquet file one record batch at a time
+        
+        Only one batch is held in memory at once, so pipelines larger than
+        RAM can be staged to disk and loaded from there.
+        
+        Args:
+            path: Path to the Parquet file
+            data_model_class: Data model class
+            pipeline_id: Pipeline identifier
+            run_id: Run identifier
+            batch_size: Rows per batch, defaults to settings.batch_size
+        
+        Returns:
+            Load results aggregated over all batches
+        """
+        if batch_size is None:
+            batch_size = settings.batch_size
+        
+        parquet_file = pq.ParquetFile(path)
+        total_rows = parquet_file.metadata.num_rows
+        
+        logger.info(
+            f"Loading {total_rows} records from {path} using {data_model_class.__name__}",
+            data_model=data_model_class.__name__,
+            pipeline_id=pipeline_id,
+            run_id=run_id
+        )
+        
+        metadata = self._start_load_metadata(pipeline_id, run_id, total_rows)
+        
+        load_results = {
+            "total": 0,
+            "inserted": 0,
+            "updated": 0,
+            "failed": 0,
+            "errors": []
+        }
+        
+        try:
+            table_name = data_model_class.Meta.table_name
+            conflict_columns = data_model_class.Meta.unique_constraint
+            
+            for batch in parquet_file.iter_batches(batch_size=batch_size):
+                records = self._dataframe_to_records(batch.to_pandas(), data_model_class, pipeline_id)
+                batch_results = self.upsert_data(
+                    table_name=table_name,
+                    data=records,
+                    conflict_columns=conflict_columns,
+                    batch_size=batch_size
+                )
+                for key in ("total", "inserted", "updated", "failed"):
+                    load_results[key] += batch_results[key]
+                load_results["errors"].extend(batch_results["errors"])
+            
+            self._finish_load_metadata(metadata, load_results)
+            
+            return load_results
+            
+        except Exception as e:
+            logger.error(
+                f"Failed to load {path} using {data_model_class.__name__}",
+                exc_info=e,
+                pipeline_id=pipeline_id,
+                run_id=run_id
+            )
+            
+            self._fail_load_metadata(metadata, e)
+            
+            raise
+    
+    def load_many(
+        self,
+        jobs: List[Tuple[pd.DataFrame, BaseModel, str, str]],
+        max_workers: int = 4
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Load several DataFrames concurrently over the shared client
+        
+        Args:
+            jobs: (df, data_model_class, pipeline_id, run_id) tuples
+            max_workers: Maximum number of concurrent loads
+        
+        Returns:
+            Load results in job order; a job that failed yields the raised exception
+        """
+        def _load_one(job):
+            df, data_model_class, pipeline_id, run_id = job
+            try:
+                return self.load_from_dataframe(df, data_model_class, pipeline_id, run_id)
+            except Exception as e:
+                return e
+        
+        if not jobs:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as pool:
+            return list(pool.map(_load_one, jobs))
+    
     def _save_pipeline_metadata(self, metadata: PipelineMetadata):
         """Save pipeline metadata to database"""
         try:
@@ -233,10 +233,11 @@ class DataCleaner:
         
         # Check for anomalies using Z-score
         numeric_cols = df.select_dtypes(include=[np.number]).columns
+        anomaly_threshold = self.config["transformation"]["anomaly_zscore_threshold"]
         for col in numeric_cols:
-            if df[col].std() > 0:  # Avoid division by zero
-                z_scores = np.abs((df[col] - df[col].mean()) / df[col].std())
-                anomaly_threshold = self.config["transformation"]["anomaly_zscore_threshold"]
+            std = df[col].std()
+            if std > 0:  # Avoid division by zero
+                z_scores = np.abs((df[col] - df[col].mean()) / std)
                 anomalies = (z_scores > anomaly_threshold).sum()
                 
                 if anomalies > 0:
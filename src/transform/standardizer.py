@@ -346,19 +346,17 @@ class DataStandardizer:
             df_std['symbol'] = df_std['symbol'].str.replace(suffix, '', regex=False)
         
         # Apply symbol standardization mapping
-        def map_symbol(symbol):
-            return self.symbol_standardization.get(symbol, symbol)
-        
-        df_std['symbol'] = df_std['symbol'].apply(map_symbol)
+        df_std['symbol'] = (
+            df_std['symbol'].map(self.symbol_standardization).fillna(df_std['symbol'])
+        )
         
         # For cryptocurrencies, ensure standard format
         if data_type == 'crypto':
             # Remove dashes and slashes
-            df_std['symbol'] = df_std['symbol'].str.replace('-', '').str.replace('/', '')
+            symbols = df_std['symbol'].str.replace('-', '').str.replace('/', '')
             # Ensure ends with USDT for USD pairs
-            df_std['symbol'] = df_std['symbol'].apply(
-                lambda x: f"{x}USDT" if not x.endswith('USDT') and len(x) <= 6 else x
-            )
+            needs_quote = ~symbols.str.endswith('USDT') & (symbols.str.len() <= 6)
+            df_std['symbol'] = symbols.where(~needs_quote, symbols + 'USDT')
         
         # For forex, ensure no slashes
         elif data_type == 'forex':
@@ -376,21 +374,19 @@ class DataStandardizer:
         
         # Check for currency column
         if 'currency' in df_std.columns:
-            # Convert all currencies to default
-            def convert_to_usd(value, currency):
-                if pd.isna(value) or pd.isna(currency):
-                    return value
-                rate = self.currency_rates.get(str(currency).upper(), 1.0)
-                return value / rate if rate != 1.0 else value
+            # Convert all currencies to default; unknown or missing currencies keep a rate of 1
+            rates = (
+                df_std['currency'].astype(str).str.upper()
+                .map(self.currency_rates)
+                .fillna(1.0)
+                .where(df_std['currency'].notna(), 1.0)
+            )
             
             # Apply to all price columns
             price_cols = ['open', 'high', 'low', 'close', 'adj_close', 'value']
             for col in price_cols:
                 if col in df_std.columns:
-                    df_std[col] = df_std.apply(
-                        lambda row: convert_to_usd(row[col], row.get('currency')),
-                        axis=1
-                    )
+                    df_std[col] = df_std[col] / rates
             
             # Mark that we've converted to USD
             df_std['currency'] = self.default_currency
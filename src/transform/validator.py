@@ -222,7 +222,8 @@ class DataValidator:
         )
         
         summary = ValidationSummary()
-        df_validated = df.copy()
+        # Checks only read the frame; _filter_invalid_rows builds a new one when rows are dropped
+        df_validated = df
         
         # Get schema for data type
         schema = self.schemas.get(data_type, {})
@@ -626,12 +627,12 @@ class DataValidator:
         if 'timestamp' not in df.columns or len(df) < 2:
             return
         
-        # Sort by timestamp
-        df_sorted = df.sort_values('timestamp')
+        # Sort timestamps only; the other columns are not needed here
+        timestamps = df['timestamp'].sort_values()
         
         # Calculate expected frequency
-        if len(df_sorted) > 1:
-            time_diffs = df_sorted['timestamp'].diff().dropna()
+        if len(timestamps) > 1:
+            time_diffs = timestamps.diff().dropna()
             if not time_diffs.empty:
                 median_diff = time_diffs.median()
                 
@@ -664,7 +665,7 @@ class DataValidator:
         if df.empty:
             return df
         
-        df_filtered = df.copy()
+        df_filtered = df
         rows_before = len(df_filtered)
         
         # Identify critical validation failures
@@ -675,7 +676,7 @@ class DataValidator:
         ]
         
         if not critical_checks:
-            return df_filtered
+            return df_filtered.copy()
         
         # Apply filters based on critical checks
         mask = pd.Series(True, index=df_filtered.index)
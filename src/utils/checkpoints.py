@@ -0,0 +1,83 @@
+# src/utils/checkpoints.py
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+
+class CheckpointStore:
+    """
+    Last-extracted timestamp per (source, symbol, interval)
+
+    Backed by a SQLite table in WAL mode so concurrent pipelines can read
+    checkpoints while another one writes. Checkpoints only move forward:
+    an update older than the stored timestamp is ignored.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize the store, creating the database if needed
+
+        Args:
+            db_path: Path of the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints ("
+                " source TEXT NOT NULL,"
+                " symbol TEXT NOT NULL,"
+                " interval TEXT NOT NULL,"
+                " last_ts TEXT NOT NULL,"
+                " updated_at TEXT NOT NULL,"
+                " PRIMARY KEY (source, symbol, interval))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per call keeps the store safe to share across threads
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def get(self, source: str, symbol: str, interval: str = "") -> Optional[datetime]:
+        """
+        Get the last extracted timestamp
+
+        Args:
+            source: Data source name
+            symbol: Symbol or series identifier
+            interval: Bar interval, empty for sources without one
+
+        Returns:
+            Timestamp of the last extracted record, or None if never extracted
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT last_ts FROM checkpoints WHERE source = ? AND symbol = ? AND interval = ?",
+                (source, symbol, interval)
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def update(self, source: str, symbol: str, last_ts: datetime, interval: str = ""):
+        """
+        Advance the checkpoint to last_ts if it is newer than the stored one
+
+        Args:
+            source: Data source name
+            symbol: Symbol or series identifier
+            last_ts: Timestamp of the newest extracted record
+            interval: Bar interval, empty for sources without one
+        """
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO checkpoints (source, symbol, interval, last_ts, updated_at)"
+                " VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (source, symbol, interval) DO UPDATE SET"
+                " last_ts = excluded.last_ts, updated_at = excluded.updated_at"
+                " WHERE excluded.last_ts > checkpoints.last_ts",
+                (source, symbol, interval, last_ts.isoformat(), datetime.now().isoformat())
+            )
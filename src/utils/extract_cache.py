@@ -0,0 +1,200 @@
+# src/utils/extract_cache.py
+import os
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import timedelta
+from functools import wraps
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+from ..utils.logger import logger
+
+# Parquet writes run in the background so callers go straight on to their
+# next fetch; one worker keeps writes to the same path in submission order.
+# Pending writes are shared by all caches so any reader can wait for them.
+_disk_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="extract-cache-writer")
+_pending_writes: Dict[Path, Future] = {}
+_pending_lock = Lock()
+
+
+class ExtractCache:
+    """
+    Two-level cache of per-item pipeline results
+
+    Recent entries are kept in an in-memory LRU so repeated items within a
+    process are free; every entry is also written to Parquet on disk so
+    later runs (e.g. the midnight "all" job after the morning jobs) can
+    reuse it. Entries expire by age, using the file mtime on disk.
+    Without a cache_dir the cache is in-memory only, for short-lived data.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path],
+        ttl: timedelta = timedelta(hours=20),
+        max_memory_entries: int = 256
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            cache_dir: Root directory for Parquet entries, None to keep entries in memory only
+            ttl: Default maximum entry age
+            max_memory_entries: Maximum number of entries kept in memory
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        self._memory: "OrderedDict[Tuple, Tuple[float, pd.DataFrame]]" = OrderedDict()
+        self._lock = Lock()
+
+    def _path(self, key: Tuple[Hashable, ...]) -> Path:
+        """Map (source, item, *rest) to cache_dir/source/item/rest.parquet"""
+        source, item, *rest = (re.sub(r"[^A-Za-z0-9._-]", "_", str(part)) for part in key)
+        return self.cache_dir / source / item / f"{'_'.join(rest) or 'latest'}.parquet"
+
+    def _remember(self, key: Tuple[Hashable, ...], stored_at: float, df: pd.DataFrame):
+        with self._lock:
+            self._memory[key] = (stored_at, df)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def get(
+        self,
+        key: Tuple[Hashable, ...],
+        ttl: Optional[timedelta] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Get a cached DataFrame
+
+        Args:
+            key: (source, item, ...) tuple
+            ttl: Maximum entry age, defaults to the cache's ttl
+
+        Returns:
+            Cached DataFrame (treat as read-only), or None on a miss or expired entry
+        """
+        max_age = (ttl or self.ttl).total_seconds()
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and now - entry[0] <= max_age:
+                self._memory.move_to_end(key)
+                return entry[1]
+
+        if self.cache_dir is None:
+            return None
+
+        path = self._path(key)
+        with _pending_lock:
+            pending = _pending_writes.get(path)
+        if pending is not None:
+            pending.result()
+        try:
+            stored_at = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+        if now - stored_at > max_age:
+            return None
+
+        try:
+            df = pd.read_parquet(path)
+        except Exception as e:
+            logger.warning(f"Failed to read cache entry {path}", error=str(e))
+            return None
+
+        self._remember(key, stored_at, df)
+        return df
+
+    def put(self, key: Tuple[Hashable, ...], df: pd.DataFrame):
+        """
+        Store a DataFrame in memory and, with a cache_dir, on disk
+
+        The disk write happens in the background; reads of the same key
+        wait for it. Disk write failures are logged and otherwise ignored,
+        since the cache only ever saves work.
+
+        Args:
+            key: (source, item, ...) tuple
+            df: DataFrame to cache; it is shared with the cache, so do not modify it afterwards
+        """
+        self._remember(key, time.time(), df)
+        if self.cache_dir is None:
+            return
+
+        path = self._path(key)
+        future = _disk_writer.submit(self._write, path, df)
+        with _pending_lock:
+            _pending_writes[path] = future
+        future.add_done_callback(lambda done: _forget_write(path, done))
+
+    def _write(self, path: Path, df: pd.DataFrame):
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to write cache entry {path}", error=str(e))
+
+    def flush(self):
+        """Wait until every pending disk write has finished"""
+        with _pending_lock:
+            pending = list(_pending_writes.values())
+        wait(pending)
+
+
+def _forget_write(path: Path, future: Future):
+    with _pending_lock:
+        if _pending_writes.get(path) is future:
+            del _pending_writes[path]
+
+
+def ttl_cached(ttl: timedelta, cache: Optional[ExtractCache] = None) -> Callable:
+    """
+    Cache a DataFrame-returning extractor method for ``ttl``
+
+    Results are shared across instances and keyed by method name and
+    arguments, so listing endpoints are fetched at most once per ttl, in
+    this process or (via the on-disk layer) any later one.
+
+    Args:
+        ttl: Maximum age of a cached result
+        cache: Cache to use, defaults to one under settings.extract_cache_dir
+
+    Returns:
+        Method decorator
+    """
+    def decorator(method: Callable[..., pd.DataFrame]) -> Callable[..., pd.DataFrame]:
+        store = cache
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs) -> pd.DataFrame:
+            nonlocal store
+            if store is None:
+                from config.settings import settings
+                store = ExtractCache(settings.extract_cache_dir)
+
+            call_args = [repr(arg) for arg in args]
+            call_args += [f"{name}={value!r}" for name, value in sorted(kwargs.items())]
+            key = ("metadata", method.__qualname__, "-".join(call_args) or "latest")
+
+            cached = store.get(key, ttl=ttl)
+            if cached is not None:
+                return cached.copy()
+
+            df = method(self, *args, **kwargs)
+            store.put(key, df)
+            return df.copy()
+
+        return wrapper
+
+    return decorator
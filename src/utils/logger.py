@@ -48,9 +48,7 @@ class StructuredLogger:
         self.logger = logging.getLogger(name)
         
         # Set log level
-        settings_dict = settings.model_dump()
-        log_level = settings_dict.get("log_level", "INFO").upper()
-        self.logger.setLevel(getattr(logging, log_level))
+        self.logger.setLevel(getattr(logging, settings.log_level))
         # Remove existing handlers to avoid duplicates
         if self.logger.handlers:
             self.logger.handlers.clear()
@@ -15,62 +15,119 @@ class RateLimitConfig:
 
 
 class RateLimiter:
-    """Rate limiter for API calls"""
+    """Rate limiter for API calls, backed by one token bucket per source"""
     
     def __init__(self):
-        self.requests: Dict[str, list] = {}
-        self.locks: Dict[str, Lock] = {}
         self.configs: Dict[str, RateLimitConfig] = {}
+        self.buckets: Dict[str, "TokenBucket"] = {}
+        self._registry_lock = Lock()
     
     def register_source(self, source_name: str, config: RateLimitConfig):
-        """Register rate limit configuration for a source"""
-        self.configs[source_name] = config
-        self.requests[source_name] = []
-        self.locks[source_name] = Lock()
+        """
+        Register rate limit configuration for a source.
+        Idempotent: re-registering updates the rate but keeps the tokens already spent.
+        """
+        rate_per_min = config.max_requests * 60 / config.time_window
+        with self._registry_lock:
+            self.configs[source_name] = config
+            bucket = self.buckets.get(source_name)
+            if bucket is None:
+                self.buckets[source_name] = TokenBucket(rate_per_min, capacity=config.max_requests)
+            else:
+                with bucket.lock:
+                    bucket.rate = rate_per_min / 60.0
+                    bucket.capacity = config.max_requests
     
-    def wait_if_needed(self, source_name: str) -> bool:
+    def wait_if_needed(self, source_name: str, tokens: int = 1) -> bool:
         """
-        Check rate limit and wait if necessary.
+        Take tokens for a source, waiting only as long as needed for them.
+        Bursts up to the source's max_requests pass without waiting; batch paths
+        can reserve several requests at once so concurrent workers queue in order.
         Returns True if wait occurred, False otherwise.
         """
-        if source_name not in self.configs:
+        bucket = self.buckets.get(source_name)
+        if bucket is None:
             logger.warning(f"No rate limit config for {source_name}")
             return False
         
-        config = self.configs[source_name]
-        
-        with self.locks[source_name]:
-            current_time = time.time()
-            
-            # Remove old requests outside time window
-            window_start = current_time - config.time_window
-            self.requests[source_name] = [
-                req_time for req_time in self.requests[source_name]
-                if req_time > window_start
-            ]
-            
-            # Check if we've exceeded the limit
-            if len(self.requests[source_name]) >= config.max_requests:
-                wait_time = config.retry_delay
-                logger.warning(
-                    f"Rate limit exceeded for {source_name}. "
-                    f"Waiting {wait_time} seconds.",
-                    source=source_name,
-                    wait_time=wait_time
-                )
-                time.sleep(wait_time)
-                self.requests[source_name] = []  # Reset after waiting
-                return True
-            
-            # Record this request
-            self.requests[source_name].append(current_time)
+        wait_time = bucket.acquire(tokens)
+        if wait_time > 0:
+            logger.debug(
+                f"Rate limited {source_name} for {wait_time:.2f} seconds",
+                source=source_name,
+                wait_time=wait_time
+            )
+            return True
+        return False
+    
+    def throttle(self, source_name: str, retry_after: Optional[float] = None) -> bool:
+        """
+        Record that a source rejected a request (HTTP 429).
+        Empties its bucket so every caller waits for refill, or for retry_after
+        seconds when the server said how long to back off.
+        Returns True if the source has a bucket, False otherwise.
+        """
+        bucket = self.buckets.get(source_name)
+        if bucket is None:
             return False
+        
+        bucket.drain(retry_after)
+        logger.warning(
+            f"Rate limit exceeded for {source_name}",
+            source=source_name,
+            retry_after=retry_after
+        )
+        return True
     
     def reset(self, source_name: str):
-        """Reset rate limit counter for a source"""
-        if source_name in self.requests:
-            with self.locks[source_name]:
-                self.requests[source_name] = []
+        """Refill the token bucket for a source"""
+        bucket = self.buckets.get(source_name)
+        if bucket is not None:
+            with bucket.lock:
+                bucket.tokens = float(bucket.capacity)
+                bucket.updated_at = time.monotonic()
+
+
+class TokenBucket:
+    """Thread-safe token bucket that blocks only as long as needed for the next token"""
+    
+    def __init__(self, rate_per_min: float, capacity: Optional[int] = None):
+        self.rate = rate_per_min / 60.0  # tokens per second
+        self.capacity = capacity if capacity is not None else max(1, int(rate_per_min))
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.lock = Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+    
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        Take tokens, sleeping until they are available.
+        Returns the number of seconds waited.
+        """
+        with self.lock:
+            self._refill()
+            
+            # Reserve the tokens now so concurrent callers queue behind us
+            self.tokens -= tokens
+            wait_time = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+    
+    def drain(self, retry_after: Optional[float] = None):
+        """
+        Drop all available tokens, e.g. after the server rejected a request.
+        With retry_after, the next token only becomes available after that many seconds.
+        """
+        with self.lock:
+            self._refill()
+            floor = -retry_after * self.rate + 1 if retry_after else 0.0
+            self.tokens = min(self.tokens, floor)
 
 
 # Global rate limiter instance
@@ -0,0 +1,34 @@
+# tests/test_checkpoints.py
+from datetime import datetime
+
+from src.utils.checkpoints import CheckpointStore
+
+
+class TestCheckpointStore:
+    def test_get_returns_none_before_first_update(self, tmp_path):
+        """Test that an item that was never extracted has no checkpoint"""
+        store = CheckpointStore(tmp_path / "checkpoints.sqlite")
+
+        assert store.get("fred", "UNRATE") is None
+
+    def test_update_persists_across_instances(self, tmp_path):
+        """Test that a checkpoint is read back by a new store"""
+        db_path = tmp_path / "checkpoints.sqlite"
+        CheckpointStore(db_path).update("finnhub", "AAPL", datetime(2024, 1, 2, 15, 30), interval="D")
+
+        store = CheckpointStore(db_path)
+
+        assert store.get("finnhub", "AAPL", interval="D") == datetime(2024, 1, 2, 15, 30)
+        assert store.get("finnhub", "AAPL") is None
+
+    def test_update_never_moves_backwards(self, tmp_path):
+        """Test that an older timestamp does not overwrite a newer checkpoint"""
+        store = CheckpointStore(tmp_path / "checkpoints.sqlite")
+        store.update("fred", "UNRATE", datetime(2024, 3, 1))
+        store.update("fred", "UNRATE", datetime(2024, 1, 1))
+
+        assert store.get("fred", "UNRATE") == datetime(2024, 3, 1)
+
+        store.update("fred", "UNRATE", datetime(2024, 4, 1))
+
+        assert store.get("fred", "UNRATE") == datetime(2024, 4, 1)
@@ -0,0 +1,99 @@
+# tests/test_extract_cache.py
+import os
+import threading
+import time
+from datetime import timedelta
+
+import pandas as pd
+
+from src.utils.extract_cache import ExtractCache, ttl_cached
+
+
+class TestExtractCache:
+    def test_get_returns_none_on_miss(self, tmp_path):
+        """Test that an unknown key is a miss"""
+        cache = ExtractCache(tmp_path)
+
+        assert cache.get(("alpha_vantage", "AAPL", "2024-01-01")) is None
+
+    def test_put_persists_across_instances(self, tmp_path):
+        """Test that a stored frame is read back from disk by a new cache"""
+        df = pd.DataFrame({"symbol": ["AAPL", "AAPL"], "close": [150.0, 151.0]})
+        ExtractCache(tmp_path).put(("alpha_vantage", "AAPL", "2024-01-01"), df)
+
+        cached = ExtractCache(tmp_path).get(("alpha_vantage", "AAPL", "2024-01-01"))
+
+        pd.testing.assert_frame_equal(cached, df)
+        assert (tmp_path / "alpha_vantage" / "AAPL" / "2024-01-01.parquet").exists()
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        """Test that entries older than the ttl are ignored"""
+        key = ("openweather", "New York", "2024-01-01")
+        writer = ExtractCache(tmp_path)
+        writer.put(key, pd.DataFrame({"temperature": [21.5]}))
+        writer.flush()
+        path = tmp_path / "openweather" / "New_York" / "2024-01-01.parquet"
+        stale = time.time() - timedelta(hours=2).total_seconds()
+        os.utime(path, (stale, stale))
+
+        cache = ExtractCache(tmp_path, ttl=timedelta(hours=1))
+
+        assert cache.get(key) is None
+        assert cache.get(key, ttl=timedelta(hours=3)) is not None
+
+
+    def test_put_writes_to_disk_in_background(self, tmp_path, monkeypatch):
+        """Test that put returns before the Parquet write finishes and flush waits for it"""
+        release = threading.Event()
+        write = ExtractCache._write
+
+        def slow_write(self, path, df):
+            release.wait(5)
+            write(self, path, df)
+
+        monkeypatch.setattr(ExtractCache, "_write", slow_write)
+        cache = ExtractCache(tmp_path)
+        cache.put(("finnhub", "AAPL", "D"), pd.DataFrame({"close": [1.0]}))
+        path = tmp_path / "finnhub" / "AAPL" / "D.parquet"
+
+        assert not path.exists()
+        release.set()
+        cache.flush()
+        assert path.exists()
+
+
+class TestTtlCached:
+    def test_repeated_calls_fetch_once(self, tmp_path):
+        """Test that a cached listing is reused across instances and arguments are part of the key"""
+        calls = []
+
+        class Lister:
+            @ttl_cached(timedelta(days=1), cache=ExtractCache(tmp_path))
+            def get_stocks_list(self, country=None):
+                calls.append(country)
+                return pd.DataFrame({"symbol": ["AAPL"], "country": [country]})
+
+        first = Lister().get_stocks_list(country="US")
+        first["symbol"] = "MUTATED"
+        second = Lister().get_stocks_list(country="US")
+        Lister().get_stocks_list(country="UK")
+
+        assert calls == ["US", "UK"]
+        assert second["symbol"].tolist() == ["AAPL"]
+
+    def test_memory_only_cache_writes_nothing(self, tmp_path, monkeypatch):
+        """Test that a cache without a directory serves hits from memory and never touches disk"""
+        monkeypatch.chdir(tmp_path)
+        calls = []
+
+        class Quoter:
+            @ttl_cached(timedelta(seconds=5), cache=ExtractCache(None))
+            def get_quote(self, symbol):
+                calls.append(symbol)
+                return pd.DataFrame({"symbol": [symbol]})
+
+        Quoter().get_quote("AAPL")
+        Quoter().get_quote("AAPL")
+
+        assert calls == ["AAPL"]
+        assert list(tmp_path.iterdir()) == []
@@ -27,13 +27,22 @@ class TestFinnhubExtractor:
             }
         }
         
+        # Concrete test double: BaseExtractor leaves get_metadata abstract and does not load config
+        class ConcreteFinnhubExtractor(FinnhubExtractor):
+            config = mock_config
+            
+            def get_metadata(self):
+                return {}
+        
         with patch('src.extract.finnhub.settings') as mock_settings:
             mock_settings.finnhub_api_key = "test_finnhub_key"
             mock_settings.load_config.return_value = mock_config["sources"]
             
-            with patch('src.extract.finnhub.rate_limiter'):
-                extractor = FinnhubExtractor()
-                return extractor
+            # Every test makes fresh requests instead of reading another test's cached result
+            with patch('src.extract.finnhub.rate_limiter'), \
+                    patch('src.utils.extract_cache.ExtractCache.get', return_value=None), \
+                    patch('src.utils.extract_cache.ExtractCache.put'):
+                yield ConcreteFinnhubExtractor()
     
     def test_extract_stock_quote_success(self, extractor):
         """Test successful stock quote extraction"""
@@ -239,6 +248,60 @@ class TestFinnhubExtractor:
             assert 'to' in params
             assert params['symbol'] == 'AAPL'
     
+    def test_extract_stock_candles_batch(self, extractor):
+        """Test candle extraction for multiple symbols with one failing"""
+        with patch.object(extractor, 'extract_stock_candles') as mock_extract, \
+                patch('src.extract.finnhub.rate_limiter') as mock_limiter:
+            def side_effect(symbol, *args, **kwargs):
+                if symbol == 'INVALID':
+                    raise Exception("API Error")
+                return pd.DataFrame([{'symbol': symbol, 'close': 150.0}])
+            
+            mock_extract.side_effect = side_effect
+            
+            result = extractor.extract_stock_candles_batch(['AAPL', 'INVALID', 'MSFT'])
+            
+            assert isinstance(result, pd.DataFrame)
+            assert list(result['symbol']) == ['AAPL', 'MSFT']
+            assert list(result.index) == [0, 1]
+            assert sorted(call.args[0] for call in mock_extract.call_args_list) == ['AAPL', 'INVALID', 'MSFT']
+            assert mock_limiter.wait_if_needed.call_count == 3
+            mock_limiter.wait_if_needed.assert_called_with('finnhub')
+    
+    def test_extract_stock_quote_batch(self, extractor):
+        """Test quote extraction for multiple symbols with one returning nothing"""
+        with patch.object(extractor, 'extract_stock_quote') as mock_extract, \
+                patch('src.extract.finnhub.rate_limiter') as mock_limiter:
+            mock_extract.side_effect = lambda symbol: (
+                pd.DataFrame() if symbol == 'INVALID'
+                else pd.DataFrame([{'symbol': symbol, 'current_price': 150.0}])
+            )
+            
+            result = extractor.extract_stock_quote_batch(['AAPL', 'INVALID', 'MSFT'])
+            
+            assert list(result['symbol']) == ['AAPL', 'MSFT']
+            assert list(result['current_price']) == [150.0, 150.0]
+            assert sorted(call.args[0] for call in mock_extract.call_args_list) == ['AAPL', 'INVALID', 'MSFT']
+            assert mock_limiter.wait_if_needed.call_count == 3
+    
+    def test_extract_company_profile_batch(self, extractor):
+        """Test profile extraction for multiple symbols through the shared batch path"""
+        with patch.object(extractor, '_make_request') as mock_request, \
+                patch('src.extract.finnhub.rate_limiter') as mock_limiter:
+            def side_effect(endpoint, params):
+                response = Mock()
+                response.json.return_value = {'name': f"{params['symbol']} Inc.", 'ipo': '1980-12-12'}
+                return response
+            
+            mock_request.side_effect = side_effect
+            
+            result = extractor.extract_company_profile_batch(['AAPL', 'MSFT'])
+            
+            assert list(result['symbol']) == ['AAPL', 'MSFT']
+            assert list(result['company_name']) == ['AAPL Inc.', 'MSFT Inc.']
+            assert mock_request.call_count == 2
+            assert mock_limiter.wait_if_needed.call_count == 2
+    
     def test_extract_market_news_success(self, extractor):
         """Test successful market news extraction"""
         mock_response = [
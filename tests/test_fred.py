@@ -1,6 +1,9 @@
 # tests/test_fred.py
 import pytest
 from unittest.mock import Mock, patch, MagicMock
+import io
+import json
+import requests
 from src.extract.fred import FREDExtractor
 from datetime import datetime, timedelta
 import pandas as pd
@@ -25,13 +28,22 @@ class TestFREDExtractor:
             }
         }
         
+        # Concrete test double: BaseExtractor leaves extract and get_metadata abstract and does not load config
+        class ConcreteFREDExtractor(FREDExtractor):
+            config = mock_config
+            
+            def extract(self, *args, **kwargs):
+                return pd.DataFrame()
+            
+            def get_metadata(self):
+                return {}
+        
         with patch('src.extract.fred.settings') as mock_settings:
             mock_settings.fred_api_key = "test_fred_key"
             mock_settings.load_config.return_value = mock_config["sources"]
             
             with patch('src.extract.fred.rate_limiter'):
-                extractor = FREDExtractor()
-                return extractor
+                yield ConcreteFREDExtractor()
     
     def test_extract_series_success(self, extractor):
         """Test successful series extraction"""
@@ -462,6 +474,48 @@ class TestFREDExtractor:
             
             assert params['file_type'] == 'json'
 
+    
+    def _streamed_observations(self, extractor, observations):
+        """Run extract_series over a real streamed response for the given observations"""
+        response = requests.Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(json.dumps({'observations': observations}).encode())
+        extractor.session = Mock()
+        extractor.session.get.return_value = response
+        
+        result = extractor.extract_series('GDP')
+        
+        call_args = extractor.session.get.call_args
+        assert call_args.kwargs['stream'] is True
+        assert call_args.kwargs['params']['file_type'] == 'json'
+        return result
+    
+    def test_extract_series_streams_observations_with_ijson(self, extractor):
+        """Test that streamed observations are parsed incrementally without decoding the whole body"""
+        pytest.importorskip("ijson")
+        observations = [
+            {'date': '2024-01-01', 'value': '150.5', 'realtime_start': '2024-01-02', 'realtime_end': '2024-01-09'},
+            {'date': '2024-02-01', 'value': '.', 'realtime_start': '2024-02-02', 'realtime_end': '2024-02-09'},
+            {'date': '2024-03-01', 'value': '151.2', 'realtime_start': '2024-03-02', 'realtime_end': '2024-03-09'}
+        ]
+        
+        with patch.object(extractor, '_parse_json', side_effect=AssertionError("body decoded whole")):
+            result = self._streamed_observations(extractor, observations)
+        
+        assert list(result['value']) == [150.5, 151.2]
+        assert list(result['date']) == [pd.Timestamp('2024-01-01'), pd.Timestamp('2024-03-01')]
+    
+    def test_extract_series_streams_observations_without_ijson(self, extractor):
+        """Test that streamed observations fall back to decoding the whole body"""
+        observations = [
+            {'date': '2024-01-01', 'value': '150.5', 'realtime_start': '2024-01-02', 'realtime_end': '2024-01-09'}
+        ]
+        
+        with patch('src.extract.base_extractor.ijson', None):
+            result = self._streamed_observations(extractor, observations)
+        
+        assert list(result['value']) == [150.5]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
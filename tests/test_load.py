@@ -436,6 +436,85 @@ class TestSupabaseLoaderFromDataFrame:
         assert results["inserted"] == 1
 
 
+class TestSupabaseLoaderLoadMany:
+    """Test batched loading of several DataFrames"""
+    
+    def test_load_many_returns_results_in_job_order(self, supabase_loader):
+        """Test that each job's result is returned in the order submitted"""
+        df_a = pd.DataFrame({'symbol': ['AAPL']})
+        df_b = pd.DataFrame({'symbol': ['MSFT', 'GOOGL']})
+        
+        with patch.object(
+            supabase_loader, 'load_from_dataframe',
+            side_effect=lambda df, *args: {"total": len(df)}
+        ):
+            results = supabase_loader.load_many([
+                (df_a, StockPrice, "stock_etl", "run_001"),
+                (df_b, StockPrice, "finnhub_etl", "run_001")
+            ])
+        
+        assert results == [{"total": 1}, {"total": 2}]
+    
+    def test_load_many_captures_failures(self, supabase_loader):
+        """Test that a failing job yields its exception without aborting the others"""
+        df = pd.DataFrame({'symbol': ['AAPL']})
+        error = Exception("Upsert failed")
+        
+        def load(df, data_model_class, pipeline_id, run_id):
+            if pipeline_id == "bad_etl":
+                raise error
+            return {"total": len(df)}
+        
+        with patch.object(supabase_loader, 'load_from_dataframe', side_effect=load):
+            results = supabase_loader.load_many([
+                (df, StockPrice, "bad_etl", "run_001"),
+                (df, StockPrice, "stock_etl", "run_001")
+            ])
+        
+        assert results[0] is error
+        assert results[1] == {"total": 1}
+    
+    def test_load_many_empty(self, supabase_loader):
+        """Test that no jobs produce no results"""
+        assert supabase_loader.load_many([]) == []
+
+
+class TestSupabaseLoaderFromParquet:
+    """Test loading a staged Parquet file"""
+    
+    def test_load_from_parquet_streams_batches(self, supabase_loader, mock_supabase_client, tmp_path):
+        """Test that each record batch is upserted and results are aggregated"""
+        path = tmp_path / "stg_stock_etl.parquet"
+        pd.DataFrame({
+            'symbol': ['AAPL', 'GOOGL', 'MSFT'],
+            'date': [datetime(2024, 1, 1), datetime(2024, 1, 2), datetime(2024, 1, 3)],
+            'open': [150.0, 140.0, 380.0],
+            'high': [160.0, 145.0, 390.0],
+            'low': [140.0, 135.0, 370.0],
+            'close': [155.0, 142.0, 385.0],
+            'volume': [1000000, 900000, 800000]
+        }).to_parquet(path, index=False)
+        
+        mock_table = MagicMock()
+        mock_table.upsert.return_value.execute.side_effect = [
+            MagicMock(data=[{"id": 1}, {"id": 2}]),
+            MagicMock(data=[{"id": 3}])
+        ]
+        mock_supabase_client.table.return_value = mock_table
+        
+        results = supabase_loader.load_from_parquet(
+            path=str(path),
+            data_model_class=StockPrice,
+            pipeline_id="stock_etl",
+            run_id="run_001",
+            batch_size=2
+        )
+        
+        assert results["total"] == 3
+        assert results["inserted"] == 3
+        assert mock_table.upsert.call_count == 2
+
+
 class TestSupabaseLoaderMetadata:
     """Test pipeline metadata functionality"""
     
@@ -97,8 +97,8 @@ def test_mock_api_call():
         ]
     }
     
-    # Mock the requests.get call
-    with patch('requests.get') as mock_get:
+    # Mock the session's get call
+    with patch.object(extractor.session, 'get') as mock_get:
         # Setup mock response
         mock_response_obj = MagicMock()
         mock_response_obj.status_code = 200
@@ -135,7 +135,7 @@ def test_error_handling():
     extractor = PolygonFreeExtractor(api_key="test_key")
     
     # Test 429 rate limit response
-    with patch('requests.get') as mock_get:
+    with patch.object(extractor.session, 'get') as mock_get:
         mock_response = MagicMock()
         mock_response.status_code = 429
         mock_get.return_value = mock_response
@@ -153,7 +153,7 @@ def test_error_handling():
                 print("✓ Rate limit (429) handling works")
     
     # Test timeout handling
-    with patch('requests.get', side_effect=Exception("Timeout")):
+    with patch.object(extractor.session, 'get', side_effect=Exception("Timeout")):
         with patch.object(extractor, '_rate_limit_check'):
             try:
                 extractor._get("/test", {}, max_retries=1)
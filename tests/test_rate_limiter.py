@@ -0,0 +1,80 @@
+# tests/test_rate_limiter.py
+import pytest
+from unittest.mock import patch
+
+from src.utils.rate_limiter import RateLimitConfig, RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    def test_acquire_within_capacity_does_not_wait(self):
+        """Test that a full bucket hands out tokens immediately"""
+        bucket = TokenBucket(rate_per_min=5)
+
+        with patch("src.utils.rate_limiter.time.sleep") as mock_sleep:
+            waits = [bucket.acquire() for _ in range(5)]
+
+        assert waits == [0.0] * 5
+        mock_sleep.assert_not_called()
+
+    def test_acquire_waits_for_next_token_when_empty(self):
+        """Test that an empty bucket sleeps only until the next token refills"""
+        bucket = TokenBucket(rate_per_min=60, capacity=1)
+
+        with patch("src.utils.rate_limiter.time.monotonic", return_value=100.0), \
+             patch("src.utils.rate_limiter.time.sleep") as mock_sleep:
+            bucket.updated_at = 100.0
+            assert bucket.acquire() == 0.0
+            wait_time = bucket.acquire()
+
+        assert wait_time == pytest.approx(1.0)
+        mock_sleep.assert_called_once_with(wait_time)
+
+    def test_acquire_many_reserves_all_tokens(self):
+        """Test that reserving several tokens waits until all of them have refilled"""
+        bucket = TokenBucket(rate_per_min=60, capacity=2)
+
+        with patch("src.utils.rate_limiter.time.monotonic", return_value=100.0), \
+             patch("src.utils.rate_limiter.time.sleep"):
+            bucket.updated_at = 100.0
+            wait_time = bucket.acquire(5)
+
+        assert wait_time == pytest.approx(3.0)
+
+    def test_drain_waits_for_retry_after(self):
+        """Test that a drained bucket holds the next token back for retry_after seconds"""
+        bucket = TokenBucket(rate_per_min=60, capacity=10)
+
+        with patch("src.utils.rate_limiter.time.monotonic", return_value=100.0), \
+             patch("src.utils.rate_limiter.time.sleep"):
+            bucket.updated_at = 100.0
+            bucket.drain(retry_after=7)
+            wait_time = bucket.acquire()
+
+        assert wait_time == pytest.approx(7.0)
+
+
+class TestRateLimiter:
+    def test_register_source_keeps_request_history(self):
+        """Test that registering a source again does not refill its bucket"""
+        limiter = RateLimiter()
+        limiter.register_source("finnhub", RateLimitConfig(max_requests=2, time_window=60))
+        limiter.wait_if_needed("finnhub")
+        bucket = limiter.buckets["finnhub"]
+
+        limiter.register_source("finnhub", RateLimitConfig(max_requests=5, time_window=60))
+
+        assert limiter.buckets["finnhub"] is bucket
+        assert bucket.tokens == pytest.approx(1.0, abs=0.01)
+        assert bucket.capacity == 5
+        assert limiter.configs["finnhub"].max_requests == 5
+
+    def test_wait_if_needed_allows_burst_up_to_max_requests(self):
+        """Test that a burst within max_requests never sleeps"""
+        limiter = RateLimiter()
+        limiter.register_source("fred", RateLimitConfig(max_requests=3, time_window=60))
+
+        with patch("src.utils.rate_limiter.time.sleep") as mock_sleep:
+            waited = [limiter.wait_if_needed("fred") for _ in range(3)]
+
+        assert waited == [False, False, False]
+        mock_sleep.assert_not_called()
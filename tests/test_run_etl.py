@@ -0,0 +1,135 @@
+# tests/test_run_etl.py
+import os
+from datetime import timedelta
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from run_etl import _concat_columnwise, combine_frames, run_pipeline
+
+
+def _frame(symbol, closes, categories=("D",)):
+    return pd.DataFrame({
+        "symbol": [symbol] * len(closes),
+        "close": closes,
+        "volume": pd.array(list(range(len(closes))), dtype="Int64"),
+        "timestamp": pd.date_range("2024-01-01", periods=len(closes), tz="UTC"),
+        "resolution": pd.Categorical(["D"] * len(closes), categories=list(categories)),
+    })
+
+
+class TestCombineFrames:
+    def test_columnwise_concat_keeps_extension_and_categorical_dtypes(self):
+        """Test that nullable, tz-aware and categorical columns match pd.concat"""
+        frames = [_frame("AAPL", [1.0, 2.0]), _frame("MSFT", [3.0])]
+        expected = pd.concat(frames, ignore_index=True)
+
+        combined = _concat_columnwise(frames)
+
+        pd.testing.assert_frame_equal(combined, expected)
+        assert combined["volume"].dtype == "Int64"
+        assert str(combined["timestamp"].dtype) == "datetime64[ns, UTC]"
+        assert isinstance(combined["resolution"].dtype, pd.CategoricalDtype)
+
+    def test_columnwise_concat_defers_on_differing_categories(self):
+        """Test that categoricals with different categories fall back to pd.concat"""
+        frames = [_frame("AAPL", [1.0]), _frame("MSFT", [2.0], categories=("D", "W"))]
+
+        assert _concat_columnwise(frames) is None
+
+    def test_combine_frames_stores_identifiers_as_categoricals(self):
+        """Test that the combined frame has a fresh index and categorical identifiers"""
+        frames = [_frame("AAPL", [1.0, 2.0]), _frame("MSFT", [3.0])]
+
+        combined = combine_frames(frames)
+
+        assert frames == []
+        assert list(combined.index) == [0, 1, 2]
+        assert list(combined["symbol"]) == ["AAPL", "AAPL", "MSFT"]
+        assert isinstance(combined["symbol"].dtype, pd.CategoricalDtype)
+        assert list(combined["close"]) == [1.0, 2.0, 3.0]
+
+
+def _run_staged(frames, cache_ttl=None):
+    """Run a staged pipeline over per-item frames with pass-through transforms"""
+    cleaner = Mock()
+    cleaner.clean_dataframe.side_effect = lambda df, *args: df
+    standardizer = Mock()
+    standardizer.standardize_dataframe.side_effect = lambda df, *args: df
+    validator = Mock()
+    validator.validate_dataframe.side_effect = lambda df, *args: (df, Mock(is_valid=Mock(return_value=True)))
+    
+    loaded = {}
+    
+    def load_from_parquet(path, **kwargs):
+        loaded["parquet"] = pq.read_table(path).to_pandas()
+        loaded["path"] = path
+        return {"total": len(loaded["parquet"])}
+    
+    def load_from_dataframe(df, **kwargs):
+        loaded["dataframe"] = df
+        return {"total": len(df)}
+    
+    loader = Mock()
+    loader.load_from_parquet.side_effect = load_from_parquet
+    loader.load_from_dataframe.side_effect = load_from_dataframe
+    
+    with patch("run_etl.PARQUET_STAGING_MIN_ITEMS", 2), patch("run_etl.save_checkpoints"):
+        result = run_pipeline(
+            pipeline_name="Test",
+            extractor=None,
+            items=list(frames),
+            extract_method=frames.__getitem__,
+            cleaner=cleaner,
+            standardizer=standardizer,
+            validator=validator,
+            loader=loader,
+            data_model_class=object,
+            schema={},
+            source_type="stock",
+            source_name="test",
+            cache_ttl=cache_ttl
+        )
+    return result, loaded
+
+
+class TestRunPipelineStaging:
+    def test_large_pipelines_are_loaded_from_a_staging_file(self):
+        """Test that every item is staged to Parquet and the file is removed afterwards"""
+        frames = {"AAPL": _frame("AAPL", [1.0, 2.0]), "MSFT": _frame("MSFT", [3.0])}
+        
+        result, loaded = _run_staged(frames)
+        
+        assert result is True
+        assert "dataframe" not in loaded
+        assert list(loaded["parquet"]["symbol"]) == ["AAPL", "AAPL", "MSFT"]
+        assert list(loaded["parquet"]["close"]) == [1.0, 2.0, 3.0]
+        assert not os.path.exists(loaded["path"])
+    
+    def test_schema_mismatch_falls_back_to_memory_without_dropping_rows(self):
+        """Test that a frame the staging schema cannot hold moves the run in memory"""
+        first = _frame("AAPL", [1.0, 2.0]).assign(note=None)
+        second = _frame("MSFT", [3.0]).assign(note="split")
+        frames = {"AAPL": first, "MSFT": second}
+        
+        result, loaded = _run_staged(frames)
+        
+        assert result is True
+        assert "parquet" not in loaded
+        assert list(loaded["dataframe"]["symbol"]) == ["AAPL", "AAPL", "MSFT"]
+        assert list(loaded["dataframe"]["note"]) == [None, None, "split"]
+    
+    def test_schema_mismatch_on_cached_items_falls_back_to_memory(self):
+        """Test that cached and fresh frames with differing schemas are all loaded"""
+        cached = _frame("AAPL", [1.0]).assign(note=None)
+        fresh = _frame("MSFT", [2.0]).assign(note="split")
+        cache = Mock()
+        cache.get.side_effect = lambda key, ttl: cached if key[1] == "AAPL" else None
+        
+        with patch("run_etl._extract_cache", return_value=cache):
+            result, loaded = _run_staged({"AAPL": cached, "MSFT": fresh}, cache_ttl=timedelta(hours=1))
+        
+        assert result is True
+        assert list(loaded["dataframe"]["symbol"]) == ["AAPL", "MSFT"]
+        assert list(loaded["dataframe"]["note"]) == [None, "split"]
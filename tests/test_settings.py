@@ -0,0 +1,60 @@
+# tests/test_settings.py
+import os
+import pytest
+from config.settings import settings, clear_config_cache
+
+
+class TestLoadConfig:
+    @pytest.fixture
+    def config_dir(self, tmp_path, monkeypatch):
+        """Point settings at a temporary config directory"""
+        monkeypatch.setattr(settings, "config_dir", tmp_path)
+        clear_config_cache()
+        yield tmp_path
+        clear_config_cache()
+
+    def test_load_config_parses_yaml(self, config_dir):
+        """Test that a YAML config file is parsed into a dict"""
+        (config_dir / "sample.yaml").write_text("sources:\n  finnhub:\n    rate_limit: 60\n")
+
+        config = settings.load_config("sample")
+
+        assert config == {"sources": {"finnhub": {"rate_limit": 60}}}
+
+    def test_load_config_is_memoized(self, config_dir):
+        """Test that repeated loads of an unchanged file reuse the parsed result"""
+        (config_dir / "sample.yaml").write_text("value: 1\n")
+
+        first = settings.load_config("sample")
+        second = settings.load_config("sample")
+
+        assert first is second
+
+    def test_load_config_is_read_only(self, config_dir):
+        """Test that callers cannot modify the shared cached config"""
+        (config_dir / "sample.yaml").write_text("sources:\n  fred:\n    indicators: [UNRATE]\n")
+
+        config = settings.load_config("sample")
+
+        with pytest.raises(TypeError):
+            config["sources"]["fred"]["rate_limit"] = 1
+        with pytest.raises(AttributeError):
+            config["sources"]["fred"]["indicators"].append("GDP")
+        assert settings.load_config("sample") == {"sources": {"fred": {"indicators": ("UNRATE",)}}}
+
+    def test_load_config_reloads_on_mtime_change(self, config_dir):
+        """Test that editing the file invalidates the cached result"""
+        config_file = config_dir / "sample.yaml"
+        config_file.write_text("value: 1\n")
+        assert settings.load_config("sample") == {"value": 1}
+
+        config_file.write_text("value: 2\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert settings.load_config("sample") == {"value": 2}
+
+    def test_load_config_missing_file(self, config_dir):
+        """Test that a missing config file raises FileNotFoundError"""
+        with pytest.raises(FileNotFoundError):
+            settings.load_config("does_not_exist")